@@ -0,0 +1,86 @@
+"""Measure the time taken to cancel a background search, in the midgame, in the
+endgame solver and in the Monte Carlo tree search.
+
+Usage:
+    python -m benchmarks.async_think
+"""
+import time
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS
+from othellia.async_think import start_think
+from othellia.bitboard import BitboardGame
+from othellia.mcts import MonteCarloTreeSearch
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.transcripts import TRANSCRIPTS
+
+# Seconds the searches run before being cancelled
+CANCEL_DELAYS = (0.05, 0.2, 0.5)
+
+# Moves played before the endgame positions, solved from 28 empty cells
+ENDGAME_MOVE_COUNT = 36
+ENDGAME_EMPTIES = 28
+
+
+def measure_cancel(game: BitboardGame, engine: str) -> list[float]:
+    """Start searches of the game and return the seconds taken to cancel them.
+
+    Args:
+        game (BitboardGame): a game, which is not over.
+        engine (str): "minimax", "endgame" or "mcts".
+
+    Returns:
+        list[float]: seconds taken by each cancellation.
+    """
+    latencies = []
+
+    for delay in CANCEL_DELAYS:
+        match engine:
+            case "mcts":
+                handle = start_think(
+                    game, engine=MonteCarloTreeSearch().search, time_budget=60
+                )
+            case _:
+                handle = start_think(
+                    game,
+                    60,
+                    StaticEvaluation.evaluate,
+                    TranspositionTable(),
+                    60,
+                    endgame_empties=ENDGAME_EMPTIES if engine == "endgame" else None,
+                )
+        time.sleep(delay)
+
+        start = time.perf_counter()
+        handle.cancel()
+        latencies.append(time.perf_counter() - start)
+
+    return latencies
+
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+
+    midgames = [BitboardGame() for _ in POSITIONS]
+    for midgame, transcript in zip(midgames, POSITIONS):
+        midgame.load_transcript(transcript)
+
+    endgames = [BitboardGame() for _ in TRANSCRIPTS[:3]]
+    for endgame, transcript in zip(endgames, TRANSCRIPTS):
+        endgame.load_transcript(transcript[: 2 * ENDGAME_MOVE_COUNT])
+
+    for engine, games in (
+        ("minimax", midgames),
+        ("endgame", endgames),
+        ("mcts", midgames),
+    ):
+        latencies = [
+            latency for game in games for latency in measure_cancel(game, engine)
+        ]
+
+        print(
+            f"{engine:<8} cancel latency mean {1000 * np.mean(latencies):6.2f}ms  "
+            f"max {1000 * np.max(latencies):6.2f}ms"
+        )
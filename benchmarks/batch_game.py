@@ -0,0 +1,46 @@
+"""Measure the throughput of `BatchGame` playing random games.
+
+Usage:
+    python -m benchmarks.batch_game
+"""
+import time
+
+import numpy as np
+
+from othellia.batch import BatchGame
+
+BATCH_SIZES = (1, 10, 100, 1_000, 10_000, 100_000)
+
+
+def measure(size: int, rng: np.random.Generator) -> tuple[int, float]:
+    """Play random games until they are all over.
+
+    Args:
+        size (int): number of games played at once.
+        rng (np.random.Generator): random number generator.
+
+    Returns:
+        tuple[int, float]: number of positions played and elapsed seconds.
+    """
+    batch = BatchGame(size)
+    positions = 0
+
+    start = time.perf_counter()
+
+    while not batch.is_over.all():
+        positions += int(np.count_nonzero(~batch.is_over))
+        batch.play_moves(batch.get_random_moves(rng))
+
+    return positions, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+
+    for size in BATCH_SIZES:
+        positions, elapsed = measure(size, rng)
+
+        print(
+            f"batch {size:>7}  {positions:>9} positions  {elapsed:8.3f}s  "
+            f"{positions / elapsed:>12,.0f} positions/s"
+        )
@@ -0,0 +1,68 @@
+"""Measure the endgame solver on the last moves of real matches.
+
+Usage:
+    python -m benchmarks.endgame
+"""
+import time
+
+from othellia.bitboard import BitboardGame
+from othellia.endgame import EndgameSolver
+from settings.board import BOARD_CELL_LENGTH
+from utils.transcripts import TRANSCRIPTS
+
+EMPTY_COUNTS = (8, 10, 12, 14)
+
+
+def measure(
+    transcript: str, empty_count: int, exact: bool, fastest_first_empties: int
+) -> tuple[int, int, float]:
+    """Solve the position of a match with a number of empty cells left.
+
+    Args:
+        transcript (str): moves of the match.
+        empty_count (int): number of empty cells of the position.
+        exact (bool): if the exact disc difference is searched.
+        fastest_first_empties (int): number of empty cells above which moves are
+        sorted fastest first.
+
+    Returns:
+        tuple[int, int, float]: score, number of nodes and elapsed seconds.
+    """
+    game = BitboardGame()
+    game.load_transcript(transcript[: 2 * (BOARD_CELL_LENGTH ** 2 - 4 - empty_count)])
+    solver = EndgameSolver(fastest_first_empties=fastest_first_empties)
+
+    start = time.perf_counter()
+    _, score = solver.solve_move(game, exact)
+
+    return score, solver.node_count, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    # Matches played until the board is full
+    transcripts = [
+        transcript
+        for transcript in TRANSCRIPTS
+        if len(transcript) == 2 * (BOARD_CELL_LENGTH ** 2 - 4)
+    ]
+
+    for empty_count in EMPTY_COUNTS:
+        print(f"{empty_count} empty cells, {len(transcripts)} positions")
+
+        for name, exact, fastest_first_empties in (
+            ("exact, parity only", True, BOARD_CELL_LENGTH ** 2),
+            ("exact", True, EndgameSolver().fastest_first_empties),
+            ("win/loss/draw", False, EndgameSolver().fastest_first_empties),
+        ):
+            results = [
+                measure(transcript, empty_count, exact, fastest_first_empties)
+                for transcript in transcripts
+            ]
+            nodes = sum(result[1] for result in results)
+            elapsed = sum(result[2] for result in results)
+            scores = " ".join(f"{result[0]:+3d}" for result in results)
+
+            print(
+                f"  {name:<20} scores {scores}  {nodes:>8} nodes  {elapsed:7.2f}s  "
+                f"{nodes / elapsed:8.0f} nodes/s"
+            )
@@ -0,0 +1,97 @@
+"""Compare the nodes searched and the moves found with and without late move
+reductions, on positions of real matches.
+
+Usage:
+    python -m benchmarks.late_move_reductions
+"""
+import time
+
+import numpy as np
+
+from benchmarks.move_ordering import CountingGame
+from othellia.minimax import search_root
+from othellia.move_ordering import MoveOrdering
+from othellia.reductions import LMR_REDUCTIONS, LateMoveReductions
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.transcripts import TRANSCRIPTS
+
+DEPTHS = (3, 4, 5)
+
+# Positions after this many moves of each match
+MOVE_COUNTS = (12, 24, 36)
+
+REDUCTIONS: dict[str, dict[int, tuple[int, ...]]] = {
+    "default": LMR_REDUCTIONS,
+    "one ply": {3: (0, 0, 0, 0, 1)},
+    "aggressive": {3: (0, 0, 0, 2), 5: (0, 0, 0, 2, 2, 2, 4)},
+}
+
+
+def measure(
+    transcript: str, depth: int, late_move_reductions: LateMoveReductions | None
+) -> tuple[tuple[int, int], int, float]:
+    """Search a position once and count its nodes.
+
+    Args:
+        transcript (str): moves leading to the position.
+        depth (int): depth of the search below the root moves.
+        late_move_reductions (LateMoveReductions | None): depth reductions.
+
+    Returns:
+        tuple[tuple[int, int], int, float]: best move, number of nodes and elapsed
+        seconds.
+    """
+    game = CountingGame()
+    game.load_transcript(transcript)
+    game.node_count = 0
+
+    start = time.perf_counter()
+    move, _ = search_root(
+        game,
+        game.indicators,
+        depth,
+        StaticEvaluation.evaluate,
+        TranspositionTable(),
+        move_ordering=MoveOrdering(),
+        late_move_reductions=late_move_reductions,
+    )
+
+    return move, game.node_count, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+    positions = [
+        transcript[: 2 * move_count]
+        for transcript in TRANSCRIPTS
+        for move_count in MOVE_COUNTS
+    ]
+
+    print(f"{len(positions)} positions")
+
+    for depth in DEPTHS:
+        results = [measure(transcript, depth, None) for transcript in positions]
+        plain_nodes = sum(result[1] for result in results)
+        plain_elapsed = sum(result[2] for result in results)
+
+        print(f"  depth {depth}")
+        print(f"    {'unreduced':<12} {plain_nodes:>8} nodes  {plain_elapsed:7.2f}s")
+
+        for name, reductions in REDUCTIONS.items():
+            late_move_reductions = LateMoveReductions(reductions)
+            reduced_results = [
+                measure(transcript, depth, late_move_reductions)
+                for transcript in positions
+            ]
+            nodes = sum(result[1] for result in reduced_results)
+            elapsed = sum(result[2] for result in reduced_results)
+            same_moves = sum(
+                np.array_equal(move, reduced_move)
+                for (move, _, _), (reduced_move, _, _) in zip(results, reduced_results)
+            )
+
+            print(
+                f"    {name:<12} {nodes:>8} nodes ({nodes / plain_nodes:6.1%})  "
+                f"{elapsed:7.2f}s  same moves {same_moves / len(positions):6.1%}"
+            )
@@ -0,0 +1,64 @@
+"""Measure the speed-up of the Lazy SMP search by number of helper processes.
+
+Usage:
+    python -m benchmarks.lazy_smp
+"""
+import os
+import time
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS
+from benchmarks.parallel_search import get_process_counts
+from othellia.bitboard import BitboardGame
+from othellia.minimax import LazySMP, think
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+
+DEPTH = 5
+
+if __name__ == "__main__":
+    games = []
+    for transcript in POSITIONS:
+        game = BitboardGame()
+        game.load_transcript(transcript)
+        games.append(game)
+
+    start = time.perf_counter()
+    moves = [
+        think(game, DEPTH, StaticEvaluation.evaluate, TranspositionTable())
+        for game in games
+    ]
+    sequential_elapsed = time.perf_counter() - start
+
+    print(f"{os.cpu_count()} CPUs, depth {DEPTH}, {len(games)} positions")
+    print(f"  sequential  {sequential_elapsed:8.2f}s")
+
+    for process_count in get_process_counts():
+        helper_count = max(1, process_count - 1)
+
+        with LazySMP(helper_count) as lazy_smp:
+            # Start the helpers before measuring
+            lazy_smp.executor.submit(int).result()
+
+            start = time.perf_counter()
+            lazy_smp_moves = []
+
+            for game in games:
+                # Each position starts with an empty table, like the sequential one
+                lazy_smp.transposition_table.clear()
+                lazy_smp_moves.append(
+                    lazy_smp.think(game, DEPTH, StaticEvaluation.evaluate)
+                )
+
+            elapsed = time.perf_counter() - start
+
+        same_moves = all(
+            np.array_equal(move, lazy_smp_move)
+            for move, lazy_smp_move in zip(moves, lazy_smp_moves)
+        )
+
+        print(
+            f"  {helper_count:>2} helpers  {elapsed:8.2f}s  "
+            f"speed-up {sequential_elapsed / elapsed:5.2f}  same moves {same_moves}"
+        )
@@ -0,0 +1,138 @@
+"""Compare the deepcopy-based search with the make/unmake one.
+
+Usage:
+    python -m benchmarks.make_unmake
+"""
+import time
+import tracemalloc
+from copy import deepcopy
+from typing import Callable
+
+import numpy as np
+
+from othellia.bitboard import AnyGame, BitboardGame
+from othellia.game import Game
+from othellia.minimax import negamax
+from othellia.static_evaluation import StaticEvaluation
+
+# Midgame position reached after ten moves
+TRANSCRIPT = "f5d6c3d3c4f4c5b3e2e3"
+
+
+def deepcopy_minimax(
+    game: AnyGame,
+    depth: int,
+    alpha: float,
+    beta: float,
+    static_evaluation_func: Callable[[AnyGame], float],
+    maximizing_player: bool,
+) -> float:
+    """Alpha-beta search copying the game for every child, as the search used to.
+
+    Args:
+        game (AnyGame): a game.
+        depth (int): depth of the search.
+        alpha (float): alpha parameter of pruning.
+        beta (float): beta parameter of pruning.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        maximizing_player (bool): if we want to maximize (for black)
+        or minimize (for white)the score of the player.
+
+    Returns:
+        float: evaluation score.
+    """
+    if depth == 0 or game.is_over:
+        return static_evaluation_func(game)
+
+    best_eval = -np.inf if maximizing_player else np.inf
+
+    for move in game.indicators:
+        game_copy = deepcopy(game)
+        game_copy.play_piece(move)
+
+        child_eval = deepcopy_minimax(
+            game_copy,
+            depth - 1,
+            alpha,
+            beta,
+            static_evaluation_func,
+            not maximizing_player,
+        )
+
+        if maximizing_player:
+            best_eval = max(best_eval, child_eval)
+            alpha = max(alpha, child_eval)
+        else:
+            best_eval = min(best_eval, child_eval)
+            beta = min(beta, child_eval)
+
+        if beta <= alpha:
+            break
+
+    return best_eval
+
+
+def measure(
+    search: Callable[[AnyGame, int], float], game: AnyGame, depth: int
+) -> tuple[float, float, int]:
+    """Run a search under tracemalloc.
+
+    Args:
+        search (Callable[[AnyGame, int], float]): search function, given the game
+        and the depth.
+        game (AnyGame): a game.
+        depth (int): depth of the search.
+
+    Returns:
+        tuple[float, float, int]: score, elapsed seconds and peak traced memory in
+        bytes.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    score = search(game, depth)
+
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return score, elapsed, peak
+
+
+if __name__ == "__main__":
+    for game_class in (Game, BitboardGame):
+        for depth in (1, 2, 3):
+            print(f"{game_class.__name__}, depth {depth}")
+
+            # Black plays in the measured position, both scores are black's
+            searches: tuple[tuple[str, Callable[[AnyGame, int], float]], ...] = (
+                (
+                    "deepcopy",
+                    lambda game, depth: deepcopy_minimax(
+                        game,
+                        depth,
+                        -np.inf,
+                        np.inf,
+                        StaticEvaluation.coin_parity,
+                        True,
+                    ),
+                ),
+                (
+                    "make/unmake",
+                    lambda game, depth: negamax(
+                        game, depth, -np.inf, np.inf, StaticEvaluation.coin_parity
+                    ),
+                ),
+            )
+
+            for name, search in searches:
+                game = game_class()
+                game.load_transcript(TRANSCRIPT)
+
+                score, elapsed, peak = measure(search, game, depth)
+
+                print(
+                    f"  {name:<12} score {score:7.2f}  {elapsed:8.3f}s  "
+                    f"peak {peak / 1024:9.1f} KiB"
+                )
@@ -0,0 +1,64 @@
+"""Measure the playouts per second of the Monte Carlo tree search, and the memory of
+a tree of a million nodes.
+
+Usage:
+    python -m benchmarks.mcts
+"""
+import resource
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS
+from othellia.bitboard import BitboardGame
+from othellia.mcts import NODE_SIZE, MonteCarloTree, MonteCarloTreeSearch
+from settings.board import BOARD_CELL_LENGTH
+
+TIME_BUDGET = 5.0
+NODE_COUNT = 1_000_000
+
+if __name__ == "__main__":
+    search = MonteCarloTreeSearch(rng=np.random.default_rng(0))
+
+    print("Playouts")
+    for transcript in POSITIONS:
+        game = BitboardGame()
+        game.load_transcript(transcript)
+
+        start = time.perf_counter()
+        search.search(game, time_budget=TIME_BUDGET)
+        elapsed = time.perf_counter() - start
+
+        print(
+            f"  after {len(transcript) // 2:>2} moves  {search.playout_count:>6} "
+            f"playouts  {search.playout_count / elapsed:7.1f} playouts/s  "
+            f"{search.tree.node_count:>7} nodes"
+        )
+
+    print(f"Tree of {NODE_COUNT} nodes, {NODE_SIZE} bytes per node")
+    tracemalloc.start()
+    tree = MonteCarloTree(NODE_COUNT)
+    _, allocated = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    search = MonteCarloTreeSearch(tree, np.random.default_rng(0))
+    game = BitboardGame()
+
+    # Fill the tree from the opening, until the children of a node may not fit
+    start = time.perf_counter()
+    while tree.node_count < NODE_COUNT - BOARD_CELL_LENGTH ** 2:
+        search.run_playout(game.black, game.white)
+    elapsed = time.perf_counter() - start
+
+    # Kilobytes on Linux
+    peak_resident = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 2 ** 10
+
+    print(
+        f"  {tree.nbytes / 2 ** 20:6.1f} MB of arrays, {allocated / 2 ** 20:6.1f} MB "
+        f"allocated, {peak_resident / 2 ** 20:6.1f} MB peak resident set"
+    )
+    print(
+        f"  {tree.node_count} nodes after {search.playout_count} playouts "
+        f"in {elapsed:7.1f}s"
+    )
@@ -0,0 +1,92 @@
+"""Compare the nodes searched by negamax with and without move ordering.
+
+Usage:
+    python -m benchmarks.move_ordering
+"""
+import time
+
+import numpy as np
+
+from othellia.bitboard import BitboardGame
+from othellia.game import MoveRecord
+from othellia.minimax import negamax
+from othellia.move_ordering import MoveOrdering
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+
+# Opening, early and late midgame positions of a real match
+POSITIONS = (
+    "f5d6c3d3c4f4c5b3e2e3",
+    "f5d6c3d3c4f4c5b3e2e3c2b4c6d1f2d2a3e6d7f7",
+    "f5d6c3d3c4f4c5b3e2e3c2b4c6d1f2d2a3e6d7f7c1b1e1f1g4g1f3g5e7g3",
+)
+
+DEPTHS = (3, 4, 5, 6)
+
+
+class CountingGame(BitboardGame):
+    """Game counting the moves made on it, that is the nodes of a search."""
+    node_count: int = 0
+
+    def make_move(self, cell_index: tuple[int, int]) -> MoveRecord:
+        self.node_count += 1
+
+        return super().make_move(cell_index)
+
+
+def measure(
+    transcript: str,
+    depth: int,
+    move_ordering: MoveOrdering | None,
+    transposition_table: TranspositionTable | None,
+) -> tuple[float, int, float]:
+    """Search a position and count its nodes.
+
+    Args:
+        transcript (str): moves leading to the position.
+        depth (int): depth of the search.
+        move_ordering (MoveOrdering | None): move ordering heuristics.
+        transposition_table (TranspositionTable | None): transposition table.
+
+    Returns:
+        tuple[float, int, float]: score, number of nodes and elapsed seconds.
+    """
+    game = CountingGame()
+    game.load_transcript(transcript)
+    game.node_count = 0
+
+    start = time.perf_counter()
+    score = negamax(
+        game,
+        depth,
+        -np.inf,
+        np.inf,
+        StaticEvaluation.evaluate,
+        transposition_table,
+        move_ordering=move_ordering,
+    )
+
+    return score, game.node_count, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    for transcript in POSITIONS:
+        print(f"Position after {len(transcript) // 2} moves")
+
+        for depth in DEPTHS:
+            results = {
+                "plain": measure(transcript, depth, None, None),
+                "ordering": measure(transcript, depth, MoveOrdering(), None),
+                "TT": measure(transcript, depth, None, TranspositionTable()),
+                "TT+ordering": measure(
+                    transcript, depth, MoveOrdering(), TranspositionTable()
+                ),
+            }
+            plain_nodes = results["plain"][1]
+
+            print(f"  depth {depth}")
+            for name, (score, nodes, elapsed) in results.items():
+                print(
+                    f"    {name:<12} score {score:7.2f}  {nodes:>8} nodes "
+                    f"({nodes / plain_nodes:6.1%})  {elapsed:7.2f}s"
+                )
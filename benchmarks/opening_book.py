@@ -0,0 +1,73 @@
+"""Measure the size and lookup time of the opening book, and the time of matches
+between chromosomes with and without it.
+
+Usage:
+    python -m benchmarks.opening_book
+"""
+import os
+import time
+from typing import Any
+
+import numpy as np
+
+from genetic.fitness import play_match
+from othellia.bitboard import position_to_game
+from othellia.book_builder import get_book_positions
+from othellia.opening_book import OpeningBook
+from othellia.static_evaluation import StaticEvaluation
+
+# Chromosomes of the matches, the genetic weights perturbed, and depth of the
+# matches
+CHROMOSOME_COUNT = 3
+PERTURBATION = 0.2
+MATCH_DEPTH = 3
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+
+    start = time.perf_counter()
+    opening_book = OpeningBook.load()
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{len(opening_book)} positions, "
+        f"{os.path.getsize(OpeningBook.book_path) / 2 ** 10:.1f} KB, "
+        f"loaded in {1000 * elapsed:.1f}ms"
+    )
+
+    games = [position_to_game(position) for position in get_book_positions(5)]
+
+    start = time.perf_counter()
+    hit_count = sum(opening_book.lookup(game) is not None for game in games)
+    elapsed = time.perf_counter() - start
+
+    print(
+        f"{hit_count}/{len(games)} positions found, "
+        f"{1e6 * elapsed / len(games):.0f}us per lookup"
+    )
+
+    rng = np.random.default_rng(0)
+    weights = np.array(StaticEvaluation.evaluation_weights)
+    chromosomes: list[np.ndarray[Any, np.dtype[np.float64]]] = [
+        weights * (1 + PERTURBATION * rng.uniform(-1, 1, len(weights)))
+        for _ in range(CHROMOSOME_COUNT)
+    ]
+
+    for book in (None, opening_book):
+        start = time.perf_counter()
+
+        for black in range(CHROMOSOME_COUNT):
+            for white in range(CHROMOSOME_COUNT):
+                if black != white:
+                    play_match(
+                        chromosomes[black],
+                        chromosomes[white],
+                        MATCH_DEPTH,
+                        opening_book=book,
+                    )
+
+        print(
+            f"{CHROMOSOME_COUNT * (CHROMOSOME_COUNT - 1)} matches at depth "
+            f"{MATCH_DEPTH} {'without' if book is None else 'with'} the book "
+            f"{time.perf_counter() - start:6.1f}s"
+        )
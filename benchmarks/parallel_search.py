@@ -0,0 +1,72 @@
+"""Measure the speed-up of the multi-process root search by number of processes.
+
+Usage:
+    python -m benchmarks.parallel_search
+"""
+import os
+import time
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS
+from othellia.bitboard import BitboardGame
+from othellia.minimax import create_executor, think
+from othellia.static_evaluation import StaticEvaluation
+
+DEPTH = 5
+
+
+def get_process_counts() -> list[int]:
+    """Return the numbers of processes to measure, powers of two up to the number
+    of CPUs.
+
+    Returns:
+        list[int]: numbers of processes.
+    """
+    cpu_count = os.cpu_count() or 1
+    process_counts = [1]
+
+    while process_counts[-1] * 2 <= cpu_count:
+        process_counts.append(process_counts[-1] * 2)
+
+    if process_counts[-1] != cpu_count:
+        process_counts.append(cpu_count)
+
+    return process_counts
+
+
+if __name__ == "__main__":
+    games = []
+    for transcript in POSITIONS:
+        game = BitboardGame()
+        game.load_transcript(transcript)
+        games.append(game)
+
+    start = time.perf_counter()
+    moves = [think(game, DEPTH, StaticEvaluation.evaluate) for game in games]
+    sequential_elapsed = time.perf_counter() - start
+
+    print(f"{os.cpu_count()} CPUs, depth {DEPTH}, {len(games)} positions")
+    print(f"  sequential    {sequential_elapsed:8.2f}s")
+
+    for process_count in get_process_counts():
+        with create_executor(process_count) as executor:
+            # Start the workers before measuring
+            executor.submit(int).result()
+
+            start = time.perf_counter()
+            parallel_moves = [
+                think(game, DEPTH, StaticEvaluation.evaluate, executor=executor)
+                for game in games
+            ]
+            elapsed = time.perf_counter() - start
+
+        same_moves = all(
+            np.array_equal(move, parallel_move)
+            for move, parallel_move in zip(moves, parallel_moves)
+        )
+
+        print(
+            f"  {process_count:>2} processes  {elapsed:8.2f}s  "
+            f"speed-up {sequential_elapsed / elapsed:5.2f}  same moves {same_moves}"
+        )
@@ -0,0 +1,96 @@
+"""Measure the latency of the computer's moves with and without pondering, against a
+simulated human taking some time to play.
+
+Usage:
+    python -m benchmarks.pondering
+"""
+import time
+
+import numpy as np
+
+from othellia.bitboard import BitboardGame
+from othellia.endgame import ENDGAME_EMPTIES
+from othellia.minimax import set_stop_flag, think
+from othellia.pondering import Ponderer
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from settings.values import BLACK_VALUE
+
+THINK_TIME_BUDGET = 0.5
+MAX_DEPTH = 60
+
+# Seconds the human thinks, and depth of the search choosing its moves
+HUMAN_THINK_TIME = 2.0
+HUMAN_DEPTH = 2
+
+
+def play_game(pondering: bool) -> list[float]:
+    """Play a game between the computer (white) and the simulated human (black).
+
+    Args:
+        pondering (bool): if the computer ponders during the human's turns.
+
+    Returns:
+        list[float]: seconds taken by each move of the computer.
+    """
+    game = BitboardGame()
+    transposition_table = TranspositionTable()
+    ponderer = Ponderer(
+        MAX_DEPTH,
+        StaticEvaluation.evaluate,
+        transposition_table,
+        THINK_TIME_BUDGET,
+        endgame_empties=ENDGAME_EMPTIES,
+    )
+    latencies = []
+
+    while not game.is_over:
+        if game.player_value == BLACK_VALUE:
+            if pondering:
+                ponderer.start(game)
+
+            start = time.perf_counter()
+            move = think(
+                game, HUMAN_DEPTH, StaticEvaluation.evaluate, TranspositionTable(1)
+            )
+
+            # The human keeps thinking, the pondering going on meanwhile
+            time.sleep(max(0.0, HUMAN_THINK_TIME - (time.perf_counter() - start)))
+            game.play_piece(move)
+        else:
+            start = time.perf_counter()
+            if pondering:
+                move = ponderer.think(game)
+            else:
+                move = think(
+                    game,
+                    MAX_DEPTH,
+                    StaticEvaluation.evaluate,
+                    transposition_table,
+                    THINK_TIME_BUDGET,
+                    endgame_empties=ENDGAME_EMPTIES,
+                )
+            latencies.append(time.perf_counter() - start)
+
+            game.play_piece(move)
+
+    ponderer.stop()
+    set_stop_flag(None)
+
+    if pondering:
+        print(f"  {ponderer.hits} ponder hits, {ponderer.misses} misses")
+
+    return latencies
+
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+
+    for pondering in (False, True):
+        print("Pondering" if pondering else "No pondering")
+        latencies = play_game(pondering)
+
+        print(
+            f"  latency mean {np.mean(latencies):5.2f}s  median "
+            f"{np.median(latencies):5.2f}s  max {np.max(latencies):5.2f}s"
+        )
@@ -0,0 +1,214 @@
+"""Compare the nodes searched at the root with independent windows, a shared bound,
+principal variation search and aspiration windows.
+
+Usage:
+    python -m benchmarks.principal_variation
+"""
+import time
+from typing import Callable
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS, CountingGame
+from othellia.minimax import negamax, search_aspiration, search_child, search_root
+from othellia.move_ordering import MoveOrdering
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+
+DEPTHS = (3, 4, 5, 6)
+
+
+def search_independent(
+    game: CountingGame,
+    depth: int,
+    transposition_table: TranspositionTable,
+    move_ordering: MoveOrdering,
+) -> float:
+    """Search every root move with the full window, as `think()` used to.
+
+    Args:
+        game (CountingGame): a game.
+        depth (int): depth of the search below the root moves.
+        transposition_table (TranspositionTable): transposition table.
+        move_ordering (MoveOrdering): move ordering heuristics.
+
+    Returns:
+        float: score of the best move.
+    """
+    player_value = game.player_value
+    scores = []
+
+    for move in game.indicators:
+        record = game.make_move(move)
+        scores.append(
+            search_child(
+                game,
+                player_value,
+                depth,
+                -np.inf,
+                np.inf,
+                StaticEvaluation.evaluate,
+                transposition_table,
+                move_ordering=move_ordering,
+            )
+        )
+        game.unmake_move(record)
+
+    return max(scores)
+
+
+def search_shared(
+    game: CountingGame,
+    depth: int,
+    transposition_table: TranspositionTable,
+    move_ordering: MoveOrdering,
+) -> float:
+    """Search the root moves with alpha-beta, sharing the best score between them.
+
+    Args:
+        game (CountingGame): a game.
+        depth (int): depth of the search below the root moves.
+        transposition_table (TranspositionTable): transposition table.
+        move_ordering (MoveOrdering): move ordering heuristics.
+
+    Returns:
+        float: score of the best move.
+    """
+    return negamax(
+        game,
+        depth + 1,
+        -np.inf,
+        np.inf,
+        StaticEvaluation.evaluate,
+        transposition_table,
+        move_ordering=move_ordering,
+    )
+
+
+def search_principal_variation(
+    game: CountingGame,
+    depth: int,
+    transposition_table: TranspositionTable,
+    move_ordering: MoveOrdering,
+) -> float:
+    """Search the root moves with principal variation search.
+
+    Args:
+        game (CountingGame): a game.
+        depth (int): depth of the search below the root moves.
+        transposition_table (TranspositionTable): transposition table.
+        move_ordering (MoveOrdering): move ordering heuristics.
+
+    Returns:
+        float: score of the best move.
+    """
+    _, score = search_root(
+        game,
+        game.indicators,
+        depth,
+        StaticEvaluation.evaluate,
+        transposition_table,
+        move_ordering=move_ordering,
+    )
+
+    return score
+
+
+def iterate(transcript: str, depth: int, aspiration: bool) -> tuple[float, int, float]:
+    """Search a position at depth 0, 1... like `think()` and count all the nodes.
+
+    Args:
+        transcript (str): moves leading to the position.
+        depth (int): depth of the last search.
+        aspiration (bool): if the searches after the first one use aspiration
+        windows around the previous score.
+
+    Returns:
+        tuple[float, int, float]: score, number of nodes and elapsed seconds.
+    """
+    game = CountingGame()
+    game.load_transcript(transcript)
+    game.node_count = 0
+    transposition_table = TranspositionTable()
+    move_ordering = MoveOrdering()
+
+    start = time.perf_counter()
+    _, score = search_root(
+        game,
+        game.indicators,
+        0,
+        StaticEvaluation.evaluate,
+        transposition_table,
+        move_ordering=move_ordering,
+    )
+
+    for current_depth in range(1, depth + 1):
+        if aspiration:
+            _, score = search_aspiration(
+                game,
+                game.indicators,
+                current_depth,
+                StaticEvaluation.evaluate,
+                score,
+                transposition_table,
+                move_ordering=move_ordering,
+            )
+        else:
+            _, score = search_root(
+                game,
+                game.indicators,
+                current_depth,
+                StaticEvaluation.evaluate,
+                transposition_table,
+                move_ordering=move_ordering,
+            )
+
+    return score, game.node_count, time.perf_counter() - start
+
+
+def measure(
+    search: Callable[[CountingGame, int, TranspositionTable, MoveOrdering], float],
+    transcript: str,
+    depth: int,
+) -> tuple[float, int, float]:
+    """Search a position once and count its nodes.
+
+    Args:
+        search (Callable[[CountingGame, int, TranspositionTable, MoveOrdering],
+        float]): root search function.
+        transcript (str): moves leading to the position.
+        depth (int): depth of the search below the root moves.
+
+    Returns:
+        tuple[float, int, float]: score, number of nodes and elapsed seconds.
+    """
+    game = CountingGame()
+    game.load_transcript(transcript)
+    game.node_count = 0
+
+    start = time.perf_counter()
+    score = search(game, depth, TranspositionTable(), MoveOrdering())
+
+    return score, game.node_count, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    for transcript in POSITIONS:
+        print(f"Position after {len(transcript) // 2} moves")
+
+        for depth in DEPTHS:
+            results = {
+                "independent": measure(search_independent, transcript, depth),
+                "shared": measure(search_shared, transcript, depth),
+                "PVS": measure(search_principal_variation, transcript, depth),
+                "iterative": iterate(transcript, depth, False),
+                "aspiration": iterate(transcript, depth, True),
+            }
+            independent_nodes = results["independent"][1]
+
+            print(f"  depth {depth}")
+            for name, (score, nodes, elapsed) in results.items():
+                print(
+                    f"    {name:<12} score {score:7.2f}  {nodes:>8} nodes "
+                    f"({nodes / independent_nodes:6.1%})  {elapsed:7.2f}s"
+                )
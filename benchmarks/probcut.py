@@ -0,0 +1,178 @@
+"""Compare Multi-ProbCut with plain alpha-beta depth for depth: nodes and time of a
+search, and results of matches between them.
+
+Usage:
+    python -m benchmarks.probcut
+"""
+import time
+
+import numpy as np
+
+from benchmarks.move_ordering import POSITIONS, CountingGame
+from othellia.bitboard import BitboardGame
+from othellia.minimax import search_root, think
+from othellia.move_ordering import MoveOrdering
+from othellia.probcut import MultiProbCut
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from settings.values import BLACK_VALUE, WHITE_VALUE
+
+DEPTHS = (3, 4, 5, 6)
+
+# Matches played from random openings, each opening twice with swapped colours
+MATCH_DEPTH = 4
+OPENING_COUNT = 6
+OPENING_MOVES = 6
+
+
+def measure(
+    transcript: str, depth: int, multi_probcut: MultiProbCut | None
+) -> tuple[tuple[int, int], int, float]:
+    """Search a position once and count its nodes.
+
+    Args:
+        transcript (str): moves leading to the position.
+        depth (int): depth of the search below the root moves.
+        multi_probcut (MultiProbCut | None): parameters of the selective search.
+
+    Returns:
+        tuple[tuple[int, int], int, float]: best move, number of nodes and elapsed
+        seconds.
+    """
+    game = CountingGame()
+    game.load_transcript(transcript)
+    game.node_count = 0
+
+    start = time.perf_counter()
+    move, _ = search_root(
+        game,
+        game.indicators,
+        depth,
+        StaticEvaluation.evaluate,
+        TranspositionTable(),
+        move_ordering=MoveOrdering(),
+        multi_probcut=multi_probcut,
+    )
+
+    return move, game.node_count, time.perf_counter() - start
+
+
+def play(
+    opening: list[tuple[int, int]], probcut_value: int, multi_probcut: MultiProbCut
+) -> tuple[int, float, float]:
+    """Play a game between Multi-ProbCut and plain alpha-beta at the same depth.
+
+    Args:
+        opening (list[tuple[int, int]]): moves played before the searches.
+        probcut_value (int): value of the player using Multi-ProbCut.
+        multi_probcut (MultiProbCut): parameters of the selective search.
+
+    Returns:
+        tuple[int, float, float]: disc difference for Multi-ProbCut, and seconds
+        spent by Multi-ProbCut and by plain alpha-beta.
+    """
+    game = BitboardGame()
+    for move in opening:
+        game.play_piece(move)
+
+    elapsed = {BLACK_VALUE: 0.0, WHITE_VALUE: 0.0}
+    transposition_tables = {
+        BLACK_VALUE: TranspositionTable(),
+        WHITE_VALUE: TranspositionTable(),
+    }
+
+    while not game.is_over:
+        player_value = game.player_value
+
+        start = time.perf_counter()
+        move = think(
+            game,
+            MATCH_DEPTH,
+            StaticEvaluation.evaluate,
+            transposition_tables[player_value],
+            multi_probcut=multi_probcut if player_value == probcut_value else None,
+        )
+        elapsed[player_value] += time.perf_counter() - start
+
+        game.play_piece((int(move[0]), int(move[1])))
+
+    disc_difference = game.get_black_piece_count() - game.get_white_piece_count()
+    if probcut_value != BLACK_VALUE:
+        disc_difference = -disc_difference
+
+    return disc_difference, elapsed[probcut_value], elapsed[-probcut_value]
+
+
+def get_opening(rng: np.random.Generator) -> list[tuple[int, int]]:
+    """Return random opening moves.
+
+    Args:
+        rng (np.random.Generator): random generator.
+
+    Returns:
+        list[tuple[int, int]]: column and row of the moves.
+    """
+    game = BitboardGame()
+    opening = []
+
+    for _ in range(OPENING_MOVES):
+        moves = game.indicators
+        col, row = moves[rng.integers(len(moves))]
+        move = (int(col), int(row))
+        game.play_piece(move)
+        opening.append(move)
+
+    return opening
+
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+    multi_probcut = MultiProbCut.load()
+
+    print("Search of a position")
+    for depth in DEPTHS:
+        plain_nodes = probcut_nodes = 0
+        plain_elapsed = probcut_elapsed = 0.0
+        same_moves = 0
+
+        for transcript in POSITIONS:
+            plain_move, nodes, elapsed = measure(transcript, depth, None)
+            plain_nodes += nodes
+            plain_elapsed += elapsed
+
+            probcut_move, nodes, elapsed = measure(transcript, depth, multi_probcut)
+            probcut_nodes += nodes
+            probcut_elapsed += elapsed
+
+            same_moves += np.array_equal(plain_move, probcut_move)
+
+        print(
+            f"  depth {depth}  plain {plain_nodes:>8} nodes {plain_elapsed:7.2f}s  "
+            f"MPC {probcut_nodes:>8} nodes ({probcut_nodes / plain_nodes:6.1%}) "
+            f"{probcut_elapsed:7.2f}s  same moves {same_moves}/{len(POSITIONS)}"
+        )
+
+    print(f"Matches at depth {MATCH_DEPTH}, Multi-ProbCut against plain alpha-beta")
+    rng = np.random.default_rng(0)
+    results = []
+    probcut_elapsed = plain_elapsed = 0.0
+
+    for _ in range(OPENING_COUNT):
+        opening = get_opening(rng)
+
+        for probcut_value in (BLACK_VALUE, WHITE_VALUE):
+            disc_difference, probcut_time, plain_time = play(
+                opening, probcut_value, multi_probcut
+            )
+            results.append(disc_difference)
+            probcut_elapsed += probcut_time
+            plain_elapsed += plain_time
+
+    wins = sum(result > 0 for result in results)
+    draws = sum(result == 0 for result in results)
+
+    print(
+        f"  {wins} wins, {draws} draws, {len(results) - wins - draws} losses  "
+        f"mean disc difference {np.mean(results):+.1f}"
+    )
+    print(f"  time MPC {probcut_elapsed:7.2f}s  plain {plain_elapsed:7.2f}s")
@@ -0,0 +1,97 @@
+"""Print the search statistics of positions of a real match, and compare the time of
+the searches with and without collecting them.
+
+Usage:
+    python -m benchmarks.search_statistics
+"""
+import time
+
+from benchmarks.move_ordering import POSITIONS
+from othellia.bitboard import BitboardGame
+from othellia.minimax import think
+from othellia.search_statistics import SearchStatistics
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+
+DEPTH = 5
+REPEAT_COUNT = 5
+
+
+def time_searches(statistics: SearchStatistics | None) -> float:
+    """Return the best time of repeated searches of the positions.
+
+    Args:
+        statistics (SearchStatistics | None): statistics given to the searches.
+
+    Returns:
+        float: seconds taken by the fastest repetition.
+    """
+    times = []
+
+    for _ in range(REPEAT_COUNT):
+        start = time.perf_counter()
+
+        for transcript in POSITIONS:
+            game = BitboardGame()
+            game.load_transcript(transcript)
+            think(
+                game,
+                DEPTH,
+                StaticEvaluation.evaluate,
+                TranspositionTable(),
+                time_budget=60,
+                statistics=statistics,
+            )
+
+        times.append(time.perf_counter() - start)
+
+    return min(times)
+
+
+if __name__ == "__main__":
+    StaticEvaluation.load_evaluation_weights()
+
+    for transcript in POSITIONS:
+        game = BitboardGame()
+        game.load_transcript(transcript)
+
+        statistics = SearchStatistics()
+        think(
+            game,
+            DEPTH,
+            StaticEvaluation.evaluate,
+            TranspositionTable(),
+            time_budget=60,
+            statistics=statistics,
+        )
+
+        cutoff_count = sum(statistics.cutoff_counts)
+        factors = statistics.effective_branching_factors.values()
+
+        print(f"After {len(transcript) // 2} moves, depth {DEPTH}")
+        print(
+            f"  {statistics.node_count:>6} nodes  {statistics.nodes_per_second:7.0f} "
+            f"nodes/s  {statistics.evaluation_count:>6} evaluations"
+        )
+        print(
+            f"  evaluation {statistics.evaluation_time / statistics.elapsed_time:4.0%} "
+            "of the time, move generation "
+            f"{statistics.move_generation_time / statistics.elapsed_time:4.0%}"
+        )
+        print(
+            f"  {statistics.cutoff_counts[0] / cutoff_count:4.0%} of the cutoffs by "
+            f"the first move, TT hits {statistics.transposition_hits} / "
+            f"{statistics.transposition_probes} probes"
+        )
+        print(
+            "  effective branching factors "
+            + "  ".join(f"{factor:4.1f}" for factor in factors)
+        )
+
+    disabled_time = time_searches(None)
+    enabled_time = time_searches(SearchStatistics())
+
+    print(
+        f"Searches {disabled_time:6.2f}s without statistics, {enabled_time:6.2f}s "
+        f"with them ({enabled_time / disabled_time - 1:+.1%})"
+    )
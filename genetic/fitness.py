@@ -1,21 +1,29 @@
 from itertools import permutations
 from math import factorial
-from typing import cast
+from typing import Callable, cast
 
 import numpy as np
 from tqdm.notebook import tqdm
 
-from othellia.game import Game
+from othellia.bitboard import BitboardGame
 from othellia.minimax import think
+from othellia.opening_book import OpeningBook
 from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
 from settings import values
 from utils.game import cell_index_to_notation
 
+# Memory used by the transposition table of each player of a match
+MATCH_TRANSPOSITION_TABLE_MB: float = 4
+
 
 def play_match(
         chromosome_black: np.ndarray[np.float64, np.dtype[np.float64]],
         chromosome_white: np.ndarray[np.float64, np.dtype[np.float64]],
         depth: int,
+        time_budget: float | None = None,
+        engines: dict[int, Callable[[BitboardGame], tuple[int, int]]] | None = None,
+        opening_book: OpeningBook | None = None,
 ) -> tuple[int, str]:
     """Plays an Othello game between two chromosomes and returns the result.
 
@@ -24,15 +32,31 @@ def play_match(
         playing as black.
         chromosome_white (np.ndarray[np.float64, np.dtype[np.float64]]): a chromosome
         playing as white.
-        depth (int): depth of the minimax search.
+        depth (int): depth of the minimax search, maximum depth with a time budget.
+        time_budget (float | None, optional): seconds given to each move search.
+        Defaults to None.
+        engines (dict[int, Callable[[BitboardGame], tuple[int, int]]] | None,
+        optional): functions returning the move of a position, replacing the
+        minimax search of the players they are given for by player value, e.g.
+        `functools.partial(othellia.mcts.think, playout_count=1000)`. Defaults to
+        None.
+        opening_book (OpeningBook | None, optional): best moves of the opening
+        positions played by the minimax search of both players, whatever their
+        chromosome. Defaults to None.
 
     Returns:
         int: result of the match (1 black, -1 white, 0 draw).
         str: transcript of the game.
     """
-    game = Game()
+    game = BitboardGame()
     static_evaluation = StaticEvaluation()
 
+    # Each chromosome evaluates positions differently, so they keep their own table
+    transposition_tables = {
+        values.BLACK_VALUE: TranspositionTable(MATCH_TRANSPOSITION_TABLE_MB),
+        values.WHITE_VALUE: TranspositionTable(MATCH_TRANSPOSITION_TABLE_MB),
+    }
+
     transcript = ""
 
     while not game.is_over:
@@ -53,7 +77,17 @@ def play_match(
                 )
 
         # Play the best legal move
-        move = think(game, depth, static_evaluation.evaluate)
+        if engines is not None and game.player_value in engines:
+            move = engines[game.player_value](game)
+        else:
+            move = think(
+                game,
+                depth,
+                static_evaluation.evaluate,
+                transposition_tables[game.player_value],
+                time_budget,
+                opening_book=opening_book,
+            )
         game.play_piece(move)
 
         # Keep record of the move
@@ -63,7 +97,10 @@ def play_match(
 
 
 def play_tournament(
-        chromosomes: np.ndarray[np.float64, np.dtype[np.float64]], depth: int
+        chromosomes: np.ndarray[np.float64, np.dtype[np.float64]],
+        depth: int,
+        time_budget: float | None = None,
+        opening_book: OpeningBook | None = None,
 ) -> np.ndarray[np.float64, np.dtype[np.float64]]:
     """Runs a tournament by making each chromosomes play against each other as black
     and white, and returns each chromosomes score.
@@ -73,7 +110,12 @@ def play_tournament(
     Args:
         chromosomes (np.ndarray[np.float64, np.dtype[np.float64]]): population of
         chromosome.
-        depth (int): depth of the minimax search.
+        depth (int): depth of the minimax search, maximum depth with a time budget.
+        time_budget (float | None, optional): seconds given to each move search.
+        Defaults to None.
+        opening_book (OpeningBook | None, optional): best moves of the opening
+        positions, see `play_match()`. The matches then differ from the end of the
+        book only. Defaults to None.
 
     Returns:
         np.ndarray[np.float64, np.dtype[np.float64]]: list of chromosomes score.
@@ -89,7 +131,11 @@ def play_tournament(
             total=factorial(n_chromosomes) // factorial(n_chromosomes - 2),
     ):
         winner, _ = play_match(
-            chromosomes[b_index], chromosomes[w_index], depth
+            chromosomes[b_index],
+            chromosomes[w_index],
+            depth,
+            time_budget,
+            opening_book=opening_book,
         )
 
         match winner:
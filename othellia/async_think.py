@@ -0,0 +1,154 @@
+import ctypes
+import threading
+from concurrent.futures import CancelledError
+from typing import Any, Callable
+
+from othellia.bitboard import AnyGame, get_position, position_to_game
+from othellia.endgame import SolverTimeout
+from othellia.minimax import SearchTimeout, set_stop_flag, think
+
+
+class ThinkHandle:
+    """Handle of a search running in a background thread, returned by
+    `start_think()`, polled for its move without blocking the caller.
+
+    The searches of the process share a single stop flag, there must be a single
+    running handle or ponderer at a time.
+    """
+    stop_flag: ctypes.c_bool
+    thread: threading.Thread
+    move: tuple[int, int] | None
+    error: BaseException | None
+    cancelled: bool
+
+    def __init__(
+            self,
+            engine: Callable[..., tuple[int, int]],
+            game: AnyGame,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+    ) -> None:
+        """Start the search.
+
+        Args:
+            engine (Callable[..., tuple[int, int]]): function returning the best move
+            of the game given as its first argument.
+            game (AnyGame): a game, which is copied so that the caller may change it.
+            args (tuple[Any, ...]): other positional arguments of the engine.
+            kwargs (dict[str, Any]): keyword arguments of the engine.
+        """
+        self.stop_flag = ctypes.c_bool(False)
+        self.move = None
+        self.error = None
+        self.cancelled = False
+
+        set_stop_flag(self.stop_flag)
+
+        self.thread = threading.Thread(
+            target=self.run,
+            args=(engine, position_to_game(get_position(game)), args, kwargs),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def run(
+            self,
+            engine: Callable[..., tuple[int, int]],
+            game: AnyGame,
+            args: tuple[Any, ...],
+            kwargs: dict[str, Any],
+    ) -> None:
+        """Run the search and keep its move, or its error. Run by the search
+        thread.
+
+        Args:
+            engine (Callable[..., tuple[int, int]]): function returning the best move.
+            game (AnyGame): copy of the game.
+            args (tuple[Any, ...]): other positional arguments of the engine.
+            kwargs (dict[str, Any]): keyword arguments of the engine.
+        """
+        try:
+            move = engine(game, *args, **kwargs)
+        except (SearchTimeout, SolverTimeout):
+            return
+        except Exception as error:
+            self.error = error
+            return
+
+        # The best move of an interrupted search is not the usual one
+        if not self.stop_flag.value:
+            self.move = move
+
+    def poll(self) -> bool:
+        """Return whether the search is over, without waiting.
+
+        Returns:
+            bool: if the search is over, or cancelled.
+        """
+        return not self.thread.is_alive()
+
+    def result(self, timeout: float | None = None) -> tuple[int, int]:
+        """Wait for the search to end and return its move.
+
+        Args:
+            timeout (float | None, optional): seconds to wait at most. Defaults to
+            None, to wait until the search ends.
+
+        Raises:
+            TimeoutError: when the search is not over after the timeout.
+            CancelledError: when the search was cancelled.
+
+        Returns:
+            tuple[int, int]: column and row of the best move.
+        """
+        self.thread.join(timeout)
+
+        if self.thread.is_alive():
+            raise TimeoutError("The search is not over")
+        if self.cancelled:
+            raise CancelledError
+        if self.error is not None:
+            raise self.error
+
+        assert self.move is not None
+        return self.move
+
+    def cancel(self) -> bool:
+        """Stop the search and wait for the thread to end, in a few milliseconds.
+
+        Returns:
+            bool: if the search was cancelled, False if it was already over.
+        """
+        if self.poll():
+            return self.cancelled
+
+        self.stop_flag.value = True
+        self.thread.join()
+
+        # Later searches of the process must not stop at once
+        self.stop_flag.value = False
+        self.cancelled = True
+
+        return True
+
+
+def start_think(
+        game: AnyGame,
+        *args: Any,
+        engine: Callable[..., tuple[int, int]] = think,
+        **kwargs: Any,
+) -> ThinkHandle:
+    """Start searching the best move of the game in a background thread.
+
+    Args:
+        game (AnyGame): a game, which is not over.
+        args (Any): other positional arguments of the engine, for `think()` the depth
+        and the static evaluation function.
+        engine (Callable[..., tuple[int, int]], optional): function returning the best
+        move of the game given as its first argument. Defaults to `think()`.
+        kwargs (Any): keyword arguments of the engine.
+
+    Returns:
+        ThinkHandle: handle of the search.
+    """
+    return ThinkHandle(engine, game, args, kwargs)
@@ -0,0 +1,377 @@
+from typing import Any
+
+import numpy as np
+from numpy import ndarray, dtype
+
+from othellia.bitboard import SHIFTS, array_to_bitboard
+from settings.board import BOARD_CELL_LENGTH
+from settings.values import BLACK_VALUE, WHITE_VALUE
+
+# Bitboards are stored as `np.uint64`, with the same bit layout as
+# `othellia.bitboard` (see `utils.game.cell_index_to_square`)
+BATCH_SHIFTS: tuple[tuple[np.uint64, np.uint64, np.uint64], ...] = tuple(
+    (np.uint64(left), np.uint64(right), np.uint64(mask))
+    for left, right, mask in SHIFTS
+)
+
+SQUARE_COUNT: int = BOARD_CELL_LENGTH ** 2
+
+# Move of a game whose player has no legal moves and passes its turn
+PASS_SQUARE: int = -2
+
+
+def shift(
+        bitboards: ndarray[Any, dtype[np.uint64]],
+        left: np.uint64,
+        right: np.uint64,
+        mask: np.uint64,
+) -> ndarray[Any, dtype[np.uint64]]:
+    """Move every bit of several bitboards one cell toward a direction.
+
+    Args:
+        bitboards (ndarray[Any, dtype[np.uint64]]): bitboards.
+        left (np.uint64): left shift of the direction.
+        right (np.uint64): right shift of the direction.
+        mask (np.uint64): wrapping mask of the direction.
+
+    Returns:
+        ndarray[Any, dtype[np.uint64]]: shifted bitboards.
+    """
+    return (bitboards << left >> right) & mask
+
+
+def popcount(
+        bitboards: ndarray[Any, dtype[np.uint64]],
+) -> ndarray[Any, dtype[np.int64]]:
+    """Count the bits set in several bitboards.
+
+    Args:
+        bitboards (ndarray[Any, dtype[np.uint64]]): bitboards.
+
+    Returns:
+        ndarray[Any, dtype[np.int64]]: number of bits set in each bitboard.
+    """
+    x = bitboards - ((bitboards >> np.uint64(1)) & np.uint64(0x5555555555555555))
+    x = (x & np.uint64(0x3333333333333333)) + (
+        (x >> np.uint64(2)) & np.uint64(0x3333333333333333)
+    )
+    x = (x + (x >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+
+    counts: ndarray[Any, dtype[np.uint64]] = (
+        x * np.uint64(0x0101010101010101)
+    ) >> np.uint64(56)
+
+    return counts.astype(np.int64)
+
+
+def batch_legal_moves(
+        player: ndarray[Any, dtype[np.uint64]],
+        opponent: ndarray[Any, dtype[np.uint64]],
+) -> ndarray[Any, dtype[np.uint64]]:
+    """Return the bitboards of the legal moves of a player on several boards.
+
+    Args:
+        player (ndarray[Any, dtype[np.uint64]]): bitboards of the player's pieces.
+        opponent (ndarray[Any, dtype[np.uint64]]): bitboards of the opponent's
+        pieces.
+
+    Returns:
+        ndarray[Any, dtype[np.uint64]]: bitboards of the legal moves.
+    """
+    empty = ~(player | opponent)
+    moves = np.zeros_like(player)
+
+    for left, right, mask in BATCH_SHIFTS:
+        opponent_mask = opponent & mask
+
+        # Follow the opponent's pieces adjacent to the player's ones
+        candidates = shift(player, left, right, mask) & opponent_mask
+        for _ in range(BOARD_CELL_LENGTH - 3):
+            candidates |= shift(candidates, left, right, mask) & opponent_mask
+
+        moves |= shift(candidates, left, right, mask) & empty
+
+    return moves
+
+
+def batch_flipped_pieces(
+        player: ndarray[Any, dtype[np.uint64]],
+        opponent: ndarray[Any, dtype[np.uint64]],
+        moves: ndarray[Any, dtype[np.uint64]],
+) -> ndarray[Any, dtype[np.uint64]]:
+    """Return the bitboards of the opponent's pieces flipped by a move on several
+    boards.
+
+    Args:
+        player (ndarray[Any, dtype[np.uint64]]): bitboards of the player's pieces.
+        opponent (ndarray[Any, dtype[np.uint64]]): bitboards of the opponent's
+        pieces.
+        moves (ndarray[Any, dtype[np.uint64]]): bitboards holding a single move
+        each, or none.
+
+    Returns:
+        ndarray[Any, dtype[np.uint64]]: bitboards of the flipped pieces.
+    """
+    flipped = np.zeros_like(player)
+
+    for left, right, mask in BATCH_SHIFTS:
+        sandwich = shift(moves, left, right, mask) & opponent
+        for _ in range(BOARD_CELL_LENGTH - 3):
+            sandwich |= shift(sandwich, left, right, mask) & opponent
+
+        # The sandwich only counts when closed by a player's piece
+        closed = (shift(sandwich, left, right, mask) & player) != 0
+        flipped |= np.where(closed, sandwich, np.uint64(0))
+
+    return flipped
+
+
+def bitboards_to_squares(
+        bitboards: ndarray[Any, dtype[np.uint64]],
+) -> ndarray[Any, dtype[np.uint8]]:
+    """Unpack several bitboards into one boolean-like value per square.
+
+    Args:
+        bitboards (ndarray[Any, dtype[np.uint64]]): bitboards.
+
+    Returns:
+        ndarray[Any, dtype[np.uint8]]: array of shape (N, 64), 1 where the bit of
+        the square is set.
+    """
+    as_bytes = np.ascontiguousarray(bitboards, dtype="<u8").view(np.uint8)
+
+    return np.unpackbits(
+        as_bytes.reshape(-1, SQUARE_COUNT // 8), axis=1, bitorder="little"
+    )
+
+
+def squares_to_bitboards(
+        squares: ndarray[Any, dtype[Any]],
+) -> ndarray[Any, dtype[np.uint64]]:
+    """Pack one boolean-like value per square into bitboards.
+
+    Args:
+        squares (ndarray[Any, dtype[Any]]): array of shape (N, 64).
+
+    Returns:
+        ndarray[Any, dtype[np.uint64]]: bitboards.
+    """
+    as_bytes = np.packbits(np.asarray(squares, dtype=bool), axis=1, bitorder="little")
+
+    return as_bytes.view("<u8").reshape(-1).astype(np.uint64)
+
+
+class BatchGame:
+    """Class playing several games at once, storing the boards as one array of
+    bitboards per player.
+
+    Every method acts on all the games together with vectorized operations, games
+    that are over are left untouched. The rules are the same as
+    `othellia.game.Game`.
+    """
+    size: int
+    player_value: ndarray[Any, dtype[np.int8]]
+    is_over: ndarray[Any, dtype[np.bool_]]
+    black: ndarray[Any, dtype[np.uint64]]
+    white: ndarray[Any, dtype[np.uint64]]
+    moves: ndarray[Any, dtype[np.uint64]]
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.reset_game()
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def board(self) -> ndarray[Any, dtype[np.int8]]:
+        """Board positions as an array of piece values of shape (N, 8, 8), indexed by
+        game, row and column.
+
+        The array is built on demand, modifying it does not change the games.
+        """
+        black = bitboards_to_squares(self.black).astype(np.int8)
+        white = bitboards_to_squares(self.white).astype(np.int8)
+
+        board = black * BLACK_VALUE + white * WHITE_VALUE
+
+        # Square indices are column-major
+        return np.ascontiguousarray(
+            board.reshape(-1, BOARD_CELL_LENGTH, BOARD_CELL_LENGTH).transpose(0, 2, 1)
+        )
+
+    def reset_game(self) -> None:
+        """Reset every game board into initial configuration."""
+        initial_board = np.zeros((BOARD_CELL_LENGTH, BOARD_CELL_LENGTH), dtype=int)
+        initial_board[3, 3] = WHITE_VALUE
+        initial_board[4, 4] = WHITE_VALUE
+        initial_board[3, 4] = BLACK_VALUE
+        initial_board[4, 3] = BLACK_VALUE
+
+        self.black = np.full(
+            self.size, array_to_bitboard(initial_board, BLACK_VALUE), dtype=np.uint64
+        )
+        self.white = np.full(
+            self.size, array_to_bitboard(initial_board, WHITE_VALUE), dtype=np.uint64
+        )
+
+        self.player_value = np.full(self.size, BLACK_VALUE, dtype=np.int8)
+        self.update_moves()
+
+        self.is_over = np.zeros(self.size, dtype=bool)
+
+    def get_player_bitboards(
+            self,
+    ) -> tuple[ndarray[Any, dtype[np.uint64]], ndarray[Any, dtype[np.uint64]]]:
+        """Return the bitboards of the current player and its opponent of each game.
+
+        Returns:
+            tuple[ndarray[Any, dtype[np.uint64]], ndarray[Any, dtype[np.uint64]]]:
+            players' and opponents' bitboards.
+        """
+        is_black = self.player_value == BLACK_VALUE
+
+        return (
+            np.where(is_black, self.black, self.white),
+            np.where(is_black, self.white, self.black),
+        )
+
+    def update_moves(self) -> None:
+        """Update the legal moves of the current player of each game."""
+        self.moves = batch_legal_moves(*self.get_player_bitboards())
+
+    def play_moves(
+            self, squares: ndarray[Any, dtype[np.int64]]
+    ) -> ndarray[Any, dtype[np.uint64]]:
+        """Play a legal move in each game that is not over.
+
+        Args:
+            squares (ndarray[Any, dtype[np.int64]]): square index of the move of each
+            game, `PASS_SQUARE` for a pass, ignored for games that are over.
+
+        Returns:
+            ndarray[Any, dtype[np.uint64]]: bitboards of the flipped pieces.
+        """
+        playing = ~self.is_over & (squares != PASS_SQUARE)
+        moves = np.where(
+            playing,
+            np.uint64(1) << np.where(playing, squares, 0).astype(np.uint64),
+            np.uint64(0),
+        )
+
+        player, opponent = self.get_player_bitboards()
+        flipped = batch_flipped_pieces(player, opponent, moves)
+
+        player |= flipped | moves
+        opponent &= ~flipped
+
+        is_black = self.player_value == BLACK_VALUE
+        self.black = np.where(is_black, player, opponent)
+        self.white = np.where(is_black, opponent, player)
+
+        self.next_player_turn()
+
+        return flipped
+
+    def next_player_turn(self) -> None:
+        """Update the next player value or declare the game over, for each game."""
+        active = ~self.is_over
+
+        self.player_value = np.where(active, -self.player_value, self.player_value)
+        self.update_moves()
+
+        # Check for skipping turn
+        passing = active & (self.moves == 0)
+        if passing.any():
+            self.player_value = np.where(
+                passing, -self.player_value, self.player_value
+            )
+            self.update_moves()
+
+            # Neither player has legal moves left
+            self.is_over |= passing & (self.moves == 0)
+
+    def get_random_moves(
+            self, rng: np.random.Generator
+    ) -> ndarray[Any, dtype[np.int64]]:
+        """Pick a random legal move for each game.
+
+        Args:
+            rng (np.random.Generator): random number generator.
+
+        Returns:
+            ndarray[Any, dtype[np.int64]]: square index of the move of each game, -1
+            for games that are over, `PASS_SQUARE` for games whose player has no
+            legal moves.
+        """
+        legal = bitboards_to_squares(self.moves)
+        scores = rng.random(legal.shape) * legal
+
+        # Only a position set by `set_position()` may leave a player without moves
+        squares = np.where(self.moves == 0, PASS_SQUARE, np.argmax(scores, axis=1))
+
+        return np.where(self.is_over, -1, squares)
+
+    def set_position(
+            self, boards: ndarray[Any, dtype[Any]], to_play: ndarray[Any, dtype[Any]]
+    ) -> None:
+        """Set the board positions and update the legal moves for the players to play.
+
+        Players without legal moves are left to play, they pass with `PASS_SQUARE`.
+        Games where neither player can move are over.
+
+        Args:
+            boards (ndarray[Any, dtype[Any]]): board positions of shape (N, 8, 8).
+            to_play (ndarray[Any, dtype[Any]]): value of the player to play of each
+            game.
+        """
+        # Square indices are column-major
+        squares = np.asarray(boards).transpose(0, 2, 1).reshape(-1, SQUARE_COUNT)
+
+        self.size = len(squares)
+        self.black = squares_to_bitboards(squares == BLACK_VALUE)
+        self.white = squares_to_bitboards(squares == WHITE_VALUE)
+        self.player_value = np.asarray(to_play, dtype=np.int8)
+        self.update_moves()
+
+        player, opponent = self.get_player_bitboards()
+        self.is_over = (self.moves == 0) & (batch_legal_moves(opponent, player) == 0)
+
+    def get_legal_moves_count(self) -> ndarray[Any, dtype[np.int64]]:
+        """Returns the number of legal moves of the current player of each game.
+
+        Returns:
+            ndarray[Any, dtype[np.int64]]: number of legal moves.
+        """
+        return popcount(self.moves)
+
+    def get_black_piece_count(self) -> ndarray[Any, dtype[np.int64]]:
+        """Return the number of black pieces on each board.
+
+        Returns:
+            ndarray[Any, dtype[np.int64]]: number of black pieces.
+        """
+        return popcount(self.black)
+
+    def get_white_piece_count(self) -> ndarray[Any, dtype[np.int64]]:
+        """Return the number of white pieces on each board.
+
+        Returns:
+            ndarray[Any, dtype[np.int64]]: number of white pieces.
+        """
+        return popcount(self.white)
+
+    def get_winner(self) -> ndarray[Any, dtype[np.int64]]:
+        """Return the value of the player who won each game.
+
+        Returns:
+            ndarray[Any, dtype[np.int64]]: value of the player who won each game, 0
+            if drawn.
+        """
+        difference = self.get_black_piece_count() - self.get_white_piece_count()
+
+        return np.where(
+            difference > 0,
+            BLACK_VALUE,
+            np.where(difference < 0, WHITE_VALUE, 0),
+        )
@@ -0,0 +1,638 @@
+from textwrap import wrap
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy import ndarray, dtype
+
+from othellia.game import Game, MoveRecord
+from othellia.zobrist import (
+    FLIP_BYTE_KEYS,
+    PIECE_KEYS,
+    SIDE_KEY,
+    compute_bitboard_hash,
+    hash_bitboard,
+)
+from settings.board import BOARD_CELL_LENGTH
+from settings.directions import DIRECTIONS
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import (
+    cell_index_to_square,
+    notation_to_cell_index,
+    square_to_cell_index,
+)
+
+# A bitboard is a 64-bit integer where the bit `col * 8 + row` is set when the
+# corresponding cell is occupied (see `utils.game.cell_index_to_square`).
+FULL_MASK: int = (1 << 64) - 1
+
+FIRST_ROW_MASK: int = sum(1 << (col * 8) for col in range(BOARD_CELL_LENGTH))
+LAST_ROW_MASK: int = FIRST_ROW_MASK << (BOARD_CELL_LENGTH - 1)
+
+
+def _direction_shift(direction: tuple[int, int]) -> tuple[int, int, int]:
+    """Return the left shift, right shift and wrapping mask moving every bit of a
+    bitboard one cell toward a direction.
+
+    Args:
+        direction (tuple[int, int]): direction of the shift.
+
+    Returns:
+        tuple[int, int, int]: left shift, right shift and mask.
+    """
+    dx, dy = direction
+    amount = dx * BOARD_CELL_LENGTH + dy
+
+    mask = FULL_MASK
+    if dy == 1:
+        # Bits leaving the last row must not reappear on the next column first row
+        mask &= ~FIRST_ROW_MASK
+    elif dy == -1:
+        mask &= ~LAST_ROW_MASK
+
+    return max(amount, 0), max(-amount, 0), mask
+
+
+SHIFTS: tuple[tuple[int, int, int], ...] = tuple(
+    _direction_shift(direction) for direction in DIRECTIONS
+)
+
+
+def legal_moves(player: int, opponent: int) -> int:
+    """Return the bitboard of the legal moves of a player.
+
+    Args:
+        player (int): bitboard of the player's pieces.
+        opponent (int): bitboard of the opponent's pieces.
+
+    Returns:
+        int: bitboard of the legal moves.
+    """
+    empty = ~(player | opponent) & FULL_MASK
+    moves = 0
+
+    for left, right, mask in SHIFTS:
+        opponent_mask = opponent & mask
+
+        # Follow the opponent's pieces adjacent to the player's ones
+        candidates = (player << left >> right) & opponent_mask
+        for _ in range(BOARD_CELL_LENGTH - 3):
+            candidates |= (candidates << left >> right) & opponent_mask
+
+        moves |= (candidates << left >> right) & mask & empty
+
+    return moves
+
+
+def flipped_pieces(player: int, opponent: int, square: int) -> int:
+    """Return the bitboard of the opponent's pieces flipped by a move.
+
+    Args:
+        player (int): bitboard of the player's pieces.
+        opponent (int): bitboard of the opponent's pieces.
+        square (int): square index of the move.
+
+    Returns:
+        int: bitboard of the flipped pieces.
+    """
+    move = 1 << square
+    flipped = 0
+
+    for left, right, mask in SHIFTS:
+        sandwich = 0
+        cursor = (move << left >> right) & mask
+
+        while cursor & opponent:
+            sandwich |= cursor
+            cursor = (cursor << left >> right) & mask
+
+        if cursor & player:
+            flipped |= sandwich
+
+    return flipped
+
+
+def neighbors(bitboard: int) -> int:
+    """Return the bitboard of the cells adjacent to any piece of a bitboard.
+
+    Args:
+        bitboard (int): a bitboard.
+
+    Returns:
+        int: bitboard of the adjacent cells.
+    """
+    adjacent = 0
+
+    for left, right, mask in SHIFTS:
+        adjacent |= (bitboard << left >> right) & mask
+
+    return adjacent
+
+
+def bitboard_to_cell_indices(
+        bitboard: int,
+) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+    """Return the column and row of every cell set in a bitboard.
+
+    Cells are sorted by column, then row.
+
+    Args:
+        bitboard (int): a bitboard.
+
+    Returns:
+        np.ndarray[tuple[int, int], np.dtype[np.int64]]: cells column and row.
+    """
+    cells = []
+
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        cells.append(square_to_cell_index(lowest_bit.bit_length() - 1))
+        bitboard ^= lowest_bit
+
+    return np.array(cells)
+
+
+def array_to_bitboard(board: np.ndarray[Any, np.dtype[Any]], value: int) -> int:
+    """Return the bitboard of the cells of a board holding a given value.
+
+    Args:
+        board (np.ndarray[Any, np.dtype[Any]]): a board position.
+        value (int): value of the cells to select.
+
+    Returns:
+        int: bitboard of the selected cells.
+    """
+    bitboard = 0
+
+    # Transposing the board makes the flat indices match the square indices
+    for square in np.flatnonzero(np.asarray(board).T == value):
+        bitboard |= 1 << int(square)
+
+    return bitboard
+
+
+class Position(NamedTuple):
+    """Compact position, cheap to send to another process."""
+    black: int
+    white: int
+    player_value: int
+
+
+class BitboardGame:
+    """Class gathering all the game's behaviours, storing the board as one bitboard
+    per player.
+
+    It exposes the same public interface as `othellia.game.Game`, which remains the
+    reference implementation.
+    """
+    player_value: int
+    is_over: bool
+    black: int
+    white: int
+    moves: int
+
+    # Legal moves bitboard of each player in the current position, generated on
+    # demand
+    mobility_cache: dict[int, int]
+
+    def __init__(self) -> None:
+        self.reset_game()
+
+    @property
+    def board(self) -> ndarray[Any, dtype[Any]]:
+        """Board position as an array of piece values, indexed by row and column.
+
+        The array is built on demand, modifying it does not change the game.
+        """
+        squares = np.arange(BOARD_CELL_LENGTH ** 2, dtype=np.uint64)
+
+        black = (np.uint64(self.black) >> squares) & np.uint64(1)
+        white = (np.uint64(self.white) >> squares) & np.uint64(1)
+
+        board = black.astype(int) * BLACK_VALUE + white.astype(int) * WHITE_VALUE
+
+        return np.array(board.reshape(BOARD_CELL_LENGTH, BOARD_CELL_LENGTH).T)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the position and player to play."""
+        return self._zobrist_hash
+
+    @property
+    def indicators(self) -> ndarray[Any, dtype[Any]]:
+        """Column and row of the current player's legal moves."""
+        return bitboard_to_cell_indices(self.moves)
+
+    def reset_game(self) -> None:
+        """Reset the game board into initial configuration."""
+        self.white = (1 << cell_index_to_square((3, 3))) | (
+            1 << cell_index_to_square((4, 4))
+        )
+        self.black = (1 << cell_index_to_square((4, 3))) | (
+            1 << cell_index_to_square((3, 4))
+        )
+
+        self.player_value = BLACK_VALUE
+        self.update_moves()
+        self.mobility_cache = {}
+        self.update_zobrist_hash()
+
+        self.is_over = False
+
+    def get_player_bitboards(self) -> tuple[int, int]:
+        """Return the bitboards of the current player and its opponent.
+
+        Returns:
+            tuple[int, int]: player's and opponent's bitboards.
+        """
+        if self.player_value == BLACK_VALUE:
+            return self.black, self.white
+
+        return self.white, self.black
+
+    def update_moves(self) -> None:
+        """Update the legal moves of the current player."""
+        self.moves = legal_moves(*self.get_player_bitboards())
+
+    def is_cell_empty(self, cell_index: tuple[int, int]) -> bool:
+        """Check if a cell doesn't contain  a piece.
+
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+
+        Returns:
+            bool: non-presence of a piece.
+        """
+        square = cell_index_to_square(cell_index)
+
+        return not (self.black | self.white) >> square & 1
+
+    def play_piece(self, cell_index: tuple[int, int]) -> None:
+        """Play a piece in a cell and update the board according.
+
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+        """
+        self.make_move(cell_index)
+
+    def make_move(self, cell_index: tuple[int, int]) -> MoveRecord:
+        """Play a piece in a cell and return the record needed to undo it.
+
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+
+        Returns:
+            MoveRecord: record of the move.
+        """
+        col, row = cell_index
+        square = cell_index_to_square(cell_index)
+        player, opponent = self.get_player_bitboards()
+
+        flipped = flipped_pieces(player, opponent, square)
+        record = MoveRecord(
+            (int(col), int(row)),
+            flipped,
+            self.player_value,
+            self.is_over,
+            (self.moves, self.mobility_cache),
+        )
+
+        player |= flipped | (1 << square)
+        opponent &= ~flipped
+
+        if self.player_value == BLACK_VALUE:
+            self.black, self.white = player, opponent
+        else:
+            self.white, self.black = player, opponent
+
+        self.mobility_cache = {}
+        self._zobrist_hash ^= PIECE_KEYS[record.player_value][square] ^ hash_bitboard(
+            flipped, FLIP_BYTE_KEYS
+        )
+
+        self.next_player_turn()
+
+        if self.player_value != record.player_value:
+            self._zobrist_hash ^= SIDE_KEY
+
+        return record
+
+    def unmake_move(self, record: MoveRecord) -> None:
+        """Undo a move played with `make_move()`.
+
+        Args:
+            record (MoveRecord): record of the move.
+        """
+        square = cell_index_to_square(record.cell_index)
+        placed = 1 << square
+
+        if record.player_value == BLACK_VALUE:
+            self.black &= ~(record.flipped | placed)
+            self.white |= record.flipped
+        else:
+            self.white &= ~(record.flipped | placed)
+            self.black |= record.flipped
+
+        self._zobrist_hash ^= PIECE_KEYS[record.player_value][square] ^ hash_bitboard(
+            record.flipped, FLIP_BYTE_KEYS
+        )
+        if self.player_value != record.player_value:
+            self._zobrist_hash ^= SIDE_KEY
+
+        self.player_value = record.player_value
+        self.is_over = record.is_over
+        self.moves, self.mobility_cache = record.cache
+
+    def is_move_legal(self, cell_index: tuple[int, int]) -> bool:
+        """Ensure if a move is legal according to the current state of
+        the board.
+
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+
+        Returns:
+            bool: Legality of the move.
+        """
+        col, row = cell_index
+        if not (0 <= col < BOARD_CELL_LENGTH and 0 <= row < BOARD_CELL_LENGTH):
+            return False
+
+        return bool(self.moves >> cell_index_to_square(cell_index) & 1)
+
+    def is_player_able_to_play(self) -> bool:
+        """Check if a player has legal moves to play.
+
+        Returns:
+            bool : whether the player is able to play.
+        """
+        return self.moves != 0
+
+    def get_all_non_empty_cells(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all non-empty cells on the board.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cells column and row.
+        """
+        return bitboard_to_cell_indices(self.black | self.white)
+
+    def get_all_black_cells(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all black cells on the board.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cells column and row.
+        """
+        return bitboard_to_cell_indices(self.black)
+
+    def get_all_white_cells(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all white cells on the board.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cells column and row.
+        """
+        return bitboard_to_cell_indices(self.white)
+
+    def get_black_piece_count(self) -> int:
+        """Return the number of black pieces on the board.
+
+        Returns:
+            int: number of black pieces.
+        """
+        return self.black.bit_count()
+
+    def get_white_piece_count(self) -> int:
+        """Return the number of white pieces on the board.
+
+        Returns:
+            int: number of white pieces.
+        """
+        return self.white.bit_count()
+
+    def get_winner(self) -> int:
+        """Return the value of the player who won the game.
+
+        Returns:
+            int: value of the player who won the game, 0 if drawn.
+        """
+        black_piece_count = self.get_black_piece_count()
+        white_piece_count = self.get_white_piece_count()
+
+        # Draw
+        if black_piece_count == white_piece_count:
+            return 0
+
+        return (
+            BLACK_VALUE
+            if black_piece_count > white_piece_count
+            else WHITE_VALUE
+        )
+
+    def next_player_turn(self) -> None:
+        """Update the next player value or declare the game over."""
+        self.player_value *= -1
+        self.update_moves()
+
+        # Check for skipping turn
+        if not self.is_player_able_to_play():
+            self.player_value *= -1
+            self.update_moves()
+
+            if not self.is_player_able_to_play():
+                # Neither player has legal moves left
+                self.is_over = True
+
+    def load_transcript(self, transcript: str) -> None:
+        """Play each player move from a match transcription.
+
+        Args:
+            transcript (str): sequence of moves.
+        """
+        for move in wrap(transcript, 2):
+            self.play_piece(notation_to_cell_index(move))
+
+    def set_position(
+            self, board: np.ndarray[Any, np.dtype[np.int64]], to_play: int
+    ) -> None:
+        """Set a board position and update the legal moves for a player to play.
+
+        Args:
+            board (np.ndarray[Any, np.dtype[np.int64]]): a board position.
+            to_play (int): value of the player to play.
+        """
+        self.set_bitboards(
+            array_to_bitboard(board, BLACK_VALUE),
+            array_to_bitboard(board, WHITE_VALUE),
+            to_play,
+        )
+
+    def set_bitboards(self, black: int, white: int, to_play: int) -> None:
+        """Set a position from bitboards and update the legal moves for a player to
+        play.
+
+        Args:
+            black (int): bitboard of black pieces.
+            white (int): bitboard of white pieces.
+            to_play (int): value of the player to play.
+        """
+        self.black = black
+        self.white = white
+        self.player_value = to_play
+
+        self.update_moves()
+        self.mobility_cache = {}
+        self.update_zobrist_hash()
+
+    def update_zobrist_hash(self) -> None:
+        """Compute the hash of the position from scratch, `play_piece()` keeps it up to
+        date afterwards."""
+        self._zobrist_hash = compute_bitboard_hash(
+            self.black, self.white, self.player_value
+        )
+
+    def get_legal_moves_bitboard(self, player_value: int) -> int:
+        """Return the bitboard of the legal moves of a player, whoever's turn it is.
+
+        The moves are cached until the position changes, the game is left untouched.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            int: bitboard of the legal moves.
+        """
+        if player_value not in self.mobility_cache:
+            if player_value == self.player_value:
+                moves = self.moves
+            elif player_value == BLACK_VALUE:
+                moves = legal_moves(self.black, self.white)
+            else:
+                moves = legal_moves(self.white, self.black)
+
+            self.mobility_cache[player_value] = moves
+
+        return self.mobility_cache[player_value]
+
+    def get_legal_moves(
+            self, player_value: int
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all the possible moves of a player, whoever's turn it is.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
+        """
+        return bitboard_to_cell_indices(self.get_legal_moves_bitboard(player_value))
+
+    def get_legal_moves_count(self, player_value: int) -> int:
+        """Returns the number of legal moves of a player, whoever's turn it is.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            int: number of legal moves.
+        """
+        return self.get_legal_moves_bitboard(player_value).bit_count()
+
+    def get_black_legal_moves(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all black possible moves to play.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
+        """
+        return self.get_legal_moves(BLACK_VALUE)
+
+    def get_white_legal_moves(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all white possible moves to play.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
+        """
+        return self.get_legal_moves(WHITE_VALUE)
+
+    def get_black_legal_moves_count(self) -> int:
+        """Returns the number of black's legal moves.
+
+        Returns:
+            int: number of legal moves.
+        """
+        return self.get_legal_moves_count(BLACK_VALUE)
+
+    def get_white_legal_moves_count(self) -> int:
+        """Returns the number of white's legal moves.
+
+        Returns:
+            int: number of legal moves.
+        """
+        return self.get_legal_moves_count(WHITE_VALUE)
+
+    def get_black_empty_neighbors_count(self) -> int:
+        """Returns the number of empty cells next to black's pieces.
+
+        Returns:
+            int: number of empty cells.
+        """
+        empty = ~(self.black | self.white) & FULL_MASK
+
+        return (neighbors(self.black) & empty).bit_count()
+
+    def get_white_empty_neighbors_count(self) -> int:
+        """Returns the number of empty cells next to white's pieces.
+
+        Returns:
+            int: number of empty cells.
+        """
+        empty = ~(self.black | self.white) & FULL_MASK
+
+        return (neighbors(self.white) & empty).bit_count()
+
+
+# Any board backend exposing the game's public interface
+AnyGame = Game | BitboardGame
+
+
+def get_position(game: AnyGame) -> Position:
+    """Return the compact position of a game.
+
+    Args:
+        game (AnyGame): a game.
+
+    Returns:
+        Position: bitboards and player to play.
+    """
+    if isinstance(game, BitboardGame):
+        return Position(game.black, game.white, game.player_value)
+
+    return Position(
+        array_to_bitboard(game.board, BLACK_VALUE),
+        array_to_bitboard(game.board, WHITE_VALUE),
+        game.player_value,
+    )
+
+
+def position_to_game(position: Position) -> BitboardGame:
+    """Create a game from a compact position.
+
+    Args:
+        position (Position): bitboards and player to play.
+
+    Returns:
+        BitboardGame: game in the position.
+    """
+    game = BitboardGame()
+    game.set_bitboards(*position)
+
+    return game
@@ -0,0 +1,208 @@
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from typing import Callable, cast
+
+from othellia.bitboard import (
+    AnyGame,
+    BitboardGame,
+    Position,
+    get_position,
+    position_to_game,
+)
+from othellia.minimax import search_root
+from othellia.move_ordering import MoveOrdering
+from othellia.opening_book import OpeningBook, get_canonical_key
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.symmetry import remove_symmetric_moves
+
+# Plies from the start position of the deepest book positions, and depth of their
+# searches
+BOOK_PLY: int = 5
+BOOK_DEPTH: int = 6
+
+# Memory used by the transposition table of each book search
+BOOK_TRANSPOSITION_TABLE_MB: float = 16
+
+# Positions searched between two saves of a book being built
+BOOK_SAVE_INTERVAL: int = 16
+
+
+def get_book_positions(ply: int) -> list[Position]:
+    """Return the positions reached from the start position in at most `ply` moves,
+    a single one per symmetry class.
+
+    Args:
+        ply (int): number of moves from the start position.
+
+    Returns:
+        list[Position]: compact positions, which are not over, by number of moves.
+    """
+    game = BitboardGame()
+    positions = [get_position(game)]
+    seen = {get_canonical_key(game)[0]}
+    frontier = list(positions)
+
+    for _ in range(ply):
+        next_frontier = []
+
+        for position in frontier:
+            game = position_to_game(position)
+
+            for move in game.indicators:
+                record = game.make_move(move)
+                key, _ = get_canonical_key(game)
+
+                if not game.is_over and key not in seen:
+                    seen.add(key)
+                    next_frontier.append(get_position(game))
+
+                game.unmake_move(record)
+
+        positions.extend(next_frontier)
+        frontier = next_frontier
+
+    return positions
+
+
+def search_book_position(
+        position: Position,
+        depth: int,
+        static_evaluation_func: Callable[[AnyGame], float],
+        evaluation_weights: tuple[float, ...],
+) -> tuple[Position, tuple[int, int], float]:
+    """Search the best move of a book position, possibly in a worker process.
+
+    Args:
+        position (Position): compact position.
+        depth (int): depth of the search below the moves, see `think()`.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        evaluation_weights (tuple[float, ...]): weights of
+        `StaticEvaluation.evaluate()` in the main process.
+
+    Returns:
+        tuple[Position, tuple[int, int], float]: searched position, column and row
+        of its best move and its score.
+    """
+    StaticEvaluation.set_evaluation_weights(
+        cast(tuple[float, float, float, float, float, float], evaluation_weights)
+    )
+
+    game = position_to_game(position)
+    transposition_table = TranspositionTable(BOOK_TRANSPOSITION_TABLE_MB)
+    move_ordering = MoveOrdering()
+    legal_moves = remove_symmetric_moves(game.board, game.indicators)
+
+    # Shallower searches fill the table, sorting the moves of the deeper ones
+    for current_depth in range(depth + 1):
+        move, score = search_root(
+            game,
+            legal_moves,
+            current_depth,
+            static_evaluation_func,
+            transposition_table,
+            move_ordering=move_ordering,
+        )
+
+    return position, (int(move[0]), int(move[1])), score
+
+
+def build_book(
+        book: OpeningBook,
+        ply: int,
+        depth: int,
+        static_evaluation_func: Callable[[AnyGame], float],
+        executor: Executor | None = None,
+        path: str | None = None,
+        save_interval: int = BOOK_SAVE_INTERVAL,
+        progress: bool = False,
+) -> None:
+    """Search the positions to a ply missing from a book, or searched less deep, and
+    add them to it.
+
+    The book is saved as the searches complete, so that an interrupted build resumes
+    where it stopped, and a book of a lower ply is extended.
+
+    Args:
+        book (OpeningBook): book the positions are added to.
+        ply (int): number of moves from the start position of the deepest positions.
+        depth (int): depth of the searches below the moves, see `think()`.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function, which must be picklable with an executor.
+        executor (Executor | None, optional): worker processes the positions are
+        searched in. Defaults to None.
+        path (str | None, optional): path the book is saved to, never if None.
+        Defaults to None.
+        save_interval (int, optional): number of positions searched between saves.
+        Defaults to `BOOK_SAVE_INTERVAL`.
+        progress (bool, optional): if the progress is printed. Defaults to False.
+    """
+    positions = []
+
+    for position in get_book_positions(ply):
+        entry = book.get_entry(position_to_game(position))
+        if entry is None or entry.depth < depth:
+            positions.append(position)
+
+    # Weights may be set from a chromosome array
+    evaluation_weights = tuple(map(float, StaticEvaluation.evaluation_weights))
+    args = (depth, static_evaluation_func, evaluation_weights)
+
+    futures: list[Future[tuple[Position, tuple[int, int], float]]] = []
+
+    if executor is None:
+        results = (search_book_position(position, *args) for position in positions)
+    else:
+        futures = [
+            executor.submit(search_book_position, position, *args)
+            for position in positions
+        ]
+        results = (future.result() for future in as_completed(futures))
+
+    start = time.perf_counter()
+
+    try:
+        for index, (position, move, score) in enumerate(results, 1):
+            book.add(position_to_game(position), move, depth, score)
+
+            if path is not None and (
+                index % save_interval == 0 or index == len(positions)
+            ):
+                book.save(path)
+
+            if progress:
+                print(
+                    f"{index}/{len(positions)} positions  "
+                    f"{time.perf_counter() - start:7.1f}s",
+                    flush=True,
+                )
+    finally:
+        # An interrupted build does not wait for the remaining searches
+        for future in futures:
+            future.cancel()
+
+
+if __name__ == "__main__":
+    # Usage: python -m othellia.book_builder
+    StaticEvaluation.load_evaluation_weights()
+
+    # Resume the previous build
+    if os.path.exists(OpeningBook.book_path):
+        opening_book = OpeningBook.load()
+    else:
+        opening_book = OpeningBook()
+
+    with ProcessPoolExecutor() as process_executor:
+        build_book(
+            opening_book,
+            BOOK_PLY,
+            BOOK_DEPTH,
+            StaticEvaluation.evaluate,
+            process_executor,
+            OpeningBook.book_path,
+            progress=True,
+        )
+
+    print(f"{len(opening_book)} positions in the book")
@@ -0,0 +1,142 @@
+import time
+from typing import Callable
+
+import numpy as np
+
+from othellia.bitboard import AnyGame, BitboardGame
+from othellia.minimax import negamax
+from othellia.move_ordering import MoveOrdering
+from othellia.probcut import PROBCUT_DEPTHS, MultiProbCut
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from settings.board import BOARD_CELL_LENGTH
+
+# Self-play games the calibration positions are taken from, and number of
+# positions kept
+CALIBRATION_GAME_COUNT: int = 8
+CALIBRATION_POSITION_COUNT: int = 240
+CALIBRATION_SEED: int = 20240607
+
+
+def generate_positions(
+        game_count: int,
+        rng: np.random.Generator,
+        random_move_rate: float = 0.2,
+) -> list[BitboardGame]:
+    """Play self-play games and return all their positions.
+
+    Each player plays the move with the best evaluation after it, or a random move
+    now and then so that the games differ.
+
+    Args:
+        game_count (int): number of games.
+        rng (np.random.Generator): random generator.
+        random_move_rate (float, optional): probability of a random move. Defaults
+        to 0.2.
+
+    Returns:
+        list[BitboardGame]: positions, which are not over.
+    """
+    positions = []
+
+    for _ in range(game_count):
+        game = BitboardGame()
+
+        while not game.is_over:
+            positions.append(BitboardGame())
+            positions[-1].set_bitboards(game.black, game.white, game.player_value)
+
+            moves = game.indicators
+
+            if rng.random() < random_move_rate:
+                move = moves[rng.integers(len(moves))]
+            else:
+                scores = []
+                for candidate in moves:
+                    record = game.make_move(candidate)
+                    scores.append(
+                        record.player_value * StaticEvaluation.evaluate(game)
+                    )
+                    game.unmake_move(record)
+
+                move = moves[int(np.argmax(scores))]
+
+            game.play_piece(tuple(move))
+
+    return positions
+
+
+def calibrate(
+        positions: list[BitboardGame],
+        static_evaluation_func: Callable[[AnyGame], float],
+        max_depth: int = max(PROBCUT_DEPTHS),
+        progress: bool = False,
+) -> MultiProbCut:
+    """Search calibration positions at every depth and fit the regressions.
+
+    Args:
+        positions (list[BitboardGame]): calibration positions.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        max_depth (int, optional): depth of the deepest search. Defaults to the
+        deepest pruned depth.
+        progress (bool, optional): if the progress is printed. Defaults to False.
+
+    Returns:
+        MultiProbCut: fitted parameters.
+    """
+    scores = np.zeros((len(positions), max_depth + 1))
+    start = time.perf_counter()
+
+    for index, game in enumerate(positions):
+        transposition_table = TranspositionTable(4)
+        move_ordering = MoveOrdering()
+
+        for depth in range(max_depth + 1):
+            scores[index, depth] = negamax(
+                game,
+                depth,
+                -np.inf,
+                np.inf,
+                static_evaluation_func,
+                transposition_table,
+                move_ordering=move_ordering,
+            )
+
+        if progress:
+            print(
+                f"{index + 1}/{len(positions)} positions  "
+                f"{time.perf_counter() - start:7.1f}s",
+                flush=True,
+            )
+
+    empty_counts = [
+        BOARD_CELL_LENGTH ** 2 - game.get_black_piece_count()
+        - game.get_white_piece_count()
+        for game in positions
+    ]
+
+    multi_probcut = MultiProbCut()
+    multi_probcut.fit(scores, empty_counts)
+
+    return multi_probcut
+
+
+if __name__ == "__main__":
+    # Usage: python -m othellia.calibration
+    StaticEvaluation.load_evaluation_weights()
+    rng = np.random.default_rng(CALIBRATION_SEED)
+
+    positions = generate_positions(CALIBRATION_GAME_COUNT, rng)
+    positions = [
+        positions[index]
+        for index in sorted(
+            rng.choice(len(positions), CALIBRATION_POSITION_COUNT, replace=False)
+        )
+    ]
+
+    multi_probcut = calibrate(positions, StaticEvaluation.evaluate, progress=True)
+    multi_probcut.save()
+
+    for (phase, depth), parameters in sorted(multi_probcut.parameters.items()):
+        print(f"phase {phase} depth {depth}: {parameters}")
@@ -0,0 +1,342 @@
+import time
+from typing import Any
+
+from othellia.bitboard import (
+    FULL_MASK,
+    AnyGame,
+    flipped_pieces,
+    get_position,
+    legal_moves,
+)
+from settings.board import BOARD_CELL_LENGTH
+from settings.values import BLACK_VALUE
+from utils.game import square_to_cell_index
+
+# Empty cells from which `think()` can solve the game instead of evaluating it
+ENDGAME_EMPTIES: int = 12
+
+# Above this many empty cells, moves are sorted by the opponent's mobility after
+# them (fastest first), below it by parity only, sorting being too slow for the
+# nodes it saves
+FASTEST_FIRST_EMPTIES: int = 6
+
+# Bitboards of the four quadrants of the board, the regions of the parity ordering
+QUADRANT_MASKS: tuple[int, ...] = tuple(
+    sum(
+        1 << (col * BOARD_CELL_LENGTH + row)
+        for col in range(BOARD_CELL_LENGTH)
+        for row in range(BOARD_CELL_LENGTH)
+        if (col < BOARD_CELL_LENGTH // 2, row < BOARD_CELL_LENGTH // 2) == quadrant
+    )
+    for quadrant in ((True, True), (True, False), (False, True), (False, False))
+)
+
+
+class SolverTimeout(Exception):
+    """Raised by `EndgameSolver` when the search deadline is passed, or when the
+    search is told to stop."""
+
+
+def get_final_score(player: int, opponent: int) -> int:
+    """Return the disc difference of a finished game.
+
+    Args:
+        player (int): bitboard of the player's pieces.
+        opponent (int): bitboard of the opponent's pieces.
+
+    Returns:
+        int: player's pieces minus opponent's pieces.
+    """
+    return player.bit_count() - opponent.bit_count()
+
+
+def get_squares(bitboard: int) -> list[int]:
+    """Return the square index of every cell set in a bitboard.
+
+    Args:
+        bitboard (int): a bitboard.
+
+    Returns:
+        list[int]: square indices, in increasing order.
+    """
+    squares = []
+
+    while bitboard:
+        lowest_bit = bitboard & -bitboard
+        squares.append(lowest_bit.bit_length() - 1)
+        bitboard ^= lowest_bit
+
+    return squares
+
+
+class EndgameSolver:
+    """Class searching a position until the end of the game, scoring it by the exact
+    disc difference instead of the static evaluation.
+
+    Searching with the window (-1, 1) only tells whether the game is won, lost or
+    drawn, which is much faster.
+    """
+    node_count: int
+    deadline: float | None
+    fastest_first_empties: int
+    stop_flag: Any
+
+    def __init__(
+            self,
+            deadline: float | None = None,
+            fastest_first_empties: int = FASTEST_FIRST_EMPTIES,
+            stop_flag: Any = None,
+    ) -> None:
+        """
+        Args:
+            deadline (float | None, optional): `time.perf_counter()` value after
+            which the search is abandoned. Defaults to None.
+            fastest_first_empties (int, optional): number of empty cells above which
+            moves are sorted fastest first. Defaults to `FASTEST_FIRST_EMPTIES`.
+            stop_flag (Any, optional): flag with a boolean `value` abandoning the
+            search when set. Defaults to None.
+        """
+        self.node_count = 0
+        self.deadline = deadline
+        self.fastest_first_empties = fastest_first_empties
+        self.stop_flag = stop_flag
+
+    def solve_move(
+            self, game: AnyGame, exact: bool = True
+    ) -> tuple[tuple[int, int], int]:
+        """Return the best move of a game and its score.
+
+        Args:
+            game (AnyGame): a game, which is not over.
+            exact (bool, optional): if the exact disc difference is searched, else
+            only the win, loss or draw. Defaults to True.
+
+        Raises:
+            SolverTimeout: when the deadline is passed or the search is stopped.
+
+        Returns:
+            tuple[tuple[int, int], int]: column and row of the best move, and its
+            score from the point of view of the player to play: the disc difference
+            at the end of the game, or only its sign if not exact.
+        """
+        black, white, player_value = get_position(game)
+        player, opponent = (
+            (black, white) if player_value == BLACK_VALUE else (white, black)
+        )
+
+        alpha, beta = (-BOARD_CELL_LENGTH ** 2, BOARD_CELL_LENGTH ** 2)
+        if not exact:
+            alpha, beta = -1, 1
+
+        empty = ~(player | opponent) & FULL_MASK
+        moves = self.order_moves(player, opponent, legal_moves(player, opponent), empty)
+        best_square = moves[0][0]
+        best_score = alpha
+
+        for square, flipped in moves:
+            score = -self.solve(
+                opponent ^ flipped,
+                player | flipped | (1 << square),
+                -beta,
+                -alpha,
+            )
+
+            if score > best_score or square == best_square:
+                best_score = score
+                best_square = square
+
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if not exact:
+            best_score = (best_score > 0) - (best_score < 0)
+
+        return square_to_cell_index(best_square), best_score
+
+    def solve(
+            self, player: int, opponent: int, alpha: int, beta: int, passed: bool = False
+    ) -> int:
+        """Return the disc difference at the end of the game if both players play
+        perfectly.
+
+        Args:
+            player (int): bitboard of the pieces of the player to play.
+            opponent (int): bitboard of the opponent's pieces.
+            alpha (int): alpha parameter of pruning.
+            beta (int): beta parameter of pruning.
+            passed (bool, optional): if the opponent has just passed. Defaults to
+            False.
+
+        Raises:
+            SolverTimeout: when the deadline is passed or the search is stopped.
+
+        Returns:
+            int: final disc difference from the point of view of the player, a bound
+            when outside of the window.
+        """
+        self.node_count += 1
+
+        empty = ~(player | opponent) & FULL_MASK
+        empty_count = empty.bit_count()
+
+        if empty_count == 2:
+            return self.solve_last_2(player, opponent, beta, empty)
+
+        if empty_count == 1:
+            return self.solve_last_1(player, opponent, empty.bit_length() - 1)
+
+        if empty_count == 0:
+            return get_final_score(player, opponent)
+
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SolverTimeout
+
+        if self.stop_flag is not None and self.stop_flag.value:
+            raise SolverTimeout
+
+        moves = legal_moves(player, opponent)
+
+        if not moves:
+            if passed:
+                return get_final_score(player, opponent)
+
+            return -self.solve(opponent, player, -beta, -alpha, True)
+
+        best_score = -BOARD_CELL_LENGTH ** 2
+
+        for square, flipped in self.order_moves(player, opponent, moves, empty):
+            score = -self.solve(
+                opponent ^ flipped,
+                player | flipped | (1 << square),
+                -beta,
+                -alpha,
+            )
+
+            if score > best_score:
+                best_score = score
+
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        return best_score
+
+    def solve_last_2(self, player: int, opponent: int, beta: int, empty: int) -> int:
+        """Return the final disc difference with two empty cells left, without the
+        generic move generation.
+
+        Args:
+            player (int): bitboard of the pieces of the player to play.
+            opponent (int): bitboard of the opponent's pieces.
+            beta (int): beta parameter of pruning.
+            empty (int): bitboard of the two empty cells.
+
+        Returns:
+            int: final disc difference from the point of view of the player.
+        """
+        first = (empty & -empty).bit_length() - 1
+        second = empty.bit_length() - 1
+        best_score: int | None = None
+
+        for square, last in ((first, second), (second, first)):
+            flipped = flipped_pieces(player, opponent, square)
+
+            if flipped:
+                score = -self.solve_last_1(
+                    opponent ^ flipped, player | flipped | (1 << square), last
+                )
+
+                if best_score is None or score > best_score:
+                    best_score = score
+                    if best_score >= beta:
+                        return best_score
+
+        if best_score is not None:
+            return best_score
+
+        # The player passes, the opponent minimizes the player's score
+        for square, last in ((first, second), (second, first)):
+            flipped = flipped_pieces(opponent, player, square)
+
+            if flipped:
+                score = self.solve_last_1(
+                    player ^ flipped, opponent | flipped | (1 << square), last
+                )
+
+                if best_score is None or score < best_score:
+                    best_score = score
+
+        if best_score is not None:
+            return best_score
+
+        return get_final_score(player, opponent)
+
+    def solve_last_1(self, player: int, opponent: int, square: int) -> int:
+        """Return the final disc difference with a single empty cell left.
+
+        Args:
+            player (int): bitboard of the pieces of the player to play.
+            opponent (int): bitboard of the opponent's pieces.
+            square (int): square index of the empty cell.
+
+        Returns:
+            int: final disc difference from the point of view of the player.
+        """
+        self.node_count += 1
+
+        flipped = flipped_pieces(player, opponent, square)
+        if flipped:
+            return get_final_score(player | flipped | (1 << square), opponent ^ flipped)
+
+        # The player passes
+        flipped = flipped_pieces(opponent, player, square)
+        if flipped:
+            return get_final_score(player ^ flipped, opponent | flipped | (1 << square))
+
+        return get_final_score(player, opponent)
+
+    def order_moves(
+            self, player: int, opponent: int, moves: int, empty: int
+    ) -> list[tuple[int, int]]:
+        """Sort the legal moves of a position, the most promising first.
+
+        Moves in regions with an odd number of empty cells come first (parity), as
+        the player moving last in a region usually gains from it. With enough empty
+        cells, moves leaving the opponent the fewest replies come first (fastest
+        first).
+
+        Args:
+            player (int): bitboard of the pieces of the player to play.
+            opponent (int): bitboard of the opponent's pieces.
+            moves (int): bitboard of the legal moves.
+            empty (int): bitboard of the empty cells.
+
+        Returns:
+            list[tuple[int, int]]: square index of the sorted moves and bitboard of
+            the pieces they flip.
+        """
+        odd_regions = 0
+        for mask in QUADRANT_MASKS:
+            if (empty & mask).bit_count() & 1:
+                odd_regions |= mask
+
+        moves_flipped = [
+            (square, flipped_pieces(player, opponent, square))
+            for square in get_squares(moves)
+        ]
+
+        if empty.bit_count() <= self.fastest_first_empties:
+            return sorted(
+                moves_flipped, key=lambda move: not (odd_regions >> move[0]) & 1
+            )
+
+        return sorted(
+            moves_flipped,
+            key=lambda move: (
+                legal_moves(opponent ^ move[1], player | move[1] | (1 << move[0]))
+                .bit_count(),
+                not (odd_regions >> move[0]) & 1,
+            ),
+        )
@@ -1,17 +1,106 @@
-from copy import deepcopy
 from textwrap import wrap
-from typing import Any
+from typing import Any, NamedTuple
 
 import numpy as np
-from numpy import ndarray, dtype, signedinteger
-# noinspection PyProtectedMember
-from numpy._typing import _64Bit
+from numpy import ndarray, dtype
 
 from settings.board import BOARD_CELL_LENGTH
 from settings.directions import DIRECTIONS
 from settings.graphics import WIDTH
 from settings.values import BLACK_VALUE, EMPTY_VALUE, WHITE_VALUE
-from utils.game import notation_to_cell_index
+from othellia.zobrist import FLIP_KEYS, PIECE_KEYS, SIDE_KEY, compute_hash
+from utils.game import (
+    cell_index_to_square,
+    notation_to_cell_index,
+    square_to_cell_index,
+)
+
+
+def compute_rays() -> tuple[tuple[tuple[int, ...], ...], ...]:
+    """Compute, for each square and direction, the flat board indices of the cells
+    met when going from the square toward the direction, up to the board's edge.
+
+    Returns:
+        tuple[tuple[tuple[int, ...], ...], ...]: flat indices, indexed by square then
+        direction index within `DIRECTIONS`.
+    """
+    rays = []
+
+    for square in range(BOARD_CELL_LENGTH ** 2):
+        col, row = square_to_cell_index(square)
+        square_rays = []
+
+        for dx, dy in DIRECTIONS:
+            ray = []
+            x, y = col + dx, row + dy
+
+            while 0 <= x < BOARD_CELL_LENGTH and 0 <= y < BOARD_CELL_LENGTH:
+                ray.append(y * BOARD_CELL_LENGTH + x)
+                x, y = x + dx, y + dy
+
+            square_rays.append(tuple(ray))
+
+        rays.append(tuple(square_rays))
+
+    return tuple(rays)
+
+
+# Empty flat board indices, for moves flipping nothing
+NO_FLIPS: ndarray[Any, dtype[np.int8]] = np.array([], dtype=np.int8)
+
+# Flat board indices toward each direction, precomputed once for every square
+RAYS: tuple[tuple[tuple[int, ...], ...], ...] = compute_rays()
+
+DIRECTION_INDICES: dict[tuple[int, int], int] = {
+    direction: i for i, direction in enumerate(DIRECTIONS)
+}
+
+
+def flat_index_to_cell_index(flat_index: int) -> tuple[int, int]:
+    """Convert an index of the flattened board into a cell column and row index.
+
+    Args:
+        flat_index (int): index within the flattened board.
+
+    Returns:
+        tuple[int, int]: column and row of the cell.
+    """
+    row, col = divmod(flat_index, BOARD_CELL_LENGTH)
+
+    return col, row
+
+
+def sandwich_length(
+        flat_board: np.ndarray[Any, np.dtype[Any]],
+        ray: tuple[int, ...],
+        player_value: int,
+) -> int:
+    """Return the number of opponent's pieces sandwiched along a ray.
+
+    Args:
+        flat_board (np.ndarray[Any, np.dtype[Any]]): flattened board.
+        ray (tuple[int, ...]): flat indices of the cells toward a direction.
+        player_value (int): value of the player to play.
+
+    Returns:
+        int: number of sandwiched pieces, 0 if there is no sandwich.
+    """
+    consecutive = 0
+
+    for flat_index in ray:
+        cell_value = flat_board[flat_index]
+
+        # Check for the end of the sandwich
+        if cell_value == player_value:
+            return consecutive
+
+        # Check if the cell has the opponent colour
+        if cell_value != -player_value:
+            return 0
+
+        consecutive += 1
+
+    return 0
 
 
 def mouse_pos_to_cell_index(pos: tuple[int, int]) -> tuple[int, int]:
@@ -29,18 +118,64 @@ def mouse_pos_to_cell_index(pos: tuple[int, int]) -> tuple[int, int]:
     return int(x // cell_size), int(y // cell_size)
 
 
+class MoveRecord(NamedTuple):
+    """Changes made by a move, allowing it to be undone."""
+    cell_index: tuple[int, int]
+    flipped: Any
+    player_value: int
+    is_over: bool
+    cache: Any
+
+
 class Game:
     """Class gathering all the game's behaviours."""
     player_value: int
     is_over: bool
-    indicators: ndarray[Any, dtype[Any]]
     surrounding_cells: ndarray[Any, dtype[Any]]
-    sandwiches: dict[str, ndarray[tuple[int, int], dtype[signedinteger[_64Bit]]]]
+    frontier: ndarray[Any, dtype[Any]]
+    neighbor_counts: dict[int, ndarray[Any, dtype[Any]]]
     board: ndarray[Any, dtype[Any]]
 
+    # Value of the player the sandwiches and indicators were generated for, None
+    # when they are outdated
+    si_player_value: int | None
+
+    # Legal moves of each player in the current position, generated on demand
+    mobility_cache: dict[int, ndarray[Any, dtype[Any]]]
+
     def __init__(self) -> None:
         self.reset_game()
 
+    @property
+    def sandwiches(self) -> dict[int, ndarray[Any, dtype[np.int8]]]:
+        """Flat board indices of the pieces flipped by each of the current player's
+        legal moves, keyed by the move's square index and generated on demand."""
+        if self.si_player_value != self.player_value:
+            self.update_sandwiches()
+
+        return self._sandwiches
+
+    @sandwiches.setter
+    def sandwiches(self, sandwiches: dict[int, ndarray[Any, dtype[np.int8]]]) -> None:
+        self._sandwiches = sandwiches
+
+    @property
+    def zobrist_hash(self) -> int:
+        """64-bit Zobrist hash of the position and player to play."""
+        return self._zobrist_hash
+
+    @property
+    def indicators(self) -> ndarray[Any, dtype[Any]]:
+        """Column and row of the current player's legal moves, generated on demand."""
+        if self.si_player_value != self.player_value:
+            self.update_sandwiches()
+
+        return self._indicators
+
+    @indicators.setter
+    def indicators(self, indicators: ndarray[Any, dtype[Any]]) -> None:
+        self._indicators = indicators
+
     def reset_game(self) -> None:
         """Reset the game board into initial configuration."""
         self.board = np.full(
@@ -54,6 +189,7 @@ class Game:
 
         self.player_value = BLACK_VALUE
         self.update_ssi()
+        self.update_zobrist_hash()
 
         self.is_over = False
 
@@ -75,14 +211,75 @@ class Game:
         Args:
             cell_index (tuple[int, int]): cell's column and row.
         """
+        self.make_move(cell_index)
+
+    def make_move(self, cell_index: tuple[int, int]) -> MoveRecord:
+        """Play a piece in a cell and return the record needed to undo it.
+
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+
+        Returns:
+            MoveRecord: record of the move.
+        """
         col, row = cell_index
-        self.board[row, col] = self.player_value
+        player_value = self.player_value
+        is_over = self.is_over
+        cache = (
+            self.surrounding_cells,
+            self.frontier.copy(),
+            self._sandwiches,
+            self._indicators,
+            self.si_player_value,
+            self.mobility_cache,
+        )
+
+        self.board[row, col] = player_value
+        self.update_neighbor_counts(cell_index, player_value, 1)
+        self._zobrist_hash ^= PIECE_KEYS[player_value][
+            cell_index_to_square(cell_index)
+        ]
 
-        self.flip_sandwiches(cell_index)
+        flipped = self.flip_sandwiches(cell_index)
+        self.update_frontier(cell_index)
+        self.si_player_value = None
+        self.mobility_cache = {}
 
         self.next_player_turn()
 
-        self.update_ssi()
+        if self.player_value != player_value:
+            self._zobrist_hash ^= SIDE_KEY
+
+        return MoveRecord((int(col), int(row)), flipped, player_value, is_over, cache)
+
+    def unmake_move(self, record: MoveRecord) -> None:
+        """Undo a move played with `make_move()`.
+
+        Args:
+            record (MoveRecord): record of the move.
+        """
+        col, row = record.cell_index
+        self.board[row, col] = EMPTY_VALUE
+        self.update_neighbor_counts(record.cell_index, record.player_value, -1)
+        self._zobrist_hash ^= PIECE_KEYS[record.player_value][
+            cell_index_to_square(record.cell_index)
+        ]
+
+        self.flip_pieces(record.flipped)
+
+        if self.player_value != record.player_value:
+            self._zobrist_hash ^= SIDE_KEY
+
+        self.player_value = record.player_value
+        self.is_over = record.is_over
+        (
+            self.surrounding_cells,
+            self.frontier,
+            self._sandwiches,
+            self._indicators,
+            self.si_player_value,
+            self.mobility_cache,
+        ) = record.cache
 
     def is_move_legal(self, cell_index: tuple[int, int]) -> bool:
         """Ensure if a move is legal according to the current state of
@@ -94,55 +291,74 @@ class Game:
         Returns:
             bool: Legality of the move.
         """
-        if np.array_equal(self.indicators, np.array([])):
+        col, row = cell_index
+        if not (0 <= col < BOARD_CELL_LENGTH and 0 <= row < BOARD_CELL_LENGTH):
             return False
 
-        return bool(np.any(np.all(self.indicators == cell_index, axis=1)))
+        return cell_index_to_square(cell_index) in self.sandwiches
 
     def update_sandwiches(self) -> None:
-        """Find all the sandwiches from available legal moves.
+        """Find all the sandwiches from available legal moves, then update the
+        indicators accordingly.
 
         Returns:
             dict: sandwiches for each possible move.
         """
-        self.sandwiches = {}
+        self._sandwiches = {}
+        self.si_player_value = self.player_value
 
         if len(self.surrounding_cells) != 0:
-            for cell_index in self.surrounding_cells:
-                cell_sandwiches = self.search_cell_sandwiches(cell_index)
+            for cell_index in self.surrounding_cells.tolist():
+                cell_flips = self.search_cell_flips(cell_index)
 
-                if len(cell_sandwiches) == 0:
+                if len(cell_flips) == 0:
                     continue
 
-                x, y = cell_index
-                self.sandwiches[f"{x},{y}"] = cell_sandwiches
+                self._sandwiches[cell_index_to_square(cell_index)] = cell_flips
 
-    def search_cell_sandwiches(
+        self.update_indicators()
+
+    def search_cell_flips(
             self, cell_index: tuple[int, int]
-    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
-        """Find all possible sandwiches from a single cell.
+    ) -> np.ndarray[Any, np.dtype[np.int8]]:
+        """Find the flat board indices of all the pieces sandwiched from a single
+        cell.
 
         Args:
             cell_index (tuple[int, int]): cell's column and row.
 
         Returns:
-            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cell indices within the
+            np.ndarray[Any, np.dtype[np.int8]]: flat board indices within the
             sandwiches.
         """
-        sandwiches: list[tuple[int, int] | dtype[signedinteger[_64Bit]]] = []
+        flips: list[int] = []
+        flat_board = self.board.ravel()
 
         # Loop for sandwiches in all directions
-        for direction in DIRECTIONS:
-            cell_indices = self.search_cell_sandwich_towards(
-                cell_index, direction
-            )
+        for ray in RAYS[cell_index_to_square(cell_index)]:
+            length = sandwich_length(flat_board, ray, self.player_value)
+            flips.extend(ray[:length])
 
-            if len(cell_indices) == 0:
-                continue
+        return np.array(flips, dtype=np.int8)
 
-            sandwiches.extend(cell_indices)
+    def search_cell_sandwiches(
+            self, cell_index: tuple[int, int]
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Find all possible sandwiches from a single cell.
 
-        return np.array(sandwiches)
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cell indices within the
+            sandwiches.
+        """
+        return np.array(
+            [
+                flat_index_to_cell_index(flat_index)
+                for flat_index in self.search_cell_flips(cell_index).tolist()
+            ]
+        )
 
     def search_cell_sandwich_towards(
             self,
@@ -158,26 +374,12 @@ class Game:
         Returns:
             npt.ArrayLike[tuple[int, int]]: cell indices within the sandwich.
         """
-        consecutive = 0
-        is_sandwich_end = False
-
-        cvt = self.cell_values_toward(cell_index, direction)
-
-        for cell_value in cvt:
-            # Check for the end of the sandwich
-            if cell_value == self.player_value:
-                is_sandwich_end = True
-                break
-
-            # Check if the cell has the opponent colour
-            if cell_value != -self.player_value:
-                break
-
-            consecutive += 1
-
         x, y = cell_index
         dx, dy = direction
 
+        ray = RAYS[cell_index_to_square(cell_index)][DIRECTION_INDICES[(dx, dy)]]
+        consecutive = sandwich_length(self.board.ravel(), ray, self.player_value)
+
         return (
             np.array(
                 [
@@ -186,7 +388,7 @@ class Game:
                 ],
                 dtype=(int, 2),
             )
-            if consecutive > 0 and is_sandwich_end
+            if consecutive > 0
             else np.array([])
         )
 
@@ -224,18 +426,86 @@ class Game:
                 return np.flipud(np.fliplr(self.board[:y, :x])).diagonal()
 
     def update_surrounding_cells(self) -> None:
-        """Find the empty cells surrounding the pieces cluster."""
-        surrounding_cells: list[tuple[int, int]] = []
+        """Find the empty cells surrounding the pieces cluster.
+
+        The whole board is scanned. `play_piece()` then keeps the cells up to date
+        with `update_frontier()`, which only looks at the neighbours of the played
+        cell.
+        """
+        self.neighbor_counts = {
+            BLACK_VALUE: np.zeros(self.board.shape, dtype=int),
+            WHITE_VALUE: np.zeros(self.board.shape, dtype=int),
+        }
+
+        for col, row in self.get_all_black_cells():
+            self.update_neighbor_counts((col, row), BLACK_VALUE, 1)
+
+        for col, row in self.get_all_white_cells():
+            self.update_neighbor_counts((col, row), WHITE_VALUE, 1)
+
+        self.frontier = (self.board == EMPTY_VALUE) & (
+            (self.neighbor_counts[BLACK_VALUE] + self.neighbor_counts[WHITE_VALUE])
+            > 0
+        )
+        self.surrounding_cells = self.get_frontier_cells()
+        self.mobility_cache = {}
+
+    def update_frontier(self, cell_index: tuple[int, int]) -> None:
+        """Update the surrounding cells after a piece has been played in a cell.
 
-        for cell_index in self.get_all_non_empty_cells():
-            empty_neighbors = self.get_empty_neighbors(cell_index)
+        Args:
+            cell_index (tuple[int, int]): cell's column and row.
+        """
+        col, row = cell_index
+        rows, cols = slice(max(row - 1, 0), row + 2), slice(max(col - 1, 0), col + 2)
+
+        added = (self.board[rows, cols] == EMPTY_VALUE) & ~self.frontier[rows, cols]
+        self.frontier[rows, cols] |= added
+        self.frontier[row, col] = False
+
+        # The played cell leaves the surrounding cells and its new empty neighbours
+        # join them. A new array is built, the previous one may be kept by a move
+        # record.
+        added_rows, added_cols = np.nonzero(added)
+        added_cells = np.column_stack(
+            (added_cols + cols.start, added_rows + rows.start)
+        )
 
-            if len(empty_neighbors) == 0:
-                continue
+        cells = self.surrounding_cells.reshape(-1, 2).astype(np.int64, copy=False)
+        cells = np.concatenate(
+            (cells[(cells[:, 0] != col) | (cells[:, 1] != row)], added_cells)
+        )
+
+        # Sorted by column then row, like `get_frontier_cells()`
+        self.surrounding_cells = cells[np.lexsort((cells[:, 1], cells[:, 0]))]
+
+    def get_frontier_cells(
+            self,
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return the cells of the frontier, sorted by column then row.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: cells column and row.
+        """
+        cells = np.argwhere(self.frontier.T)
+
+        return cells if len(cells) != 0 else np.array([])
+
+    def update_neighbor_counts(
+            self, cell_index: tuple[int, int], value: int, delta: int
+    ) -> None:
+        """Add a piece, or remove it with a negative delta, from the number of pieces
+        of its colour around each cell.
 
-            surrounding_cells.extend(empty_neighbors)
+        Args:
+            cell_index (tuple[int, int]): piece's column and row.
+            value (int): value of the piece.
+            delta (int): 1 when the piece appears, -1 when it disappears.
+        """
+        col, row = cell_index
+        rows, cols = slice(max(row - 1, 0), row + 2), slice(max(col - 1, 0), col + 2)
 
-        self.surrounding_cells = np.array(np.unique(surrounding_cells, axis=0))
+        self.neighbor_counts[value][rows, cols] += delta
 
     def get_all_non_empty_cells(
             self,
@@ -342,37 +612,72 @@ class Game:
 
     def update_indicators(self) -> None:
         """Update the move indicators positions according the possible sandwiches."""
-        cells = []
-
-        if len(self.sandwiches) > 0:
-            for k in self.sandwiches.keys():
-                col, row = list(map(int, k.split(",")))
-                cells.append((col, row))
-
-        self.indicators = np.array(cells)
+        self.indicators = np.array(
+            [square_to_cell_index(square) for square in self.sandwiches]
+        )
 
-    def flip_sandwiches(self, indicator_index: tuple[int, int]) -> None:
+    def flip_sandwiches(
+            self, indicator_index: tuple[int, int]
+    ) -> np.ndarray[Any, np.dtype[np.int8]]:
         """Flip all the pieces within the available sandwiches from an indicator's
         location.
 
         Args:
             indicator_index (tuple[int, int]): column and row of an indicator.
+
+        Returns:
+            np.ndarray[Any, np.dtype[np.int8]]: flat board indices of the flipped
+            pieces.
         """
-        key = f"{indicator_index[0]},{indicator_index[1]}"
-        _get = self.sandwiches.get(key)
+        if self.si_player_value == self.player_value:
+            flips = self._sandwiches.get(
+                cell_index_to_square(indicator_index), NO_FLIPS
+            )
+        else:
+            # Only this move's sandwiches are needed
+            flips = self.search_cell_flips(indicator_index)
+
+        self.flip_pieces(flips)
 
-        cells_to_flip = iter(_get) if _get is not None else []
+        return flips
 
-        for col, row in cells_to_flip:
-            self.board[row, col] *= -1
+    def flip_pieces(self, flips: np.ndarray[Any, np.dtype[np.int8]]) -> None:
+        """Flip pieces and update the pieces count around their cells and the hash.
+
+        Args:
+            flips (np.ndarray[Any, np.dtype[np.int8]]): flat board indices of the
+            pieces.
+        """
+        self.board.flat[flips] = -self.board.flat[flips]
+
+        for flat_index in flips.tolist():
+            cell_index = flat_index_to_cell_index(flat_index)
+            value = int(self.board.flat[flat_index])
+
+            self.update_neighbor_counts(cell_index, value, 1)
+            self.update_neighbor_counts(cell_index, -value, -1)
+            self._zobrist_hash ^= FLIP_KEYS[cell_index_to_square(cell_index)]
 
     def is_player_able_to_play(self) -> bool:
         """Check if a player has legal moves to play.
 
+        The search stops at the first sandwich found when the sandwiches are not
+        generated yet.
+
         Returns:
             bool : whether the player is able to play.
         """
-        return not np.array_equal(self.indicators, np.array([]))
+        if self.si_player_value == self.player_value:
+            return len(self._sandwiches) != 0
+
+        flat_board = self.board.ravel()
+
+        for cell_index in self.surrounding_cells.tolist():
+            for ray in RAYS[cell_index_to_square(cell_index)]:
+                if sandwich_length(flat_board, ray, self.player_value) != 0:
+                    return True
+
+        return False
 
     def get_black_piece_count(self) -> int:
         """Return the number of black pieces on the board.
@@ -410,20 +715,21 @@ class Game:
         )
 
     def update_ssi(self) -> None:
-        """Updates the game surrounding cells, sandwiches and indicators."""
+        """Updates the game surrounding cells, then mark the sandwiches and
+        indicators as outdated so that they are generated on their next access."""
         self.update_surrounding_cells()
-        self.update_sandwiches()
-        self.update_indicators()
+
+        self._sandwiches = {}
+        self._indicators = np.array([])
+        self.si_player_value = None
 
     def next_player_turn(self) -> None:
         """Update the next player value or declare the game over."""
         self.player_value *= -1
-        self.update_ssi()
 
         # Check for skipping turn
         if not self.is_player_able_to_play():
             self.player_value *= -1
-            self.update_ssi()
 
             if not self.is_player_able_to_play():
                 # Neither player has legal moves left
@@ -452,6 +758,73 @@ class Game:
         self.player_value = to_play
 
         self.update_ssi()
+        self.update_zobrist_hash()
+
+    def update_zobrist_hash(self) -> None:
+        """Compute the hash of the position from scratch, `play_piece()` keeps it up to
+        date afterwards."""
+        self._zobrist_hash = compute_hash(self.board, self.player_value)
+
+    def search_legal_moves(
+            self, player_value: int
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Find the legal moves of a player from the board, whoever's turn it is.
+
+        The search stops at the first sandwich found for each surrounding cell.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
+        """
+        flat_board = self.board.ravel()
+        moves = []
+
+        for cell_index in self.surrounding_cells.tolist():
+            for ray in RAYS[cell_index_to_square(cell_index)]:
+                if sandwich_length(flat_board, ray, player_value) != 0:
+                    moves.append(cell_index)
+                    break
+
+        return np.array(moves)
+
+    def get_legal_moves(
+            self, player_value: int
+    ) -> np.ndarray[tuple[int, int], np.dtype[np.int64]]:
+        """Return all the possible moves of a player, whoever's turn it is.
+
+        The moves are cached until the position changes, the game is left untouched.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
+        """
+        if player_value not in self.mobility_cache:
+            if self.si_player_value == player_value:
+                # Already generated for the current player
+                moves = self._indicators
+            else:
+                moves = self.search_legal_moves(player_value)
+
+            self.mobility_cache[player_value] = moves
+
+        return self.mobility_cache[player_value]
+
+    def get_legal_moves_count(self, player_value: int) -> int:
+        """Returns the number of legal moves of a player, whoever's turn it is.
+
+        Args:
+            player_value (int): value of the player.
+
+        Returns:
+            int: number of legal moves.
+        """
+        return len(self.get_legal_moves(player_value))
 
     def get_black_legal_moves(
             self,
@@ -459,15 +832,10 @@ class Game:
         """Return all black possible moves to play.
 
         Returns:
-            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells row and
-            column.
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
         """
-        game_copy = deepcopy(self)  # Copy the game without reference
-
-        game_copy.player_value = BLACK_VALUE
-        game_copy.update_ssi()
-
-        return game_copy.indicators
+        return self.get_legal_moves(BLACK_VALUE)
 
     def get_white_legal_moves(
             self,
@@ -475,15 +843,10 @@ class Game:
         """Return all white possible moves to play.
 
         Returns:
-            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells row and
-            column.
+            np.ndarray[tuple[int, int], np.dtype[np.int64]]: list of cells column
+            and row.
         """
-        game_copy = deepcopy(self)  # Copy the game without reference
-
-        game_copy.player_value = WHITE_VALUE
-        game_copy.update_ssi()
-
-        return game_copy.indicators
+        return self.get_legal_moves(WHITE_VALUE)
 
     def get_black_legal_moves_count(self) -> int:
         """Returns the number of black's legal moves.
@@ -491,7 +854,7 @@ class Game:
         Returns:
             int: number of legal moves.
         """
-        return len(self.get_black_legal_moves())
+        return self.get_legal_moves_count(BLACK_VALUE)
 
     def get_white_legal_moves_count(self) -> int:
         """Returns the number of white's legal moves.
@@ -499,7 +862,7 @@ class Game:
         Returns:
             int: number of legal moves.
         """
-        return len(self.get_white_legal_moves())
+        return self.get_legal_moves_count(WHITE_VALUE)
 
     def get_black_empty_neighbors_count(self) -> int:
         """Returns the number of empty cells next to black's pieces.
@@ -507,21 +870,7 @@ class Game:
         Returns:
             int: number of empty cells.
         """
-        black_cells = self.get_all_black_cells()
-
-        if len(black_cells) == 0:
-            return 0
-
-        empty_cells: list[tuple[int, int]] = []
-        for cell_index in black_cells:
-            empty_neighbors = self.get_empty_neighbors(cell_index)
-
-            if len(empty_neighbors) == 0:
-                continue
-
-            empty_cells.extend(empty_neighbors)
-
-        return len(np.unique(empty_cells, axis=0))
+        return int(np.count_nonzero(self.neighbor_counts[BLACK_VALUE][self.frontier]))
 
     def get_white_empty_neighbors_count(self) -> int:
         """Returns the number of empty cells next to white's pieces.
@@ -529,18 +878,4 @@ class Game:
         Returns:
             int: number of empty cells.
         """
-        white_cells = self.get_all_white_cells()
-
-        if len(white_cells) == 0:
-            return 0
-
-        empty_cells: list[tuple[int, int]] = []
-        for cell_index in white_cells:
-            empty_neighbors = self.get_empty_neighbors(cell_index)
-
-            if len(empty_neighbors) == 0:
-                continue
-
-            empty_cells.extend(empty_neighbors)
-
-        return len(np.unique(empty_cells, axis=0))
+        return int(np.count_nonzero(self.neighbor_counts[WHITE_VALUE][self.frontier]))
@@ -0,0 +1,420 @@
+import math
+import time
+from typing import Any
+
+import numpy as np
+
+from othellia.bitboard import AnyGame, flipped_pieces, get_position, legal_moves
+from othellia.endgame import get_squares
+from othellia.minimax import is_search_stopped
+from settings.board import BOARD_CELL_LENGTH
+from settings.values import BLACK_VALUE
+from utils.game import square_to_cell_index
+
+# Exploration constant of the UCT formula
+UCT_EXPLORATION: float = math.sqrt(2)
+
+# Playouts of a search without budget
+MCTS_PLAYOUTS: int = 1000
+
+# Nodes of a tree by default
+MCTS_NODE_COUNT: int = 1 << 20
+
+# Children of a node at most, one per empty cell of the start position
+MAX_CHILD_COUNT: int = BOARD_CELL_LENGTH ** 2 - 4
+
+# Move of the node reached by passing
+PASS_MOVE: int = -1
+
+# Node without children yet
+NO_CHILD: int = -1
+
+# Bytes used by a node: parent, first child, child count, move, visits and wins
+NODE_SIZE: int = 4 + 4 + 1 + 1 + 4 + 4
+
+
+class MonteCarloTree:
+    """Fixed size search tree stored in flat arrays, a node being an index.
+
+    The children of a node are contiguous, so that a node only stores its first
+    child and their count. Players alternate strictly, a pass being a move, and the
+    wins of a node are counted for the player who played its move.
+    """
+    parents: np.ndarray[Any, np.dtype[np.int32]]
+    first_children: np.ndarray[Any, np.dtype[np.int32]]
+    child_counts: np.ndarray[Any, np.dtype[np.int8]]
+    moves: np.ndarray[Any, np.dtype[np.int8]]
+    visits: np.ndarray[Any, np.dtype[np.int32]]
+    wins: np.ndarray[Any, np.dtype[np.float32]]
+
+    size: int
+    node_count: int
+
+    def __init__(self, size: int = MCTS_NODE_COUNT) -> None:
+        """
+        Args:
+            size (int, optional): maximum number of nodes. Defaults to
+            `MCTS_NODE_COUNT`.
+        """
+        self.size = size
+
+        self.parents = np.zeros(size, dtype=np.int32)
+        self.first_children = np.zeros(size, dtype=np.int32)
+        self.child_counts = np.zeros(size, dtype=np.int8)
+        self.moves = np.zeros(size, dtype=np.int8)
+        self.visits = np.zeros(size, dtype=np.int32)
+        self.wins = np.zeros(size, dtype=np.float32)
+
+        self.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the arrays of the tree."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.parents,
+                self.first_children,
+                self.child_counts,
+                self.moves,
+                self.visits,
+                self.wins,
+            )
+        )
+
+    def clear(self) -> None:
+        """Remove all the nodes but an unvisited root."""
+        self.node_count = 0
+        self.add_node(NO_CHILD, PASS_MOVE)
+
+    def add_node(self, parent: int, move: int) -> int:
+        """Add an unvisited node without children.
+
+        Args:
+            parent (int): index of the parent node.
+            move (int): square index of the move leading to the node, or
+            `PASS_MOVE`.
+
+        Returns:
+            int: index of the node.
+        """
+        node = self.node_count
+        self.node_count += 1
+
+        self.parents[node] = parent
+        self.first_children[node] = NO_CHILD
+        self.child_counts[node] = 0
+        self.moves[node] = move
+        self.visits[node] = 0
+        self.wins[node] = 0
+
+        return node
+
+    def expand(self, node: int, moves: list[int]) -> bool:
+        """Add the children of a node.
+
+        Args:
+            node (int): index of the node.
+            moves (list[int]): square index of each move, or `PASS_MOVE`. No move
+            makes the node terminal.
+
+        Returns:
+            bool: if the children fit in the tree, else the node is left unexpanded.
+        """
+        if self.node_count + len(moves) > self.size:
+            return False
+
+        self.first_children[node] = self.node_count
+        self.child_counts[node] = len(moves)
+
+        for move in moves:
+            self.add_node(node, move)
+
+        return True
+
+    def select(self, node: int, exploration: float) -> int:
+        """Return the child of a node maximizing the UCT formula, unvisited children
+        first.
+
+        Args:
+            node (int): index of an expanded node with children.
+            exploration (float): exploration constant.
+
+        Returns:
+            int: index of the child.
+        """
+        first_child = int(self.first_children[node])
+        last_child = first_child + int(self.child_counts[node])
+        visits = self.visits[first_child:last_child]
+
+        unvisited = np.flatnonzero(visits == 0)
+        if len(unvisited):
+            return first_child + int(unvisited[0])
+
+        uct = self.wins[first_child:last_child] / visits + exploration * np.sqrt(
+            math.log(self.visits[node]) / visits
+        )
+
+        return first_child + int(np.argmax(uct))
+
+    def backpropagate(self, node: int, result: float) -> None:
+        """Count a playout in a node and its ancestors.
+
+        Args:
+            node (int): index of the node the playout started from.
+            result (float): result of the playout for the player who played the move
+            of the node: 1 for a win, 0.5 for a draw and 0 for a loss.
+        """
+        while node != NO_CHILD:
+            self.visits[node] += 1
+            self.wins[node] += result
+
+            result = 1 - result
+            node = int(self.parents[node])
+
+
+def play(player: int, opponent: int, move: int) -> tuple[int, int]:
+    """Play a move and return the position for the next player.
+
+    Args:
+        player (int): bitboard of the pieces of the player to play.
+        opponent (int): bitboard of the opponent's pieces.
+        move (int): square index of the move, or `PASS_MOVE`.
+
+    Returns:
+        tuple[int, int]: bitboards of the pieces of the next player to play and of
+        its opponent.
+    """
+    if move == PASS_MOVE:
+        return opponent, player
+
+    flipped = flipped_pieces(player, opponent, move)
+
+    return opponent ^ flipped, player | flipped | (1 << move)
+
+
+def get_moves(player: int, opponent: int) -> list[int]:
+    """Return the moves of a position, a pass if the player cannot play.
+
+    Args:
+        player (int): bitboard of the pieces of the player to play.
+        opponent (int): bitboard of the opponent's pieces.
+
+    Returns:
+        list[int]: square index of the moves, `[PASS_MOVE]` if the player has to
+        pass, empty if the game is over.
+    """
+    moves = legal_moves(player, opponent)
+    if moves:
+        return get_squares(moves)
+
+    if legal_moves(opponent, player):
+        return [PASS_MOVE]
+
+    return []
+
+
+def playout(player: int, opponent: int, random_values: list[float]) -> int:
+    """Play random moves until the end of the game.
+
+    Args:
+        player (int): bitboard of the pieces of the player to play.
+        opponent (int): bitboard of the opponent's pieces.
+        random_values (list[float]): uniform random values in [0, 1), one for each
+        move.
+
+    Returns:
+        int: final disc difference from the point of view of the player.
+    """
+    sign = 1
+    passed = False
+    move_index = 0
+
+    while True:
+        moves = legal_moves(player, opponent)
+
+        if moves:
+            squares = get_squares(moves)
+            square = squares[int(random_values[move_index] * len(squares))]
+            move_index += 1
+
+            flipped = flipped_pieces(player, opponent, square)
+            player, opponent = opponent ^ flipped, player | flipped | (1 << square)
+            passed = False
+        elif passed:
+            break
+        else:
+            player, opponent = opponent, player
+            passed = True
+
+        sign = -sign
+
+    return sign * (player.bit_count() - opponent.bit_count())
+
+
+class MonteCarloTreeSearch:
+    """Monte Carlo tree search with the UCT selection: each playout descends the
+    tree choosing the child with the best upper confidence bound, adds the children
+    of the leaf it reaches, and plays random moves from one of them until the end of
+    the game, whose result is counted in every node on the way.
+    """
+    tree: MonteCarloTree
+    rng: np.random.Generator
+    exploration: float
+    playout_count: int
+
+    def __init__(
+            self,
+            tree: MonteCarloTree | None = None,
+            rng: np.random.Generator | None = None,
+            exploration: float = UCT_EXPLORATION,
+    ) -> None:
+        """
+        Args:
+            tree (MonteCarloTree | None, optional): tree the search is stored in,
+            cleared before each search. Defaults to None, for a new tree.
+            rng (np.random.Generator | None, optional): random generator of the
+            playouts. Defaults to None, for an unseeded one.
+            exploration (float, optional): exploration constant of the UCT formula.
+            Defaults to `UCT_EXPLORATION`.
+        """
+        self.tree = MonteCarloTree() if tree is None else tree
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.exploration = exploration
+        self.playout_count = 0
+
+    def search(
+            self,
+            game: AnyGame,
+            playout_count: int | None = None,
+            time_budget: float | None = None,
+    ) -> tuple[int, int]:
+        """Return the most visited move of the root after the playouts.
+
+        Args:
+            game (AnyGame): a game, which is not over.
+            playout_count (int | None, optional): number of playouts. Defaults to
+            None, for `MCTS_PLAYOUTS` without a time budget.
+            time_budget (float | None, optional): seconds given to the search, the
+            playouts stopping at the first budget spent. Defaults to None.
+
+        Returns:
+            tuple[int, int]: column and row of the best move, the most visited one so
+            far when the search is stopped.
+        """
+        if playout_count is None and time_budget is None:
+            playout_count = MCTS_PLAYOUTS
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+        black, white, player_value = get_position(game)
+        root = (black, white) if player_value == BLACK_VALUE else (white, black)
+
+        self.tree.clear()
+        self.playout_count = 0
+
+        # The first playout always runs so that the root has children
+        self.run_playout(*root)
+
+        # Stopped like the minimax searches, see `set_stop_flag()`
+        while (
+            (playout_count is None or self.playout_count < playout_count)
+            and (deadline is None or time.perf_counter() < deadline)
+            and not is_search_stopped()
+        ):
+            self.run_playout(*root)
+
+        tree = self.tree
+        first_child = int(tree.first_children[0])
+        visits = tree.visits[first_child:first_child + int(tree.child_counts[0])]
+
+        return square_to_cell_index(
+            int(tree.moves[first_child + int(np.argmax(visits))])
+        )
+
+    def run_playout(self, player: int, opponent: int) -> None:
+        """Run a playout from the root and count its result.
+
+        Args:
+            player (int): bitboard of the pieces of the player to play at the root.
+            opponent (int): bitboard of the opponent's pieces.
+        """
+        tree = self.tree
+        node = 0
+
+        # Selection
+        while tree.first_children[node] != NO_CHILD and tree.child_counts[node]:
+            node = tree.select(node, self.exploration)
+            player, opponent = play(player, opponent, int(tree.moves[node]))
+
+        # Expansion, unless the tree is full or the game is over
+        if tree.first_children[node] == NO_CHILD:
+            moves = get_moves(player, opponent)
+
+            if tree.expand(node, moves) and moves:
+                node = tree.select(node, self.exploration)
+                player, opponent = play(player, opponent, int(tree.moves[node]))
+
+        # Simulation, from the point of view of the player to play, each move
+        # filling an empty cell
+        empty_count = BOARD_CELL_LENGTH ** 2 - (player | opponent).bit_count()
+        disc_difference = playout(
+            player, opponent, self.rng.random(empty_count).tolist()
+        )
+
+        # The node is counted for the player who played its move
+        result = 0.5 if disc_difference == 0 else float(disc_difference < 0)
+        tree.backpropagate(node, result)
+
+        self.playout_count += 1
+
+
+def get_tree_size(playout_count: int | None, time_budget: float | None) -> int:
+    """Return the number of nodes of a tree large enough for a search.
+
+    Args:
+        playout_count (int | None): number of playouts of the search, see
+        `MonteCarloTreeSearch.search()`.
+        time_budget (float | None): seconds given to the search.
+
+    Returns:
+        int: number of nodes, `MCTS_NODE_COUNT` at most.
+    """
+    if playout_count is None:
+        if time_budget is not None:
+            return MCTS_NODE_COUNT
+
+        playout_count = MCTS_PLAYOUTS
+
+    # Each playout, at least one, expands a single node
+    return min(MCTS_NODE_COUNT, 1 + max(playout_count, 1) * MAX_CHILD_COUNT)
+
+
+def think(
+        game: AnyGame,
+        playout_count: int | None = None,
+        time_budget: float | None = None,
+        search: MonteCarloTreeSearch | None = None,
+) -> tuple[int, int]:
+    """Return the best move to play according to a Monte Carlo tree search, with the
+    same interface as `othellia.minimax.think()`.
+
+    Args:
+        game (AnyGame): a game, which is not over.
+        playout_count (int | None, optional): number of playouts. Defaults to None,
+        for `MCTS_PLAYOUTS` without a time budget.
+        time_budget (float | None, optional): seconds given to the search. Defaults
+        to None.
+        search (MonteCarloTreeSearch | None, optional): search kept between calls to
+        reuse its tree memory. Defaults to None, for a new tree holding the nodes of
+        the playouts, `MCTS_NODE_COUNT` ones with a time budget only.
+
+    Returns:
+        tuple[int, int]: column and row of the best move.
+    """
+    if search is None:
+        search = MonteCarloTreeSearch(
+            MonteCarloTree(get_tree_size(playout_count, time_budget))
+        )
+
+    return search.search(game, playout_count, time_budget)
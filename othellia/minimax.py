@@ -1,118 +1,1317 @@
-from copy import deepcopy
-from typing import Callable, cast
+import ctypes
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Iterable, cast
 
 import numpy as np
 
-from othellia.game import Game
-from settings.values import BLACK_VALUE
+from othellia.bitboard import AnyGame, Position, get_position, position_to_game
+from othellia.endgame import EndgameSolver, SolverTimeout
+from othellia.move_ordering import MoveOrdering
+from othellia.opening_book import OpeningBook
+from othellia.probcut import MultiProbCut, ProbCutParameters
+from othellia.reductions import LateMoveReductions
+from othellia.search_statistics import SearchStatistics
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import (
+    EXACT,
+    LOWER_BOUND,
+    NO_MOVE,
+    UPPER_BOUND,
+    SharedTranspositionTable,
+    TranspositionTable,
+)
+from settings.board import BOARD_CELL_LENGTH
+from utils.game import cell_index_to_square
+from utils.symmetry import remove_symmetric_moves
 
+# Half width of the first aspiration window around the previous iteration's score,
+# doubled after each failed search
+ASPIRATION_WINDOW: float = 10.0
 
-def minimax(
-    game: Game,
+# Memory used by the transposition table of each worker process
+WORKER_TRANSPOSITION_TABLE_MB: float = 16
+
+# Search state of a worker process, see `search_move()`
+worker_transposition_table: TranspositionTable | None = None
+worker_move_ordering: MoveOrdering | None = None
+worker_evaluation_weights: tuple[float, ...] | None = None
+worker_search_id: int | None = None
+
+# Identifiers of the root searches of `parallel_search_root()`
+root_search_ids = itertools.count()
+
+# Flag stopping the searches of the process when set: by the main process in a
+# Lazy SMP helper, by the main thread in a background search thread
+worker_stop_flag: Any = None
+
+
+class SearchTimeout(Exception):
+    """Raised by `negamax()` when the search deadline is passed, or when the search
+    is told to stop."""
+
+
+def set_stop_flag(stop_flag: Any) -> None:
+    """Stop the searches of the process whenever a flag is set.
+
+    Args:
+        stop_flag (Any): flag with a boolean `value`, e.g. a `ctypes.c_bool`, None
+        to never stop.
+    """
+    global worker_stop_flag
+
+    worker_stop_flag = stop_flag
+
+
+def is_search_stopped() -> bool:
+    """Return whether the searches of the process are told to stop, see
+    `set_stop_flag()`.
+
+    Returns:
+        bool: if the stop flag is set.
+    """
+    return worker_stop_flag is not None and bool(worker_stop_flag.value)
+
+
+def negamax(
+    game: AnyGame,
     depth: int,
     alpha: float,
     beta: float,
-    static_evaluation_func: Callable[[Game], float],
-    maximizing_player: bool,
+    static_evaluation_func: Callable[[AnyGame], float],
+    transposition_table: TranspositionTable | None = None,
+    deadline: float | None = None,
+    move_ordering: MoveOrdering | None = None,
+    principal_variation: bool = False,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    statistics: SearchStatistics | None = None,
 ) -> float:
     """Analyse the current board position according to a static evaluation function and
-    a depth.
+    a depth, from the point of view of the player to play.
+
+    In principal variation search mode, the first move is searched with the full
+    window, the others with a null window only proving they are not better, and are
+    searched again with the full window if they are.
 
     Args:
-        game (Game): a game.
+        game (AnyGame): a game.
         depth (int): depth of the search.
         alpha (float): alpha parameter of pruning.
         beta (float): beta parameter of pruning.
-        static_evaluation_func (Callable[[Game], float]): position evaluation function.
-        maximizing_player (bool): if we want to maximize (for black)
-        or minimize (for white)the score of the player.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function, positive when black has the advantage.
+        transposition_table (TranspositionTable | None, optional): table the results
+        are looked up in and stored to. Defaults to None.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        move_ordering (MoveOrdering | None, optional): heuristics sorting the moves
+        before searching them. Defaults to None.
+        principal_variation (bool, optional): if the principal variation search is
+        used. Defaults to False.
+        multi_probcut (MultiProbCut | None, optional): parameters pruning the
+        subtrees a shallow search predicts outside of the window, which makes the
+        score approximate. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions of the last moves of each node, which makes the score
+        approximate. Defaults to None.
+        statistics (SearchStatistics | None, optional): counters of the search,
+        see `think()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed, the game is left unchanged.
 
     Returns:
-        float: evaluation score.
+        float: evaluation score, positive when the player to play has the advantage.
     """
-    # https://www.youtube.com/watch?v=l-hh51ncgDI
+    # https://en.wikipedia.org/wiki/Negamax
+    if deadline is not None and time.perf_counter() > deadline:
+        raise SearchTimeout
+
+    if worker_stop_flag is not None and worker_stop_flag.value:
+        raise SearchTimeout
+
+    if statistics is not None:
+        statistics.record_node(depth)
+
+    tt_move = NO_MOVE
+
+    if transposition_table is not None:
+        entry = transposition_table.probe(game.zobrist_hash)
+        if entry is not None:
+            tt_move = entry.best_move
+
+        if entry is not None and entry.depth >= depth:
+            if entry.bound == EXACT:
+                return entry.score
+            elif entry.bound == LOWER_BOUND:
+                alpha = max(alpha, entry.score)
+            else:
+                beta = min(beta, entry.score)
+
+            if beta <= alpha:
+                return entry.score
+
+    player_value = game.player_value
+
     if depth == 0 or game.is_over:
-        return static_evaluation_func(game)
+        score = player_value * static_evaluation_func(game)
 
-    if maximizing_player:
-        max_eval = -np.inf
+        if transposition_table is not None:
+            transposition_table.store(game.zobrist_hash, depth, score, EXACT)
 
-        for move in game.indicators:
-            game_copy = deepcopy(game)  # Copy the game without reference
-            game_copy.play_piece(move)
+        return score
 
-            child_eval = minimax(
-                game_copy,
-                depth - 1,
+    if multi_probcut is not None:
+        parameters = multi_probcut.get_parameters(depth, get_empty_count(game))
+
+        if parameters is not None:
+            probcut_score = search_probcut(
+                game,
+                parameters,
+                multi_probcut.threshold,
                 alpha,
                 beta,
                 static_evaluation_func,
-                False,
+                transposition_table,
+                deadline,
+                move_ordering,
+                statistics,
             )
-            max_eval = max(max_eval, child_eval)
 
-            alpha = max(alpha, child_eval)
-            if beta <= alpha:
-                break
+            if probcut_score is not None:
+                return probcut_score
+
+    # Window the score is searched in, to tell bounds from exact scores
+    alpha_orig = alpha
+    best_eval = -np.inf
+    best_move = NO_MOVE
+
+    if statistics is not None:
+        start = time.perf_counter()
+
+    # Indicators are generated from the move bitboard on each access
+    indicators = game.indicators
+    moves: Iterable[Any] = indicators
+    if move_ordering is not None:
+        moves = move_ordering.order(indicators, depth, player_value, tt_move)
+
+    if statistics is not None:
+        statistics.move_generation_time += time.perf_counter() - start
+
+    for move_index, move in enumerate(moves):
+        reduction = 0
+        if late_move_reductions is not None and move_index > 0:
+            reduction = late_move_reductions.get_reduction(depth, move_index)
+
+        if statistics is not None:
+            start = time.perf_counter()
+
+        # Making the move generates the moves of the next position
+        record = game.make_move(move)
+
+        if statistics is not None:
+            statistics.move_generation_time += time.perf_counter() - start
+
+        try:
+            is_better = True
+
+            if reduction:
+                child_eval = search_child(
+                    game,
+                    player_value,
+                    depth - 1 - reduction,
+                    alpha,
+                    null_window(alpha),
+                    static_evaluation_func,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    principal_variation,
+                    multi_probcut,
+                    late_move_reductions,
+                    statistics,
+                )
+                is_better = alpha < child_eval
+
+            if is_better and principal_variation and move_index > 0:
+                child_eval = search_child(
+                    game,
+                    player_value,
+                    depth - 1,
+                    alpha,
+                    null_window(alpha),
+                    static_evaluation_func,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    principal_variation,
+                    multi_probcut,
+                    late_move_reductions,
+                    statistics,
+                )
+                is_better = alpha < child_eval < beta
+
+            if is_better:
+                child_eval = search_child(
+                    game,
+                    player_value,
+                    depth - 1,
+                    alpha,
+                    beta,
+                    static_evaluation_func,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    principal_variation,
+                    multi_probcut,
+                    late_move_reductions,
+                    statistics,
+                )
+        finally:
+            game.unmake_move(record)
+
+        if child_eval > best_eval:
+            best_eval = child_eval
+            best_move = cell_index_to_square(move)
+
+        alpha = max(alpha, child_eval)
+        if beta <= alpha:
+            if move_ordering is not None:
+                move_ordering.record_cutoff(move, depth, player_value)
+            if statistics is not None:
+                statistics.cutoff_counts[move_index] += 1
+            break
+
+    if transposition_table is not None:
+        if best_eval <= alpha_orig:
+            bound = UPPER_BOUND
+        elif best_eval >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+
+        transposition_table.store(
+            game.zobrist_hash, depth, best_eval, bound, best_move
+        )
+
+    return best_eval
+
+
+def search_child(
+    game: AnyGame,
+    player_value: int,
+    depth: int,
+    alpha: float,
+    beta: float,
+    static_evaluation_func: Callable[[AnyGame], float],
+    transposition_table: TranspositionTable | None = None,
+    deadline: float | None = None,
+    move_ordering: MoveOrdering | None = None,
+    principal_variation: bool = False,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    statistics: SearchStatistics | None = None,
+) -> float:
+    """Search the position reached by a move, from the point of view of the player
+    who played it.
+
+    The opponent usually plays next, and its score is negated. When the opponent has
+    to pass, the same player plays again and keeps its score.
+
+    Args:
+        game (AnyGame): a game, after the move.
+        player_value (int): value of the player who played the move.
+        depth (int): depth of the search.
+        alpha (float): alpha parameter of pruning.
+        beta (float): beta parameter of pruning.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function, positive when black has the advantage.
+        transposition_table (TranspositionTable | None, optional): table the results
+        are looked up in and stored to. Defaults to None.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        move_ordering (MoveOrdering | None, optional): heuristics sorting the moves
+        before searching them. Defaults to None.
+        principal_variation (bool, optional): if the principal variation search is
+        used. Defaults to False.
+        multi_probcut (MultiProbCut | None, optional): parameters pruning the
+        subtrees a shallow search predicts outside of the window, which makes the
+        score approximate. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions of the last moves of each node, which makes the score
+        approximate. Defaults to None.
+        statistics (SearchStatistics | None, optional): counters of the search,
+        see `think()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed, the game is left unchanged.
+
+    Returns:
+        float: evaluation score, positive when the player who played the move has
+        the advantage.
+    """
+    if game.player_value == player_value:
+        # The opponent passes
+        return negamax(
+            game,
+            depth,
+            alpha,
+            beta,
+            static_evaluation_func,
+            transposition_table,
+            deadline,
+            move_ordering,
+            principal_variation,
+            multi_probcut,
+            late_move_reductions,
+            statistics,
+        )
+
+    return -negamax(
+        game,
+        depth,
+        -beta,
+        -alpha,
+        static_evaluation_func,
+        transposition_table,
+        deadline,
+        move_ordering,
+        principal_variation,
+        multi_probcut,
+        late_move_reductions,
+        statistics,
+    )
+
+
+def null_window(alpha: float) -> float:
+    """Return the beta of a null window search, only telling whether a score is
+    above alpha.
+
+    Scores are floats, the window is made as narrow as they allow.
+
+    Args:
+        alpha (float): alpha parameter of pruning.
+
+    Returns:
+        float: smallest float above alpha.
+    """
+    return float(np.nextafter(alpha, np.inf))
+
+
+def search_probcut(
+    game: AnyGame,
+    parameters: ProbCutParameters,
+    threshold: float,
+    alpha: float,
+    beta: float,
+    static_evaluation_func: Callable[[AnyGame], float],
+    transposition_table: TranspositionTable | None = None,
+    deadline: float | None = None,
+    move_ordering: MoveOrdering | None = None,
+    statistics: SearchStatistics | None = None,
+) -> float | None:
+    """Predict the score of a deep search from a shallow one (Multi-ProbCut).
+
+    The deep score is modelled as `slope * shallow_score + intercept` plus a normal
+    error. When the shallow search proves the prediction is above beta, or below
+    alpha, by `threshold` standard deviations, the deep search most likely fails
+    the same way and is skipped. Both tests are null window searches.
+
+    Args:
+        game (AnyGame): a game.
+        parameters (ProbCutParameters): regression of the depth being searched.
+        threshold (float): number of standard deviations the prediction must be
+        outside of the window by.
+        alpha (float): alpha parameter of pruning.
+        beta (float): beta parameter of pruning.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function, positive when black has the advantage.
+        transposition_table (TranspositionTable | None, optional): table the results
+        are looked up in and stored to. Defaults to None.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        move_ordering (MoveOrdering | None, optional): heuristics sorting the moves
+        before searching them. Defaults to None.
+        statistics (SearchStatistics | None, optional): counters of the search,
+        see `think()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed, the game is left unchanged.
+
+    Returns:
+        float | None: beta or alpha when the deep search is predicted to fail high
+        or low, None if it has to be searched.
+    """
+    shallow_depth, slope, intercept, sigma = parameters
+
+    # The scores of the depths must be correlated
+    if slope <= 0:
+        return None
+
+    margin = threshold * sigma
+
+    if beta < np.inf:
+        bound = (beta + margin - intercept) / slope
+        score = negamax(
+            game,
+            shallow_depth,
+            float(np.nextafter(bound, -np.inf)),
+            bound,
+            static_evaluation_func,
+            transposition_table,
+            deadline,
+            move_ordering,
+            statistics=statistics,
+        )
+
+        if score >= bound:
+            return beta
+
+    if alpha > -np.inf:
+        bound = (alpha - margin - intercept) / slope
+        score = negamax(
+            game,
+            shallow_depth,
+            bound,
+            null_window(bound),
+            static_evaluation_func,
+            transposition_table,
+            deadline,
+            move_ordering,
+            statistics=statistics,
+        )
+
+        if score <= bound:
+            return alpha
+
+    return None
+
+
+def search_root(
+    game: AnyGame,
+    legal_moves: np.ndarray[Any, np.dtype[Any]],
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    transposition_table: TranspositionTable | None = None,
+    deadline: float | None = None,
+    move_ordering: MoveOrdering | None = None,
+    alpha: float = -np.inf,
+    beta: float = np.inf,
+    executor: Executor | None = None,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    statistics: SearchStatistics | None = None,
+) -> tuple[tuple[int, int], float]:
+    """Return the best of the given legal moves, the first one in case of a tie.
+
+    The best score so far is shared between the moves: the first move is searched
+    with the window, the others with a null window only proving they are not
+    better, and are searched again if they are (principal variation search).
+
+    Args:
+        game (AnyGame): a game.
+        legal_moves (np.ndarray[Any, np.dtype[Any]]): column and row of the moves to
+        search.
+        depth (int): depth of the search.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        transposition_table (TranspositionTable | None, optional): table the results
+        are looked up in and stored to. Defaults to None.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        move_ordering (MoveOrdering | None, optional): heuristics sorting the moves
+        below the root. Defaults to None.
+        alpha (float, optional): alpha parameter of pruning. Defaults to -inf.
+        beta (float, optional): beta parameter of pruning. Defaults to inf.
+        executor (Executor | None, optional): worker processes the moves are
+        searched in, see `create_executor()`. Defaults to None.
+        multi_probcut (MultiProbCut | None, optional): parameters of the selective
+        search below the root, see `negamax()`. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions below the root, see `negamax()`. Defaults to None.
+        statistics (SearchStatistics | None, optional): counters of the search
+        in the process, see `think()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed, the game is left unchanged.
+
+    Returns:
+        tuple[tuple[int, int], float]: row and column of the best move and its
+        score. A score at most alpha is an upper bound and the move is meaningless,
+        a score at least beta is a lower bound.
+    """
+    if executor is not None:
+        return parallel_search_root(
+            executor,
+            game,
+            legal_moves,
+            depth,
+            static_evaluation_func,
+            deadline,
+            alpha,
+            beta,
+            multi_probcut,
+            late_move_reductions,
+        )
+
+    player_value = game.player_value
+    best_move = cast(tuple[int, int], legal_moves[0])
+    best_eval = -np.inf
+
+    for move_index, legal_move in enumerate(legal_moves):
+        record = game.make_move(legal_move)
+        try:
+            if move_index > 0:
+                score = search_child(
+                    game,
+                    player_value,
+                    depth,
+                    alpha,
+                    null_window(alpha),
+                    static_evaluation_func,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    principal_variation=True,
+                    multi_probcut=multi_probcut,
+                    late_move_reductions=late_move_reductions,
+                    statistics=statistics,
+                )
+                is_better = alpha < score < beta
+            else:
+                is_better = True
+
+            if is_better:
+                score = search_child(
+                    game,
+                    player_value,
+                    depth,
+                    alpha,
+                    beta,
+                    static_evaluation_func,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    principal_variation=True,
+                    multi_probcut=multi_probcut,
+                    late_move_reductions=late_move_reductions,
+                    statistics=statistics,
+                )
+        finally:
+            game.unmake_move(record)
+
+        # Ties keep the first move
+        if score > best_eval:
+            best_eval = score
+            best_move = cast(tuple[int, int], legal_move)
+
+        alpha = max(alpha, score)
+        if beta <= alpha:
+            break
+
+    return best_move, best_eval
+
+
+def search_aspiration(
+    game: AnyGame,
+    legal_moves: np.ndarray[Any, np.dtype[Any]],
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    guess: float,
+    transposition_table: TranspositionTable | None = None,
+    deadline: float | None = None,
+    move_ordering: MoveOrdering | None = None,
+    executor: Executor | None = None,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    statistics: SearchStatistics | None = None,
+) -> tuple[tuple[int, int], float]:
+    """Search the root in a window centred on a guessed score, widened and searched
+    again while the score falls outside of it (aspiration windows).
+
+    Args:
+        game (AnyGame): a game.
+        legal_moves (np.ndarray[Any, np.dtype[Any]]): column and row of the moves to
+        search.
+        depth (int): depth of the search.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        guess (float): expected score, e.g. the one of the previous iteration.
+        transposition_table (TranspositionTable | None, optional): table the results
+        are looked up in and stored to. Defaults to None.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        move_ordering (MoveOrdering | None, optional): heuristics sorting the moves
+        below the root. Defaults to None.
+        executor (Executor | None, optional): worker processes the moves are
+        searched in, see `create_executor()`. Defaults to None.
+        multi_probcut (MultiProbCut | None, optional): parameters of the selective
+        search below the root, see `negamax()`. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions below the root, see `negamax()`. Defaults to None.
+        statistics (SearchStatistics | None, optional): counters of the search
+        in the process, see `think()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed, the game is left unchanged.
+
+    Returns:
+        tuple[tuple[int, int], float]: row and column of the best move and its
+        score.
+    """
+    window = ASPIRATION_WINDOW
+    alpha = guess - window
+    beta = guess + window
+
+    while True:
+        best_move, best_eval = search_root(
+            game,
+            legal_moves,
+            depth,
+            static_evaluation_func,
+            transposition_table,
+            deadline,
+            move_ordering,
+            alpha,
+            beta,
+            executor,
+            multi_probcut,
+            late_move_reductions,
+            statistics,
+        )
+
+        if best_eval <= alpha and alpha > -np.inf:
+            alpha = best_eval - window
+        elif best_eval >= beta and beta < np.inf:
+            beta = best_eval + window
+        else:
+            return best_move, best_eval
+
+        window *= 2
+
+
+def init_worker(transposition_table_mb: float) -> None:
+    """Create the search state of a worker process.
+
+    Args:
+        transposition_table_mb (float): memory used by the transposition table of
+        the worker in megabytes.
+    """
+    global worker_transposition_table, worker_move_ordering
+
+    worker_transposition_table = TranspositionTable(transposition_table_mb)
+    worker_move_ordering = MoveOrdering()
 
-        return max_eval
-    else:
-        min_eval = np.inf
 
-        for move in game.indicators:
-            game_copy = deepcopy(game)  # Copy the game without reference
-            game_copy.play_piece(move)
+def create_executor(
+    process_count: int | None = None,
+    transposition_table_mb: float = WORKER_TRANSPOSITION_TABLE_MB,
+) -> ProcessPoolExecutor:
+    """Start worker processes for `think()`.
 
-            child_eval = minimax(
-                game_copy, depth - 1, alpha, beta, static_evaluation_func, True
+    Workers keep their transposition table between searches, cleared at each root
+    search so that deeper results of a previous one do not change the scores. The
+    executor is meant to be kept during a game and shut down afterwards.
+
+    Args:
+        process_count (int | None, optional): number of worker processes, the number
+        of CPUs if None. Defaults to None.
+        transposition_table_mb (float, optional): memory used by the transposition
+        table of each worker in megabytes. Defaults to
+        `WORKER_TRANSPOSITION_TABLE_MB`.
+
+    Returns:
+        ProcessPoolExecutor: worker processes.
+    """
+    return ProcessPoolExecutor(
+        process_count,
+        initializer=init_worker,
+        initargs=(transposition_table_mb,),
+    )
+
+
+def search_move(
+    position: Position,
+    move: tuple[int, int],
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    evaluation_weights: tuple[float, ...],
+    alpha: float,
+    beta: float,
+    deadline: float | None = None,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    search_id: int | None = None,
+) -> float:
+    """Search a root move in a worker process.
+
+    Args:
+        position (Position): compact root position.
+        move (tuple[int, int]): column and row of the move.
+        depth (int): depth of the search below the move.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        evaluation_weights (tuple[float, ...]): weights of
+        `StaticEvaluation.evaluate()` in the main process.
+        alpha (float): alpha parameter of pruning.
+        beta (float): beta parameter of pruning.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned, the clock being system-wide. Defaults to None.
+        multi_probcut (MultiProbCut | None, optional): parameters of the selective
+        search, see `negamax()`. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions, see `negamax()`. Defaults to None.
+        search_id (int | None, optional): identifier of the root search, the
+        transposition table being cleared when it changes. Defaults to None, to
+        keep the table.
+
+    Raises:
+        SearchTimeout: when the deadline is passed.
+
+    Returns:
+        float: evaluation score, positive when the player to play at the root has
+        the advantage.
+    """
+    global worker_evaluation_weights, worker_search_id
+
+    if worker_transposition_table is None:
+        init_worker(WORKER_TRANSPOSITION_TABLE_MB)
+
+    transposition_table = cast(TranspositionTable, worker_transposition_table)
+
+    # Scores of other weights are meaningless
+    if evaluation_weights != worker_evaluation_weights:
+        StaticEvaluation.set_evaluation_weights(
+            cast(tuple[float, float, float, float, float, float], evaluation_weights)
+        )
+        transposition_table.clear()
+        worker_evaluation_weights = evaluation_weights
+
+    # Results of another root search may be deeper, and change the scores
+    if search_id is not None and search_id != worker_search_id:
+        transposition_table.clear()
+        worker_search_id = search_id
+
+    game = position_to_game(position)
+    game.make_move(move)
+
+    return search_child(
+        game,
+        position.player_value,
+        depth,
+        alpha,
+        beta,
+        static_evaluation_func,
+        transposition_table,
+        deadline,
+        worker_move_ordering,
+        principal_variation=True,
+        multi_probcut=multi_probcut,
+        late_move_reductions=late_move_reductions,
+    )
+
+
+def parallel_search_root(
+    executor: Executor,
+    game: AnyGame,
+    legal_moves: np.ndarray[Any, np.dtype[Any]],
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    deadline: float | None = None,
+    alpha: float = -np.inf,
+    beta: float = np.inf,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+) -> tuple[tuple[int, int], float]:
+    """Return the best of the given legal moves like `search_root()`, searching the
+    moves in worker processes.
+
+    The first move is searched alone to get a bound (Young Brothers Wait), then the
+    others are searched in parallel with a null window, and those beating the
+    bound are searched again with the full window. Scores are the same as in a
+    single process, and so is the best move.
+
+    Args:
+        executor (Executor): worker processes, see `create_executor()`.
+        game (AnyGame): a game.
+        legal_moves (np.ndarray[Any, np.dtype[Any]]): column and row of the moves to
+        search.
+        depth (int): depth of the search.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function, which must be picklable.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned. Defaults to None.
+        alpha (float, optional): alpha parameter of pruning. Defaults to -inf.
+        beta (float, optional): beta parameter of pruning. Defaults to inf.
+        multi_probcut (MultiProbCut | None, optional): parameters of the selective
+        search below the root, see `negamax()`. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions below the root, see `negamax()`. Defaults to None.
+
+    Raises:
+        SearchTimeout: when the deadline is passed.
+
+    Returns:
+        tuple[tuple[int, int], float]: row and column of the best move and its
+        score, with the same bounds as `search_root()`.
+    """
+    position = get_position(game)
+    moves = [(int(col), int(row)) for col, row in legal_moves]
+    futures: list[Future[float]] = []
+    search_id = next(root_search_ids)
+
+    # Weights may be set from a chromosome array
+    evaluation_weights = tuple(map(float, StaticEvaluation.evaluation_weights))
+
+    def submit(move: tuple[int, int], alpha: float, beta: float) -> Future[float]:
+        future = executor.submit(
+            search_move,
+            position,
+            move,
+            depth,
+            static_evaluation_func,
+            evaluation_weights,
+            alpha,
+            beta,
+            deadline,
+            multi_probcut,
+            late_move_reductions,
+            search_id,
+        )
+        futures.append(future)
+
+        return future
+
+    try:
+        best_eval = submit(moves[0], alpha, beta).result()
+        alpha = max(alpha, best_eval)
+
+        if beta <= alpha:
+            return cast(tuple[int, int], legal_moves[0]), best_eval
+
+        scouts = [submit(move, alpha, null_window(alpha)) for move in moves[1:]]
+        searches = []
+
+        # Moves beating the bound are searched again as soon as it is known
+        for move, scout in zip(moves[1:], scouts):
+            score = scout.result()
+            searches.append(
+                submit(move, alpha, beta) if alpha < score < beta else scout
             )
-            min_eval = min(min_eval, child_eval)
 
-            beta = min(beta, child_eval)
-            if beta <= alpha:
+        best_index = 0
+
+        for index, search in enumerate(searches, 1):
+            score = search.result()
+
+            # Ties keep the first move
+            if score > best_eval:
+                best_eval = score
+                best_index = index
+
+            if best_eval >= beta:
                 break
+    finally:
+        for future in futures:
+            future.cancel()
+
+    return cast(tuple[int, int], legal_moves[best_index]), best_eval
 
-        return min_eval
+
+def get_max_depth(game: AnyGame, depth: int) -> int:
+    """Return the depth of the deepest useful search, searches deeper than the
+    remaining empty cells reaching the end of the game.
+
+    Args:
+        game (AnyGame): a game.
+        depth (int): maximum depth of the search.
+
+    Returns:
+        int: depth of the search below the root moves.
+    """
+    return min(depth, get_empty_count(game) - 1)
+
+
+def get_empty_count(game: AnyGame) -> int:
+    """Return the number of empty cells of a game.
+
+    Args:
+        game (AnyGame): a game.
+
+    Returns:
+        int: number of empty cells.
+    """
+    return (
+        BOARD_CELL_LENGTH ** 2
+        - game.get_black_piece_count()
+        - game.get_white_piece_count()
+    )
 
 
 def think(
-    game: Game, depth: int, static_evaluation_func: Callable[[Game], float]
+    game: AnyGame,
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    transposition_table: TranspositionTable | None = None,
+    time_budget: float | None = None,
+    executor: Executor | None = None,
+    endgame_empties: int | None = None,
+    endgame_exact: bool = True,
+    multi_probcut: MultiProbCut | None = None,
+    late_move_reductions: LateMoveReductions | None = None,
+    statistics: SearchStatistics | None = None,
+    opening_book: OpeningBook | None = None,
 ) -> tuple[int, int]:
     """Return the best move to play according to the game position,
     the player turn, a searching depth and a static evaluation method.
 
-    Args:
-        game (Game): a game.
-        depth (int): depth of the search.
-        static_evaluation_func (Callable[[Game], float]): position evaluation function.
+    With a time budget, the position is searched at depth 0, 1, 2... until the budget
+    is spent, and the best move of the last completed search is returned. Each
+    search starts with the best move of the previous one, in an aspiration window
+    around its score.
+
+    With few enough empty cells, the game is solved until the end instead, falling
+    back to the evaluation if the budget is spent first. Book positions are not
+    searched at all.
 
+    Args:
+        game (AnyGame): a game.
+        depth (int): depth of the search, maximum depth with a time budget.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        transposition_table (TranspositionTable | None, optional): table kept
+        between calls to reuse the previous searches. Defaults to None.
+        time_budget (float | None, optional): seconds given to the search. Defaults
+        to None.
+        executor (Executor | None, optional): worker processes the root moves are
+        searched in, see `create_executor()`. The transposition table of the
+        workers is used instead of the given one. Defaults to None.
+        endgame_empties (int | None, optional): number of empty cells from which the
+        game is solved, e.g. `ENDGAME_EMPTIES`, never if None. Defaults to None.
+        endgame_exact (bool, optional): if the solver maximizes the final disc
+        difference, else only the win, loss or draw, which is faster. Defaults to
+        True.
+        multi_probcut (MultiProbCut | None, optional): parameters of the selective
+        search, e.g. `MultiProbCut.load()`, which searches deeper in the same time
+        but may miss the best move. Defaults to None.
+        late_move_reductions (LateMoveReductions | None, optional): depth
+        reductions of the last moves, e.g. `LateMoveReductions()`, which also
+        searches deeper in the same time but may miss the best move. Defaults to
+        None.
+        statistics (SearchStatistics | None, optional): counters reset and filled
+        by the search, without overhead if None. The evaluation is only timed
+        without an executor. Defaults to None.
+        opening_book (OpeningBook | None, optional): best moves of the opening
+        positions, e.g. `OpeningBook.load()`, played without searching. Defaults to
+        None.
 
     Returns:
         tuple[int, int]: row and column of the best move.
     """
-    maximizing_player = game.player_value == BLACK_VALUE
-    scores = []
+    deadline = None if time_budget is None else time.perf_counter() + time_budget
+
+    if statistics is not None:
+        statistics.start(transposition_table)
+
+        # Worker processes need a picklable function
+        if executor is None:
+            static_evaluation_func = statistics.time_evaluation(static_evaluation_func)
+
+    try:
+        if opening_book is not None:
+            book_move = opening_book.lookup(game)
+
+            if book_move is not None:
+                return book_move
+
+        if endgame_empties is not None and get_empty_count(game) <= endgame_empties:
+            try:
+                solver = EndgameSolver(deadline, stop_flag=worker_stop_flag)
+                best_move, _ = solver.solve_move(game, endgame_exact)
+
+                if statistics is not None:
+                    statistics.node_count += solver.node_count
 
-    for legal_move in game.indicators:
-        game_copy = deepcopy(game)  # Copy without reference
-        game_copy.play_piece(legal_move)
+                return best_move
+            except SolverTimeout:
+                pass
 
-        scores.append(
-            minimax(
-                game_copy,
+        # Moves leading to symmetric positions have the same score
+        legal_moves = remove_symmetric_moves(game.board, game.indicators)
+
+        # Ordering the moves below the root leaves the scores unchanged
+        move_ordering = MoveOrdering()
+
+        if deadline is None:
+            best_move, _ = search_root(
+                game,
+                legal_moves,
                 depth,
-                -np.inf,
-                np.inf,
                 static_evaluation_func,
-                maximizing_player,
+                transposition_table,
+                move_ordering=move_ordering,
+                executor=executor,
+                multi_probcut=multi_probcut,
+                late_move_reductions=late_move_reductions,
+                statistics=statistics,
             )
+
+            if statistics is not None:
+                statistics.record_iteration(depth, 0)
+
+            return best_move
+
+        # The shallowest search always completes so that a move is found
+        best_move, best_eval = search_root(
+            game,
+            legal_moves,
+            0,
+            static_evaluation_func,
+            transposition_table,
+            move_ordering=move_ordering,
+            statistics=statistics,
         )
 
-    min_index = np.array(scores).argmin()
-    max_index = np.array(scores).argmax()
+        if statistics is not None:
+            statistics.record_iteration(0, 0)
 
-    return (
-        cast(tuple[int, int], game.indicators[max_index])
-        if maximizing_player
-        else cast(tuple[int, int], game.indicators[min_index])
+        for current_depth in range(1, get_max_depth(game, depth) + 1):
+            # Search the previous best move first
+            is_best_move = np.all(legal_moves == best_move, axis=1)
+            legal_moves = np.concatenate(
+                [legal_moves[is_best_move], legal_moves[~is_best_move]]
+            )
+
+            start_node_count = 0 if statistics is None else statistics.node_count
+
+            try:
+                best_move, best_eval = search_aspiration(
+                    game,
+                    legal_moves,
+                    current_depth,
+                    static_evaluation_func,
+                    best_eval,
+                    transposition_table,
+                    deadline,
+                    move_ordering,
+                    executor,
+                    multi_probcut,
+                    late_move_reductions,
+                    statistics,
+                )
+            except SearchTimeout:
+                break
+
+            if statistics is not None:
+                statistics.record_iteration(current_depth, start_node_count)
+
+        return best_move
+    finally:
+        if statistics is not None:
+            statistics.stop(transposition_table)
+
+
+def init_lazy_smp_worker(
+    transposition_table_name: str, transposition_table_mb: float, stop_flag: Any
+) -> None:
+    """Open the shared search state of a Lazy SMP helper process.
+
+    Args:
+        transposition_table_name (str): name of the shared transposition table.
+        transposition_table_mb (float): memory used by the shared transposition
+        table in megabytes.
+        stop_flag (Any): shared flag telling the helper to stop.
+    """
+    global worker_transposition_table, worker_move_ordering, worker_stop_flag
+
+    worker_transposition_table = SharedTranspositionTable(
+        transposition_table_mb, transposition_table_name
+    )
+    worker_move_ordering = MoveOrdering()
+    worker_stop_flag = stop_flag
+
+
+def lazy_smp_search(
+    position: Position,
+    depth: int,
+    static_evaluation_func: Callable[[AnyGame], float],
+    evaluation_weights: tuple[float, ...],
+    helper_index: int,
+    deadline: float | None = None,
+) -> int:
+    """Search a root in a Lazy SMP helper process, at depth 1, 2... until stopped,
+    filling the shared transposition table.
+
+    Helpers start with different root moves, and odd helpers search one ply deeper,
+    so that they do not all search the same positions at the same time.
+
+    Args:
+        position (Position): compact root position.
+        depth (int): depth of the deepest search below the root moves.
+        static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+        function.
+        evaluation_weights (tuple[float, ...]): weights of
+        `StaticEvaluation.evaluate()` in the main process.
+        helper_index (int): index of the helper.
+        deadline (float | None, optional): `time.perf_counter()` value after which
+        the search is abandoned, the clock being system-wide. Defaults to None.
+
+    Returns:
+        int: depth of the deepest completed search, 0 if none completed.
+    """
+    StaticEvaluation.set_evaluation_weights(
+        cast(tuple[float, float, float, float, float, float], evaluation_weights)
     )
+
+    game = position_to_game(position)
+    legal_moves = np.roll(game.indicators, -helper_index, axis=0)
+    completed_depth = 0
+
+    for current_depth in range(1, depth + 1):
+        search_depth = min(current_depth + helper_index % 2, depth)
+
+        try:
+            search_root(
+                game,
+                legal_moves,
+                search_depth,
+                static_evaluation_func,
+                worker_transposition_table,
+                deadline,
+                worker_move_ordering,
+            )
+        except SearchTimeout:
+            break
+
+        completed_depth = search_depth
+
+    return completed_depth
+
+
+class LazySMP:
+    """Lazy SMP search: helper processes search the same root as the main process,
+    sharing its transposition table, so that the main search finds most of its
+    positions already searched.
+
+    The helpers run in a process pool kept between searches, the instance is meant
+    to be kept during a game and closed afterwards.
+    """
+    helper_count: int
+    transposition_table: SharedTranspositionTable
+
+    # Depth of the deepest search completed by each helper during the last search
+    completed_depths: list[int]
+
+    def __init__(
+        self,
+        helper_count: int | None = None,
+        transposition_table_mb: float = WORKER_TRANSPOSITION_TABLE_MB,
+    ) -> None:
+        """
+        Args:
+            helper_count (int | None, optional): number of helper processes, the
+            number of CPUs minus one if None. Defaults to None.
+            transposition_table_mb (float, optional): memory used by the shared
+            transposition table in megabytes. Defaults to
+            `WORKER_TRANSPOSITION_TABLE_MB`.
+        """
+        if helper_count is None:
+            helper_count = max(1, (os.cpu_count() or 1) - 1)
+
+        self.helper_count = helper_count
+        self.transposition_table = SharedTranspositionTable(transposition_table_mb)
+        self.stop_flag = multiprocessing.RawValue(ctypes.c_bool, False)
+        self.evaluation_weights: tuple[float, ...] | None = None
+        self.completed_depths = []
+
+        self.executor = ProcessPoolExecutor(
+            helper_count,
+            initializer=init_lazy_smp_worker,
+            initargs=(
+                self.transposition_table.name,
+                transposition_table_mb,
+                self.stop_flag,
+            ),
+        )
+
+    def __enter__(self) -> "LazySMP":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the helper processes and free the shared transposition table."""
+        self.executor.shutdown()
+        self.transposition_table.close()
+        self.transposition_table.unlink()
+
+    def think(
+        self,
+        game: AnyGame,
+        depth: int,
+        static_evaluation_func: Callable[[AnyGame], float],
+        time_budget: float | None = None,
+    ) -> tuple[int, int]:
+        """Return the best move to play like `think()`, the helpers searching
+        alongside the main process until its search is over.
+
+        Args:
+            game (AnyGame): a game.
+            depth (int): depth of the search, maximum depth with a time budget.
+            static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+            function, which must be picklable.
+            time_budget (float | None, optional): seconds given to the search.
+            Defaults to None.
+
+        Returns:
+            tuple[int, int]: row and column of the best move.
+        """
+        # Weights may be set from a chromosome array
+        evaluation_weights = tuple(map(float, StaticEvaluation.evaluation_weights))
+
+        # Scores of other weights are meaningless
+        if evaluation_weights != self.evaluation_weights:
+            self.transposition_table.clear()
+            self.evaluation_weights = evaluation_weights
+
+        deadline = None if time_budget is None else time.perf_counter() + time_budget
+        position = get_position(game)
+        max_depth = get_max_depth(game, depth)
+
+        helpers = [
+            self.executor.submit(
+                lazy_smp_search,
+                position,
+                max_depth,
+                static_evaluation_func,
+                evaluation_weights,
+                helper_index,
+                deadline,
+            )
+            for helper_index in range(self.helper_count)
+        ]
+
+        try:
+            return think(
+                game,
+                depth,
+                static_evaluation_func,
+                self.transposition_table,
+                time_budget,
+            )
+        finally:
+            # Helpers stop at their next node
+            self.stop_flag.value = True
+            self.completed_depths = [helper.result() for helper in helpers]
+            self.stop_flag.value = False
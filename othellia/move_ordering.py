@@ -0,0 +1,103 @@
+from typing import Any
+
+import numpy as np
+
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import NO_MOVE
+from settings.board import BOARD_CELL_LENGTH
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import cell_index_to_square, square_to_cell_index
+
+# Killer moves remembered for each depth
+KILLER_COUNT: int = 2
+
+
+class MoveOrdering:
+    """Class sorting moves so that alpha-beta pruning tries the best ones first.
+
+    Moves are tried in this order: the transposition table move, the killer moves
+    (moves that caused a cutoff at the same depth), then by square weight, corners
+    first and X/C squares last, ties being broken by the history heuristic (how
+    often and how deep a move caused a cutoff).
+    """
+    killers: dict[int, list[int]]
+    history: dict[int, list[int]]
+
+    # Weight of each square index, from the static weights of the evaluation
+    square_weights: tuple[int, ...] = tuple(
+        int(StaticEvaluation.square_weights[row, col])
+        for col, row in map(square_to_cell_index, range(BOARD_CELL_LENGTH ** 2))
+    )
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget the killer moves and the history."""
+        self.killers = {}
+        self.history = {
+            BLACK_VALUE: [0] * BOARD_CELL_LENGTH ** 2,
+            WHITE_VALUE: [0] * BOARD_CELL_LENGTH ** 2,
+        }
+
+    def order(
+            self,
+            moves: np.ndarray[Any, np.dtype[Any]],
+            depth: int,
+            player_value: int,
+            tt_move: int = NO_MOVE,
+    ) -> list[tuple[int, int]]:
+        """Sort the legal moves of a position, the most promising first.
+
+        Args:
+            moves (np.ndarray[Any, np.dtype[Any]]): column and row of the moves.
+            depth (int): remaining depth of the search.
+            player_value (int): value of the player to play.
+            tt_move (int, optional): square index of the transposition table move.
+            Defaults to `NO_MOVE`.
+
+        Returns:
+            list[tuple[int, int]]: column and row of the sorted moves.
+        """
+        killers = self.killers.get(depth, [])
+        history = self.history[player_value]
+
+        def priority(square: int) -> tuple[bool, int, int, int]:
+            killer_rank = (
+                KILLER_COUNT - killers.index(square) if square in killers else 0
+            )
+
+            return (
+                square == tt_move,
+                killer_rank,
+                self.square_weights[square],
+                history[square],
+            )
+
+        squares = sorted(
+            (cell_index_to_square(move) for move in moves.tolist()),
+            key=priority,
+            reverse=True,
+        )
+
+        return [square_to_cell_index(square) for square in squares]
+
+    def record_cutoff(
+            self, move: tuple[int, int], depth: int, player_value: int
+    ) -> None:
+        """Remember a move that caused a cutoff.
+
+        Args:
+            move (tuple[int, int]): column and row of the move.
+            depth (int): remaining depth of the search.
+            player_value (int): value of the player who played the move.
+        """
+        square = cell_index_to_square(move)
+
+        killers = self.killers.setdefault(depth, [])
+        if square not in killers:
+            killers.insert(0, square)
+            del killers[KILLER_COUNT:]
+
+        # Deep cutoffs save the most nodes
+        self.history[player_value][square] += depth * depth
@@ -0,0 +1,163 @@
+import os
+from typing import NamedTuple
+
+import numpy as np
+
+from othellia.bitboard import AnyGame
+from othellia.zobrist import compute_hash
+from utils.game import cell_index_to_square, square_to_cell_index
+from utils.symmetry import (
+    canonicalize,
+    inverse_transform_cell_index,
+    transform_cell_index,
+)
+
+# Record of a book entry on disk: hash of the canonical position, best move on the
+# canonical board as a square index, depth and score of its search
+BOOK_DTYPE: np.dtype = np.dtype(
+    [
+        ("key", np.uint64),
+        ("move", np.int8),
+        ("depth", np.int8),
+        ("score", np.float32),
+    ]
+)
+
+
+class BookEntry(NamedTuple):
+    """Best move of a book position, on its canonical board."""
+    move: int
+    depth: int
+    score: float
+
+
+def get_canonical_key(game: AnyGame) -> tuple[int, int]:
+    """Return the key of a position in the book, the same for all the positions of
+    its symmetry class.
+
+    Args:
+        game (AnyGame): a game.
+
+    Returns:
+        tuple[int, int]: hash of the canonical position and index of the symmetry
+        transforming the board into it.
+    """
+    canonical_board, symmetry = canonicalize(game.board)
+
+    return compute_hash(canonical_board, game.player_value), symmetry
+
+
+class OpeningBook:
+    """Best moves of the opening positions, searched in advance (see
+    `othellia.book_builder`) and played at once.
+
+    Positions are stored once per symmetry class, with the move on the canonical
+    board. Moves only make sense for the evaluation function they were searched
+    with.
+    """
+    entries: dict[int, BookEntry]
+
+    # Book searched with the genetic weights of `StaticEvaluation.evaluate()`
+    book_path: str = os.path.abspath("data/opening_book.npy")
+
+    def __init__(self, entries: dict[int, BookEntry] | None = None) -> None:
+        """
+        Args:
+            entries (dict[int, BookEntry] | None, optional): entries indexed by
+            canonical hash. Defaults to None, for none.
+        """
+        self.entries = {} if entries is None else entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: str | None = None) -> "OpeningBook":
+        """Load a book saved by `save()`.
+
+        Args:
+            path (str | None, optional): path of the book file. Defaults to None,
+            for `book_path`.
+
+        Returns:
+            OpeningBook: loaded book.
+        """
+        records = np.load(cls.book_path if path is None else path)
+
+        return cls(
+            {
+                key: BookEntry(move, depth, score)
+                for key, move, depth, score in records.tolist()
+            }
+        )
+
+    def save(self, path: str | None = None) -> None:
+        """Save the book to a binary file of `BOOK_DTYPE` records sorted by key.
+
+        The file is replaced at once, an interrupted save leaves the previous one.
+
+        Args:
+            path (str | None, optional): path of the book file. Defaults to None,
+            for `book_path`.
+        """
+        path = self.book_path if path is None else path
+        records = np.array(
+            [(key, *entry) for key, entry in sorted(self.entries.items())],
+            dtype=BOOK_DTYPE,
+        )
+
+        # Written to an open file so that no extension is added
+        with open(f"{path}.tmp", "wb") as file:
+            np.save(file, records)
+
+        os.replace(f"{path}.tmp", path)
+
+    def get_entry(self, game: AnyGame) -> BookEntry | None:
+        """Look a position up.
+
+        Args:
+            game (AnyGame): a game.
+
+        Returns:
+            BookEntry | None: entry of the position, None if it is not in the book.
+        """
+        key, _ = get_canonical_key(game)
+
+        return self.entries.get(key)
+
+    def add(
+            self, game: AnyGame, move: tuple[int, int], depth: int, score: float
+    ) -> None:
+        """Store the best move of a position, replacing the previous one.
+
+        Args:
+            game (AnyGame): a game.
+            move (tuple[int, int]): column and row of the best move.
+            depth (int): depth of the search of the move.
+            score (float): score of the move, from the point of view of the player
+            to play.
+        """
+        key, symmetry = get_canonical_key(game)
+        canonical_move = transform_cell_index(move, symmetry)
+
+        self.entries[key] = BookEntry(
+            cell_index_to_square(canonical_move), depth, score
+        )
+
+    def lookup(self, game: AnyGame) -> tuple[int, int] | None:
+        """Return the best move of a position if it is in the book.
+
+        Args:
+            game (AnyGame): a game.
+
+        Returns:
+            tuple[int, int] | None: column and row of the best move, None if the
+            position is not in the book.
+        """
+        key, symmetry = get_canonical_key(game)
+        entry = self.entries.get(key)
+
+        if entry is None:
+            return None
+
+        return inverse_transform_cell_index(square_to_cell_index(entry.move), symmetry)
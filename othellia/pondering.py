@@ -0,0 +1,230 @@
+import ctypes
+import threading
+from typing import Callable
+
+import numpy as np
+
+from othellia.bitboard import AnyGame, Position, get_position, position_to_game
+from othellia.minimax import SearchTimeout, search_child, set_stop_flag, think
+from othellia.opening_book import OpeningBook
+from othellia.transposition import TranspositionTable
+
+# Replies of the opponent searched in advance, the most likely first
+PONDER_REPLY_COUNT: int = 4
+
+# Depth of the search sorting the opponent's replies by likelihood
+PONDER_ORDER_DEPTH: int = 1
+
+
+class Ponderer:
+    """Class searching the likely replies of the opponent in a background thread
+    while it thinks, so that the best move is known as soon as it plays (ponder
+    hit). Otherwise (ponder miss), the position is searched as usual, with a
+    transposition table warmed by the pondering.
+
+    The thread and the searches of the main thread share the transposition table
+    and the stop flag of the process, there must be a single ponderer or running
+    search handle at a time.
+    """
+    depth: int
+    static_evaluation_func: Callable[[AnyGame], float]
+    transposition_table: TranspositionTable
+    time_budget: float
+    endgame_empties: int | None
+    reply_count: int
+    opening_book: OpeningBook | None
+
+    stop_flag: ctypes.c_bool
+    thread: threading.Thread | None
+    results: dict[Position, tuple[int, int]]
+    hits: int
+    misses: int
+
+    def __init__(
+            self,
+            depth: int,
+            static_evaluation_func: Callable[[AnyGame], float],
+            transposition_table: TranspositionTable,
+            time_budget: float,
+            endgame_empties: int | None = None,
+            reply_count: int = PONDER_REPLY_COUNT,
+            opening_book: OpeningBook | None = None,
+    ) -> None:
+        """
+        Args:
+            depth (int): maximum depth of the searches, see `think()`.
+            static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+            function.
+            transposition_table (TranspositionTable): table kept during the game.
+            time_budget (float): seconds given to each search.
+            endgame_empties (int | None, optional): number of empty cells from which
+            the game is solved, see `think()`. Defaults to None.
+            reply_count (int, optional): number of replies searched in advance.
+            Defaults to `PONDER_REPLY_COUNT`.
+            opening_book (OpeningBook | None, optional): best moves of the opening
+            positions, see `think()`. Defaults to None.
+        """
+        self.depth = depth
+        self.static_evaluation_func = static_evaluation_func
+        self.transposition_table = transposition_table
+        self.time_budget = time_budget
+        self.endgame_empties = endgame_empties
+        self.reply_count = reply_count
+        self.opening_book = opening_book
+
+        self.stop_flag = ctypes.c_bool(False)
+        self.thread = None
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    def start(self, game: AnyGame) -> None:
+        """Start searching the replies of the player to play in the background,
+        forgetting the previous ones.
+
+        Args:
+            game (AnyGame): a game, with the opponent to play. It may change during
+            the pondering.
+        """
+        self.stop()
+        self.results = {}
+
+        set_stop_flag(self.stop_flag)
+        self.thread = threading.Thread(
+            target=self.ponder, args=(get_position(game),), daemon=True
+        )
+        self.thread.start()
+
+    def stop(self) -> None:
+        """Stop the pondering and wait for the thread to end."""
+        if self.thread is None:
+            return
+
+        self.stop_flag.value = True
+        self.thread.join()
+        self.stop_flag.value = False
+        self.thread = None
+
+    def ponder(self, position: Position) -> None:
+        """Search the best move after each likely reply, until stopped. Run by the
+        pondering thread.
+
+        Args:
+            position (Position): compact position, with the opponent to play.
+        """
+        game = position_to_game(position)
+
+        try:
+            for reply in self.get_likely_replies(game):
+                record = game.make_move(reply)
+
+                # The opponent may have to play again
+                if not game.is_over and game.player_value != position.player_value:
+                    move = think(
+                        game,
+                        self.depth,
+                        self.static_evaluation_func,
+                        self.transposition_table,
+                        self.time_budget,
+                        endgame_empties=self.endgame_empties,
+                        opening_book=self.opening_book,
+                    )
+
+                    # The best move of an interrupted search is not the usual one
+                    if self.stop_flag.value:
+                        return
+
+                    self.results[get_position(game)] = move
+
+                # Unlike setting the position back, also resumes a game the reply
+                # ended
+                game.unmake_move(record)
+        except SearchTimeout:
+            return
+
+    def get_likely_replies(self, game: AnyGame) -> list[tuple[int, int]]:
+        """Return the replies of the opponent it most likely plays, according to a
+        shallow search.
+
+        Args:
+            game (AnyGame): a game, with the opponent to play.
+
+        Raises:
+            SearchTimeout: when the pondering is stopped.
+
+        Returns:
+            list[tuple[int, int]]: column and row of the replies, the most likely
+            first.
+        """
+        player_value = game.player_value
+        replies = [(int(col), int(row)) for col, row in game.indicators]
+        scores = []
+
+        for reply in replies:
+            record = game.make_move(reply)
+            try:
+                scores.append(
+                    search_child(
+                        game,
+                        player_value,
+                        PONDER_ORDER_DEPTH - 1,
+                        -np.inf,
+                        np.inf,
+                        self.static_evaluation_func,
+                    )
+                )
+            finally:
+                game.unmake_move(record)
+
+        # Stable sort, ties keep the move order
+        order = np.argsort(-np.array(scores), kind="stable")
+
+        return [replies[index] for index in order[: self.reply_count]]
+
+    def get_result(self, game: AnyGame) -> tuple[int, int] | None:
+        """Stop the pondering and return the best move to play if it was searched in
+        advance.
+
+        Args:
+            game (AnyGame): a game, after the opponent's reply.
+
+        Returns:
+            tuple[int, int] | None: column and row of the best move, None on a ponder
+            miss.
+        """
+        self.stop()
+
+        move = self.results.get(get_position(game))
+        self.results = {}
+
+        if move is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return move
+
+    def think(self, game: AnyGame) -> tuple[int, int]:
+        """Stop the pondering and return the best move to play, at once if it was
+        searched in advance.
+
+        Args:
+            game (AnyGame): a game, after the opponent's reply.
+
+        Returns:
+            tuple[int, int]: column and row of the best move.
+        """
+        move = self.get_result(game)
+
+        if move is not None:
+            return move
+
+        return think(
+            game,
+            self.depth,
+            self.static_evaluation_func,
+            self.transposition_table,
+            self.time_budget,
+            endgame_empties=self.endgame_empties,
+            opening_book=self.opening_book,
+        )
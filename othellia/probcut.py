@@ -0,0 +1,185 @@
+import os
+from typing import Any, NamedTuple
+
+import numpy as np
+from numpy import ndarray, dtype
+
+from settings.board import BOARD_CELL_LENGTH
+
+# Depth of the shallow search predicting the result of each deep search, of the
+# same parity since the evaluation swings with the player to move
+PROBCUT_DEPTHS: dict[int, int] = {3: 1, 4: 2, 5: 1, 6: 2}
+
+# Game phases with their own regression, by number of empty cells
+PHASE_COUNT: int = 4
+
+# Number of standard deviations the prediction must be outside of the window by
+# for the subtree to be pruned
+PROBCUT_THRESHOLD: float = 1.5
+
+# Names of the columns of the parameters file: phase, depth, shallow depth, slope,
+# intercept and standard deviation of the residuals
+PARAMETER_COLUMNS: tuple[str, ...] = (
+    "phase",
+    "depth",
+    "shallow_depth",
+    "slope",
+    "intercept",
+    "sigma",
+)
+
+
+class ProbCutParameters(NamedTuple):
+    """Linear regression predicting a deep search score from a shallow one."""
+    shallow_depth: int
+    slope: float
+    intercept: float
+    sigma: float
+
+
+def get_phase(empty_count: int) -> int:
+    """Return the game phase of a position.
+
+    Args:
+        empty_count (int): number of empty cells.
+
+    Returns:
+        int: phase index, 0 for the opening.
+    """
+    move_count = BOARD_CELL_LENGTH ** 2 - 4 - empty_count
+
+    return min(
+        PHASE_COUNT - 1,
+        max(0, move_count) * PHASE_COUNT // (BOARD_CELL_LENGTH ** 2 - 4),
+    )
+
+
+class MultiProbCut:
+    """Multi-ProbCut parameters: a regression per game phase and per depth, the
+    subtrees of which are pruned when the shallow search predicts with high
+    confidence that the deep search falls outside of the window.
+
+    Scores only make sense for the evaluation function the parameters were fitted
+    with.
+    """
+    parameters: dict[tuple[int, int], ProbCutParameters]
+    threshold: float
+
+    # Parameters fitted for the genetic weights of `StaticEvaluation.evaluate()`
+    parameters_path: str = os.path.abspath("data/multi_probcut.csv")
+
+    def __init__(
+            self,
+            parameters: dict[tuple[int, int], ProbCutParameters] | None = None,
+            threshold: float = PROBCUT_THRESHOLD,
+    ) -> None:
+        """
+        Args:
+            parameters (dict[tuple[int, int], ProbCutParameters] | None, optional):
+            regressions indexed by phase and depth. Defaults to None, for none.
+            threshold (float, optional): number of standard deviations the
+            prediction must be outside of the window by. Defaults to
+            `PROBCUT_THRESHOLD`.
+        """
+        self.parameters = {} if parameters is None else parameters
+        self.threshold = threshold
+
+    @classmethod
+    def load(
+            cls, path: str | None = None, threshold: float = PROBCUT_THRESHOLD
+    ) -> "MultiProbCut":
+        """Load parameters saved by `save()`.
+
+        Args:
+            path (str | None, optional): path of the parameters file. Defaults to
+            None, for `parameters_path`.
+            threshold (float, optional): number of standard deviations the
+            prediction must be outside of the window by. Defaults to
+            `PROBCUT_THRESHOLD`.
+
+        Returns:
+            MultiProbCut: loaded parameters.
+        """
+        rows = np.loadtxt(
+            cls.parameters_path if path is None else path,
+            delimiter=",",
+            skiprows=1,
+            ndmin=2,
+        )
+
+        return cls(
+            {
+                (int(phase), int(depth)): ProbCutParameters(
+                    int(shallow_depth), slope, intercept, sigma
+                )
+                for phase, depth, shallow_depth, slope, intercept, sigma in rows
+            },
+            threshold,
+        )
+
+    def save(self, path: str | None = None) -> None:
+        """Save the parameters to a CSV file.
+
+        Args:
+            path (str | None, optional): path of the parameters file. Defaults to
+            None, for `parameters_path`.
+        """
+        rows = [
+            (phase, depth, *parameters)
+            for (phase, depth), parameters in sorted(self.parameters.items())
+        ]
+
+        np.savetxt(
+            self.parameters_path if path is None else path,
+            np.array(rows, dtype=float).reshape(-1, len(PARAMETER_COLUMNS)),
+            fmt=["%d", "%d", "%d", "%.6f", "%.6f", "%.6f"],
+            delimiter=",",
+            header=",".join(PARAMETER_COLUMNS),
+            comments="",
+        )
+
+    def get_parameters(self, depth: int, empty_count: int) -> ProbCutParameters | None:
+        """Return the regression of a search.
+
+        Args:
+            depth (int): depth of the search.
+            empty_count (int): number of empty cells of the position.
+
+        Returns:
+            ProbCutParameters | None: regression, None if the depth is not pruned.
+        """
+        return self.parameters.get((get_phase(empty_count), depth))
+
+    def fit(
+            self, scores: ndarray[Any, dtype[np.float64]], empty_counts: list[int]
+    ) -> None:
+        """Fit the regressions from the search scores of calibration positions.
+
+        Args:
+            scores (ndarray[Any, dtype[np.float64]]): scores of each position
+            (rows) searched at each depth from 0 (columns), from the point of view
+            of the player to play.
+            empty_counts (list[int]): number of empty cells of each position.
+        """
+        phases = np.array([get_phase(empty_count) for empty_count in empty_counts])
+
+        for phase in range(PHASE_COUNT):
+            phase_scores = scores[phases == phase]
+
+            # A regression needs a few points
+            if len(phase_scores) < 3:
+                continue
+
+            for depth, shallow_depth in PROBCUT_DEPTHS.items():
+                if depth >= scores.shape[1]:
+                    continue
+
+                shallow = phase_scores[:, shallow_depth]
+                deep = phase_scores[:, depth]
+
+                slope, intercept = np.polyfit(shallow, deep, 1)
+                sigma = np.std(deep - (slope * shallow + intercept), ddof=2)
+
+                self.parameters[(phase, depth)] = ProbCutParameters(
+                    shallow_depth, float(slope), float(intercept), float(sigma)
+                )
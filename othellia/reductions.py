@@ -0,0 +1,53 @@
+# Depth reduction of the moves of a node by remaining depth (rows) and index of the
+# move in the sorted moves (columns). The last row applies to deeper searches, the
+# last column to later moves. The first moves are never reduced, nor are nodes too
+# shallow to be in the table. Reductions are even so that the reduced search ends
+# with the same player to play, the evaluation swinging with it.
+LMR_REDUCTIONS: dict[int, tuple[int, ...]] = {
+    3: (0, 0, 0, 0, 2),
+}
+
+
+class LateMoveReductions:
+    """Late move reductions: with good move ordering, the best move is rarely among
+    the last ones, which are first searched at a reduced depth with a null window,
+    and searched again at full depth only if they beat alpha.
+
+    Reduced moves may be missed, which makes the score approximate.
+    """
+    reductions: dict[int, tuple[int, ...]]
+    min_depth: int
+    max_depth: int
+
+    def __init__(self, reductions: dict[int, tuple[int, ...]] | None = None) -> None:
+        """
+        Args:
+            reductions (dict[int, tuple[int, ...]] | None, optional): depth
+            reduction by remaining depth and by move index. Defaults to None, for
+            `LMR_REDUCTIONS`.
+        """
+        self.reductions = LMR_REDUCTIONS if reductions is None else reductions
+        self.min_depth = min(self.reductions, default=0)
+        self.max_depth = max(self.reductions, default=-1)
+
+    def get_reduction(self, depth: int, move_index: int) -> int:
+        """Return the depth reduction of a move.
+
+        Args:
+            depth (int): remaining depth of the node.
+            move_index (int): index of the move in the sorted moves, from 0.
+
+        Returns:
+            int: number of plies the move is searched less deep by, leaving at least
+            the leaves below it.
+        """
+        if depth < self.min_depth:
+            return 0
+
+        row = self.reductions.get(min(depth, self.max_depth), ())
+        if not row:
+            return 0
+
+        reduction = row[min(move_index, len(row) - 1)]
+
+        return max(0, min(reduction, depth - 1))
@@ -0,0 +1,200 @@
+import json
+import time
+from typing import Any, Callable, TextIO
+
+from othellia.bitboard import AnyGame
+from othellia.transposition import TranspositionTable
+from settings.board import BOARD_CELL_LENGTH
+
+
+class SearchStatistics:
+    """Counters of the searches of `think()`, collected when given to it and reset
+    at the start of each search.
+
+    Only the searches of the calling process are counted, not those of worker
+    processes, and the evaluation is only timed without them.
+    """
+    node_count: int
+    evaluation_count: int
+    evaluation_time: float
+    move_generation_time: float
+    cutoff_counts: list[int]
+    transposition_probes: int
+    transposition_hits: int
+    iteration_node_counts: dict[int, int]
+    depth_node_counts: dict[int, int]
+    elapsed_time: float
+    json_file: TextIO | None
+
+    def __init__(self, json_file: TextIO | None = None) -> None:
+        """
+        Args:
+            json_file (TextIO | None, optional): file a JSON line of the statistics
+            is written to after each search. Defaults to None.
+        """
+        self.json_file = json_file
+        self.reset()
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.node_count = 0
+        self.evaluation_count = 0
+        self.evaluation_time = 0.0
+        self.move_generation_time = 0.0
+
+        # Beta cutoffs by index of the move causing them in the sorted moves
+        self.cutoff_counts = [0] * BOARD_CELL_LENGTH ** 2
+
+        self.transposition_probes = 0
+        self.transposition_hits = 0
+
+        # Nodes of each completed iteration of the iterative deepening, by depth
+        self.iteration_node_counts = {}
+
+        # Nodes by remaining depth below them, all iterations together
+        self.depth_node_counts = {}
+
+        self.elapsed_time = 0.0
+
+        self._start_time = 0.0
+        self._start_counters = (0, 0)
+
+    def start(self, transposition_table: TranspositionTable | None = None) -> None:
+        """Reset the counters and start timing a search.
+
+        Args:
+            transposition_table (TranspositionTable | None, optional): table of the
+            search, whose probes are counted. Defaults to None.
+        """
+        self.reset()
+
+        if transposition_table is not None:
+            self._start_counters = (
+                transposition_table.hits,
+                transposition_table.misses,
+            )
+
+        self._start_time = time.perf_counter()
+
+    def stop(self, transposition_table: TranspositionTable | None = None) -> None:
+        """Stop timing a search and write its JSON line.
+
+        Args:
+            transposition_table (TranspositionTable | None, optional): table of the
+            search, given to `start()` too. Defaults to None.
+        """
+        self.elapsed_time = time.perf_counter() - self._start_time
+
+        if transposition_table is not None:
+            start_hits, start_misses = self._start_counters
+            self.transposition_hits = transposition_table.hits - start_hits
+            self.transposition_probes = (
+                self.transposition_hits + transposition_table.misses - start_misses
+            )
+
+        if self.json_file is not None:
+            self.json_file.write(self.to_json() + "\n")
+
+    def time_evaluation(
+            self, static_evaluation_func: Callable[[AnyGame], float]
+    ) -> Callable[[AnyGame], float]:
+        """Return the evaluation function counting and timing its calls, which are
+        the leaves of the search.
+
+        Args:
+            static_evaluation_func (Callable[[AnyGame], float]): position evaluation
+            function.
+
+        Returns:
+            Callable[[AnyGame], float]: same function, counted.
+        """
+        def evaluate(game: AnyGame) -> float:
+            start = time.perf_counter()
+            score = static_evaluation_func(game)
+            self.evaluation_time += time.perf_counter() - start
+            self.evaluation_count += 1
+
+            return score
+
+        return evaluate
+
+    def record_iteration(self, depth: int, start_node_count: int) -> None:
+        """Count the nodes of a completed iteration of the iterative deepening.
+
+        Args:
+            depth (int): depth of the iteration.
+            start_node_count (int): node count when the iteration started.
+        """
+        self.iteration_node_counts[depth] = self.node_count - start_node_count
+
+    @property
+    def nodes_per_second(self) -> float:
+        """Nodes searched per second, 0 before the end of the search."""
+        return self.node_count / self.elapsed_time if self.elapsed_time else 0.0
+
+    def record_node(self, depth: int) -> None:
+        """Count a node of the search.
+
+        Args:
+            depth (int): remaining depth of the search below the node.
+        """
+        self.node_count += 1
+        self.depth_node_counts[depth] = self.depth_node_counts.get(depth, 0) + 1
+
+    @property
+    def effective_branching_factors(self) -> dict[int, float]:
+        """Ratio of the nodes of each iteration to those of the previous one, by
+        depth.
+
+        Without iterative deepening, ratio of the nodes at each ply from the root to
+        those at the previous ply, by ply, from the remaining depths of the nodes.
+        """
+        if len(self.iteration_node_counts) > 1:
+            return {
+                depth: node_count / self.iteration_node_counts[depth - 1]
+                for depth, node_count in self.iteration_node_counts.items()
+                if self.iteration_node_counts.get(depth - 1)
+            }
+
+        # The children of the root have the deepest remaining depth
+        max_depth = max(self.depth_node_counts, default=0)
+
+        return {
+            max_depth + 1 - depth: node_count / self.depth_node_counts[depth + 1]
+            for depth, node_count in self.depth_node_counts.items()
+            if self.depth_node_counts.get(depth + 1)
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary of plain values.
+
+        Returns:
+            dict[str, Any]: counters and derived statistics, cutoff counts without
+            the trailing zeros.
+        """
+        cutoff_counts = list(self.cutoff_counts)
+        while cutoff_counts and not cutoff_counts[-1]:
+            cutoff_counts.pop()
+
+        return {
+            "nodes": self.node_count,
+            "evaluations": self.evaluation_count,
+            "evaluation_time": self.evaluation_time,
+            "move_generation_time": self.move_generation_time,
+            "elapsed_time": self.elapsed_time,
+            "nodes_per_second": self.nodes_per_second,
+            "cutoffs": cutoff_counts,
+            "transposition_probes": self.transposition_probes,
+            "transposition_hits": self.transposition_hits,
+            "iteration_nodes": self.iteration_node_counts,
+            "depth_nodes": self.depth_node_counts,
+            "effective_branching_factors": self.effective_branching_factors,
+        }
+
+    def to_json(self) -> str:
+        """Return the statistics as a single JSON line.
+
+        Returns:
+            str: JSON object of `to_dict()`, without a newline.
+        """
+        return json.dumps(self.to_dict())
@@ -1,5 +1,7 @@
 # type: ignore
 
+import math
+
 import numpy as np
 import pygame
 
@@ -11,6 +13,7 @@ from settings.colors import (
     ENDGAME_MESSAGE_DRAW_COLOR,
     ENDGAME_MESSAGE_WHITE_VICTORY_COLOR,
     INDICATOR_COLOR,
+    THINKING_INDICATOR_COLOR,
     WHITE_PIECE_COLOR,
 )
 from settings.graphics import (
@@ -20,6 +23,8 @@ from settings.graphics import (
     ENDGAME_MESSAGE_SIZE,
     INDICATOR_SIZE,
     PIECE_SIZE,
+    THINKING_INDICATOR_SIZE,
+    THINKING_INDICATOR_SPEED,
 )
 from settings.values import BLACK_VALUE
 
@@ -261,3 +266,44 @@ class EndgameMessage(pygame.sprite.Sprite):
 
     def draw(self, surface: pygame.SurfaceType) -> None:
         surface.blit(self.image, self.rect)
+
+
+class ThinkingIndicator(pygame.sprite.Sprite):
+    """Sprite of the thinking indicator.
+
+    An arc spins in the center of the board while the computer is thinking, the
+    window still responding meanwhile.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.image = pygame.Surface(
+            (THINKING_INDICATOR_SIZE, THINKING_INDICATOR_SIZE), pygame.SRCALPHA
+        )
+
+        self.rect = self.image.get_rect()
+        self.rect.center = (BOARD_SIZE / 2, BOARD_SIZE / 2)
+
+        self.update(0.0)
+
+    def update(self, elapsed: float) -> None:
+        """Update the angle of the arc.
+
+        Args:
+            elapsed (float): seconds since the computer started thinking.
+        """
+        angle = elapsed * THINKING_INDICATOR_SPEED
+
+        self.image.fill((0, 0, 0, 0))
+        pygame.draw.arc(
+            self.image,
+            (*THINKING_INDICATOR_COLOR, int(255 / 1.5)),
+            self.image.get_rect(),
+            angle,
+            angle + 3 * math.pi / 2,
+            width=THINKING_INDICATOR_SIZE // 8,
+        )
+
+    def draw(self, surface: pygame.SurfaceType) -> None:
+        surface.blit(self.image, self.rect)
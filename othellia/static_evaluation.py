@@ -3,7 +3,7 @@ from typing import cast
 
 import numpy as np
 
-from othellia.game import Game
+from othellia.bitboard import AnyGame
 from settings.values import BLACK_VALUE, WHITE_VALUE
 
 
@@ -26,15 +26,30 @@ class StaticEvaluation:
         0.2,
     )
 
+    # Value of a piece on each cell, indexed by row and column: corners are worth the
+    # most, X and C squares next to them the least
+    square_weights = np.array(
+        [
+            [4, -3, 2, 2, 2, 2, -3, 4],
+            [-3, -4, -1, -1, -1, -1, -4, -3],
+            [2, -1, 1, 0, 0, 1, -1, 2],
+            [2, -1, 0, 1, 1, 0, -1, 2],
+            [2, -1, 0, 1, 1, 0, -1, 2],
+            [2, -1, 1, 0, 0, 1, -1, 2],
+            [-3, -4, -1, -1, -1, -1, -4, -3],
+            [4, -3, 2, 2, 2, 2, -3, 4],
+        ]
+    )
+
     # Path to weights determine by a genetic algorithm
     genetic_weights_path = os.path.abspath("data/genetic_best_chromosome.txt")
 
     @staticmethod
-    def coin_parity(game: Game) -> float:
+    def coin_parity(game: AnyGame) -> float:
         """Evaluate the proportion of a black and white pieces over the total pieces.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
@@ -49,11 +64,11 @@ class StaticEvaluation:
         )
 
     @staticmethod
-    def actual_mobility(game: Game) -> float:
+    def actual_mobility(game: AnyGame) -> float:
         """Compare the number of black's legal moves over white's ones.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
@@ -71,11 +86,11 @@ class StaticEvaluation:
         )
 
     @staticmethod
-    def potential_mobility(game: Game) -> float:
+    def potential_mobility(game: AnyGame) -> float:
         """Compare the number of empty cells next to white pieces over black pieces.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
@@ -93,11 +108,11 @@ class StaticEvaluation:
         )
 
     @staticmethod
-    def corners_captured(game: Game) -> float:
+    def corners_captured(game: AnyGame) -> float:
         """Compare the number of captured corners of black against white.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
@@ -124,11 +139,11 @@ class StaticEvaluation:
         )
 
     @staticmethod
-    def future_corners_captured(game: Game) -> float:
+    def future_corners_captured(game: AnyGame) -> float:
         """Compare the number of possible corners to be captured by black against white.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
@@ -146,9 +161,7 @@ class StaticEvaluation:
         white_future_corner_cnt = (
             0
             if len(white_legal_moves) == 0
-            else np.all(
-                np.isin(game.get_white_legal_moves(), corners), axis=1
-            ).sum()
+            else np.all(np.isin(white_legal_moves, corners), axis=1).sum()
         )
 
         if black_future_corner_cnt + white_future_corner_cnt == 0:
@@ -161,27 +174,16 @@ class StaticEvaluation:
         )
 
     @staticmethod
-    def static_weights(game: Game) -> float:
+    def static_weights(game: AnyGame) -> float:
         """Compare black pieces weights sum against white.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
         """
-        weights = np.array(
-            [
-                [4, -3, 2, 2, 2, 2, -3, 4],
-                [-3, -4, -1, -1, -1, -1, -4, -3],
-                [2, -1, 1, 0, 0, 1, -1, 2],
-                [2, -1, 0, 1, 1, 0, -1, 2],
-                [2, -1, 0, 1, 1, 0, -1, 2],
-                [2, -1, 1, 0, 0, 1, -1, 2],
-                [-3, -4, -1, -1, -1, -1, -4, -3],
-                [4, -3, 2, 2, 2, 2, -3, 4],
-            ]
-        )
+        weights = StaticEvaluation.square_weights
 
         black_weights_sum = 0
         white_weights_sum = 0
@@ -200,13 +202,13 @@ class StaticEvaluation:
         return black_weights_sum - white_weights_sum
 
     @staticmethod
-    def evaluate(game: Game) -> float:
+    def evaluate(game: AnyGame) -> float:
         """Return the weighted evaluation of respectively coin_parity,
         actual_mobility, potential_mobility, corners_captured,
         future_corners_captured and static_weights scores.
 
         Args:
-            game (Game): a game.
+            game (AnyGame): a game.
 
         Returns:
             float: evaluation score.
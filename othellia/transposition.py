@@ -0,0 +1,314 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# Bound types of a stored score
+EXACT: int = 0
+LOWER_BOUND: int = 1
+UPPER_BOUND: int = 2
+
+# Best move of an entry without one
+NO_MOVE: int = -1
+
+# Bytes used by an entry: key, score, depth, bound and best move
+ENTRY_SIZE: int = 8 + 8 + 1 + 1 + 1
+
+# Bytes used by an entry of a shared table: checksum, score and packed depth, bound
+# and best move
+SHARED_ENTRY_SIZE: int = 3 * 8
+
+
+class TTEntry(NamedTuple):
+    """Search result stored for a position."""
+    depth: int
+    score: float
+    bound: int
+    best_move: int
+
+
+def compute_bucket_mask(size_mb: float, entry_size: int) -> int:
+    """Return the mask turning a hash into a bucket index, for the largest power of
+    two bucket count fitting in memory.
+
+    Args:
+        size_mb (float): memory used by the table in megabytes.
+        entry_size (int): bytes used by an entry.
+
+    Returns:
+        int: bucket count minus one.
+    """
+    entry_count = max(2, int(size_mb * 2 ** 20) // entry_size)
+
+    return (1 << ((entry_count // 2).bit_length() - 1)) - 1
+
+
+class TranspositionTable:
+    """Fixed size table of search results keyed by position hash.
+
+    Entries are stored in buckets of two slots. The first slot keeps the deepest
+    search (depth-preferred), the second one the latest search (always-replace).
+
+    Scores only make sense for the evaluation function they were computed with, the
+    table must be cleared when it changes.
+    """
+    keys: np.ndarray[Any, np.dtype[np.uint64]]
+    scores: np.ndarray[Any, np.dtype[np.float64]]
+    depths: np.ndarray[Any, np.dtype[np.int8]]
+    bounds: np.ndarray[Any, np.dtype[np.int8]]
+    best_moves: np.ndarray[Any, np.dtype[np.int8]]
+
+    hits: int
+    misses: int
+    collisions: int
+
+    def __init__(self, size_mb: float = 16) -> None:
+        """
+        Args:
+            size_mb (float, optional): memory used by the table in megabytes.
+            Defaults to 16.
+        """
+        # A power of two bucket count turns the modulo into a mask
+        self.bucket_mask = compute_bucket_mask(size_mb, ENTRY_SIZE)
+        self.size = 2 * (self.bucket_mask + 1)
+
+        self.keys = np.zeros(self.size, dtype=np.uint64)
+        self.scores = np.zeros(self.size, dtype=np.float64)
+        self.depths = np.zeros(self.size, dtype=np.int8)
+        self.bounds = np.zeros(self.size, dtype=np.int8)
+        self.best_moves = np.zeros(self.size, dtype=np.int8)
+
+        self.clear()
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        # A negative depth marks an empty slot
+        self.depths.fill(-1)
+        self.reset_counters()
+
+    def reset_counters(self) -> None:
+        """Reset the hit, miss and collision counters."""
+        self.hits = 0
+        self.misses = 0
+        self.collisions = 0
+
+    def get_slot_index(self, zobrist_hash: int) -> int:
+        """Return the index of the first slot of a position's bucket.
+
+        Args:
+            zobrist_hash (int): hash of the position.
+
+        Returns:
+            int: index of the depth-preferred slot.
+        """
+        return 2 * (zobrist_hash & self.bucket_mask)
+
+    def probe(self, zobrist_hash: int) -> TTEntry | None:
+        """Look a position up.
+
+        A miss is counted as a collision when the bucket holds other positions.
+
+        Args:
+            zobrist_hash (int): hash of the position.
+
+        Returns:
+            TTEntry | None: stored entry, None if the position is missing.
+        """
+        index = self.get_slot_index(zobrist_hash)
+
+        for slot in (index, index + 1):
+            if self.depths[slot] >= 0 and int(self.keys[slot]) == zobrist_hash:
+                self.hits += 1
+
+                return TTEntry(
+                    int(self.depths[slot]),
+                    float(self.scores[slot]),
+                    int(self.bounds[slot]),
+                    int(self.best_moves[slot]),
+                )
+
+        self.misses += 1
+        if self.depths[index] >= 0 or self.depths[index + 1] >= 0:
+            self.collisions += 1
+
+        return None
+
+    def store(
+            self,
+            zobrist_hash: int,
+            depth: int,
+            score: float,
+            bound: int,
+            best_move: int = NO_MOVE,
+    ) -> None:
+        """Store the search result of a position.
+
+        The depth-preferred slot is replaced by searches at least as deep, other
+        results go to the always-replace slot.
+
+        Args:
+            zobrist_hash (int): hash of the position.
+            depth (int): depth of the search.
+            score (float): score of the position.
+            bound (int): type of the score, `EXACT`, `LOWER_BOUND` or `UPPER_BOUND`.
+            best_move (int, optional): square index of the best move. Defaults to
+            `NO_MOVE`.
+        """
+        slot = self.get_slot_index(zobrist_hash)
+
+        if depth < self.depths[slot]:
+            slot += 1
+
+        self.keys[slot] = zobrist_hash
+        self.scores[slot] = score
+        self.depths[slot] = depth
+        self.bounds[slot] = bound
+        self.best_moves[slot] = best_move
+
+
+class SharedTranspositionTable(TranspositionTable):
+    """Transposition table in shared memory, used by several processes at once.
+
+    Entries are written without locks. Each one stores its score, its packed depth,
+    bound and best move, and the hash of the position XORed with both, so that an
+    entry torn by concurrent writes fails the check and is treated as missing.
+
+    The process creating the table must `unlink()` it once every process has
+    called `close()`.
+    """
+    entries: np.ndarray[Any, np.dtype[np.uint64]]
+    scores: np.ndarray[Any, np.dtype[np.float64]]
+
+    def __init__(self, size_mb: float = 16, name: str | None = None) -> None:
+        """
+        Args:
+            size_mb (float, optional): memory used by the table in megabytes, the
+            same in every process. Defaults to 16.
+            name (str | None, optional): name of the shared memory of a table
+            created by another process, None to create a new one. Defaults to None.
+        """
+        self.bucket_mask = compute_bucket_mask(size_mb, SHARED_ENTRY_SIZE)
+        self.size = 2 * (self.bucket_mask + 1)
+
+        if name is None:
+            self.shared_memory = SharedMemory(
+                create=True, size=self.size * SHARED_ENTRY_SIZE
+            )
+        else:
+            self.shared_memory = SharedMemory(name)
+
+        self.entries = np.ndarray(
+            (self.size, 3), dtype=np.uint64, buffer=self.shared_memory.buf
+        )
+        # Scores are read and written as floats through the same memory
+        self.scores = self.entries.view(np.float64)[:, 1]
+
+        if name is None:
+            self.clear()
+        else:
+            self.reset_counters()
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory, to open the table in another process."""
+        return self.shared_memory.name
+
+    def clear(self) -> None:
+        """Remove all the entries and reset the counters."""
+        # A zero depth field marks an empty slot
+        self.entries.fill(0)
+        self.reset_counters()
+
+    def close(self) -> None:
+        """Stop using the table in this process."""
+        del self.entries, self.scores
+        self.shared_memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory, once every process has closed the table."""
+        self.shared_memory.unlink()
+
+    def get_slot_depth(self, slot: int) -> int:
+        """Return the depth stored in a slot, without checking the entry.
+
+        Args:
+            slot (int): index of the slot.
+
+        Returns:
+            int: depth of the search, -1 for an empty slot.
+        """
+        return (int(self.entries[slot, 2]) & 0xFF) - 1
+
+    def probe(self, zobrist_hash: int) -> TTEntry | None:
+        """Look a position up.
+
+        A miss is counted as a collision when the bucket holds other positions.
+
+        Args:
+            zobrist_hash (int): hash of the position.
+
+        Returns:
+            TTEntry | None: stored entry, None if the position is missing or the
+            entry was torn by concurrent writes.
+        """
+        index = self.get_slot_index(zobrist_hash)
+
+        for slot in (index, index + 1):
+            checksum, score_bits, data = self.entries[slot].tolist()
+
+            if data and checksum ^ score_bits ^ data == zobrist_hash:
+                self.hits += 1
+
+                # The entry may have changed since it was read, use the checked
+                # copy
+                score = float(np.array(score_bits, dtype=np.uint64).view(np.float64))
+
+                return TTEntry(
+                    (data & 0xFF) - 1,
+                    score,
+                    (data >> 8) & 0xFF,
+                    ((data >> 16) & 0xFF) - 1,
+                )
+
+        self.misses += 1
+        if self.get_slot_depth(index) >= 0 or self.get_slot_depth(index + 1) >= 0:
+            self.collisions += 1
+
+        return None
+
+    def store(
+            self,
+            zobrist_hash: int,
+            depth: int,
+            score: float,
+            bound: int,
+            best_move: int = NO_MOVE,
+    ) -> None:
+        """Store the search result of a position.
+
+        The depth-preferred slot is replaced by searches at least as deep, other
+        results go to the always-replace slot.
+
+        Args:
+            zobrist_hash (int): hash of the position.
+            depth (int): depth of the search.
+            score (float): score of the position.
+            bound (int): type of the score, `EXACT`, `LOWER_BOUND` or `UPPER_BOUND`.
+            best_move (int, optional): square index of the best move. Defaults to
+            `NO_MOVE`.
+        """
+        slot = self.get_slot_index(zobrist_hash)
+
+        if depth < self.get_slot_depth(slot):
+            slot += 1
+
+        data = (depth + 1) | (bound << 8) | ((best_move + 1) << 16)
+
+        # The checksum uses the score written by this process, not the one read back
+        # from the slot, which another process may have written meanwhile
+        score_bits = int(np.float64(score).view(np.uint64))
+
+        self.scores[slot] = score
+
+        self.entries[slot, 2] = data
+        self.entries[slot, 0] = zobrist_hash ^ score_bits ^ data
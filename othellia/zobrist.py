@@ -0,0 +1,135 @@
+from typing import Any
+
+import numpy as np
+from numpy import ndarray, dtype
+
+from settings.board import BOARD_CELL_LENGTH
+from settings.values import BLACK_VALUE, WHITE_VALUE
+
+# Fixed seed so that hashes are the same across runs and processes, as needed by
+# anything stored on disk
+ZOBRIST_SEED: int = 20240521
+
+SQUARE_COUNT: int = BOARD_CELL_LENGTH ** 2
+
+
+def generate_keys() -> tuple[dict[int, tuple[int, ...]], int]:
+    """Draw the random 64-bit keys of every piece on every square, and of the side
+    to move.
+
+    Returns:
+        tuple[dict[int, tuple[int, ...]], int]: keys of each player's pieces indexed
+        by square, and key of white to move.
+    """
+    rng = np.random.default_rng(ZOBRIST_SEED)
+    keys = rng.integers(0, 2 ** 64, 2 * SQUARE_COUNT + 1, dtype=np.uint64).tolist()
+
+    return (
+        {
+            BLACK_VALUE: tuple(keys[:SQUARE_COUNT]),
+            WHITE_VALUE: tuple(keys[SQUARE_COUNT:-1]),
+        },
+        keys[-1],
+    )
+
+
+def generate_byte_keys(keys: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    """Combine square keys by bytes of a bitboard, so that a whole bitboard is
+    hashed with eight lookups.
+
+    Args:
+        keys (tuple[int, ...]): keys indexed by square.
+
+    Returns:
+        tuple[tuple[int, ...], ...]: combined keys indexed by byte position, then
+        byte value.
+    """
+    byte_keys = []
+
+    for offset in range(0, SQUARE_COUNT, 8):
+        combined = [0] * 256
+
+        for value in range(1, 256):
+            lowest_bit = (value & -value).bit_length() - 1
+            combined[value] = combined[value & (value - 1)] ^ keys[offset + lowest_bit]
+
+        byte_keys.append(tuple(combined))
+
+    return tuple(byte_keys)
+
+
+PIECE_KEYS, SIDE_KEY = generate_keys()
+
+# Key changes of a piece flipped on each square
+FLIP_KEYS: tuple[int, ...] = tuple(
+    black ^ white
+    for black, white in zip(PIECE_KEYS[BLACK_VALUE], PIECE_KEYS[WHITE_VALUE])
+)
+
+PIECE_BYTE_KEYS: dict[int, tuple[tuple[int, ...], ...]] = {
+    value: generate_byte_keys(keys) for value, keys in PIECE_KEYS.items()
+}
+FLIP_BYTE_KEYS: tuple[tuple[int, ...], ...] = generate_byte_keys(FLIP_KEYS)
+
+
+def hash_bitboard(bitboard: int, byte_keys: tuple[tuple[int, ...], ...]) -> int:
+    """Combine the keys of every square set in a bitboard.
+
+    Args:
+        bitboard (int): a bitboard.
+        byte_keys (tuple[tuple[int, ...], ...]): combined keys indexed by byte
+        position, then byte value.
+
+    Returns:
+        int: combined keys.
+    """
+    zobrist_hash = 0
+
+    for keys in byte_keys:
+        zobrist_hash ^= keys[bitboard & 0xFF]
+        bitboard >>= 8
+
+    return zobrist_hash
+
+
+def compute_bitboard_hash(black: int, white: int, player_value: int) -> int:
+    """Compute the Zobrist hash of a position from scratch.
+
+    Args:
+        black (int): bitboard of black pieces.
+        white (int): bitboard of white pieces.
+        player_value (int): value of the player to play.
+
+    Returns:
+        int: 64-bit hash of the position.
+    """
+    zobrist_hash = hash_bitboard(black, PIECE_BYTE_KEYS[BLACK_VALUE]) ^ hash_bitboard(
+        white, PIECE_BYTE_KEYS[WHITE_VALUE]
+    )
+
+    if player_value == WHITE_VALUE:
+        zobrist_hash ^= SIDE_KEY
+
+    return zobrist_hash
+
+
+def compute_hash(board: ndarray[Any, dtype[Any]], player_value: int) -> int:
+    """Compute the Zobrist hash of a board position from scratch.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+        player_value (int): value of the player to play.
+
+    Returns:
+        int: 64-bit hash of the position.
+    """
+    zobrist_hash = SIDE_KEY if player_value == WHITE_VALUE else 0
+
+    # Transposing the board makes the flat indices match the square indices
+    squares = np.asarray(board).T.ravel()
+
+    for value in (BLACK_VALUE, WHITE_VALUE):
+        for square in np.flatnonzero(squares == value).tolist():
+            zobrist_hash ^= PIECE_KEYS[value][square]
+
+    return zobrist_hash
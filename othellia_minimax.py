@@ -1,12 +1,36 @@
+import time
+
 import pygame
 
-from othellia.game import Game, mouse_pos_to_cell_index
-from othellia.minimax import think
-from othellia.sprites import Board, IndicatorLayout, PieceLayout, EndgameMessage  # type: ignore
+from othellia.async_think import ThinkHandle, start_think
+from othellia.bitboard import BitboardGame
+from othellia.endgame import ENDGAME_EMPTIES
+from othellia.game import mouse_pos_to_cell_index
+from othellia.mcts import MonteCarloTreeSearch
+from othellia.opening_book import OpeningBook
+from othellia.pondering import Ponderer
+from othellia.sprites import (  # type: ignore
+    Board,
+    EndgameMessage,
+    IndicatorLayout,
+    PieceLayout,
+    ThinkingIndicator,
+)
 from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
 from settings import values
 from settings.colors import BOARD_COLOR
-from settings.graphics import HEIGHT, WIDTH
+from settings.graphics import FRAME_RATE, HEIGHT, WIDTH
+
+# Seconds given to the computer for each move, searching as deep as possible
+THINK_TIME_BUDGET = 1.0
+MAX_DEPTH = 60
+
+# Search the computer's moves with Monte Carlo tree search instead of minimax
+USE_MCTS = False
+
+# Search the computer's moves after the likely human moves while the human thinks
+USE_PONDERING = True
 
 if __name__ == "__main__":
     pygame.init()
@@ -16,46 +40,102 @@ if __name__ == "__main__":
     board = Board()
     piece_layout = PieceLayout()
     indicator_layout = IndicatorLayout()
+    thinking_indicator = ThinkingIndicator()
 
     endgame_message_black_won = EndgameMessage(values.BLACK_VALUE)
     endgame_message_white_won = EndgameMessage(values.WHITE_VALUE)
     endgame_message_draw = EndgameMessage(None)
 
-    game = Game()
+    game = BitboardGame()
     static_evaluation = StaticEvaluation()
 
+    # Kept during the whole game to reuse the previous searches
+    transposition_table = TranspositionTable()
+
+    # Kept during the whole game to reuse the tree memory
+    monte_carlo_tree_search = MonteCarloTreeSearch()
+
     # Set genetic evaluation weights
     static_evaluation.load_evaluation_weights()
 
+    # Opening moves searched in advance with the same weights
+    opening_book = OpeningBook.load()
+
+    ponderer = Ponderer(
+        MAX_DEPTH,
+        static_evaluation.evaluate,
+        transposition_table,
+        THINK_TIME_BUDGET,
+        endgame_empties=ENDGAME_EMPTIES,
+        opening_book=opening_book,
+    )
+
+    # Leave the CPU to the pondering and the search between frames
+    clock = pygame.time.Clock()
+
+    # Search of the computer's move running in the background, and its start time
+    think_handle: ThinkHandle | None = None
+    think_start = 0.0
+
     running = True
     is_game_over = False
 
     while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+
+            if (
+                event.type == pygame.MOUSEBUTTONDOWN
+                and not game.is_over
+                and game.player_value == values.BLACK_VALUE
+            ):
+                cell_index = mouse_pos_to_cell_index(pygame.mouse.get_pos())
+
+                # Check if a piece can be played
+                if game.is_cell_empty(cell_index):
+                    # Check if the move is legal
+                    if game.is_move_legal(cell_index):
+                        game.play_piece(cell_index)
+
         if not game.is_over:
             match game.player_value:
                 case values.BLACK_VALUE:
-                    for event in pygame.event.get():
-                        if event.type == pygame.QUIT:
-                            running = False
-
-                        if event.type == pygame.MOUSEBUTTONDOWN:
-                            cell_index = mouse_pos_to_cell_index(
-                                pygame.mouse.get_pos()
-                            )
-
-                            # Check if a piece can be played
-                            if game.is_cell_empty(cell_index):
-                                # Check if the move is legal
-                                if game.is_move_legal(cell_index):
-                                    game.play_piece(cell_index)
+                    if USE_PONDERING and not USE_MCTS and ponderer.thread is None:
+                        ponderer.start(game)
                 case values.WHITE_VALUE:
-                    # Find the best legal move
-                    best_move = think(
-                        game,
-                        depth=2,
-                        static_evaluation_func=static_evaluation.evaluate,
-                    )
-                    game.play_piece(best_move)
+                    best_move = None
+
+                    # Find the best legal move in the background, the window
+                    # responding meanwhile
+                    if think_handle is None:
+                        if USE_PONDERING and not USE_MCTS:
+                            best_move = ponderer.get_result(game)
+
+                        if best_move is None:
+                            think_start = time.perf_counter()
+                            if USE_MCTS:
+                                think_handle = start_think(
+                                    game,
+                                    engine=monte_carlo_tree_search.search,
+                                    time_budget=THINK_TIME_BUDGET,
+                                )
+                            else:
+                                think_handle = start_think(
+                                    game,
+                                    depth=MAX_DEPTH,
+                                    static_evaluation_func=static_evaluation.evaluate,
+                                    transposition_table=transposition_table,
+                                    time_budget=THINK_TIME_BUDGET,
+                                    endgame_empties=ENDGAME_EMPTIES,
+                                    opening_book=opening_book,
+                                )
+                    elif think_handle.poll():
+                        best_move = think_handle.result()
+                        think_handle = None
+
+                    if best_move is not None:
+                        game.play_piece(best_move)
 
         # Update graphics
         piece_layout.update(game.board)
@@ -71,6 +151,10 @@ if __name__ == "__main__":
         if game.player_value == values.BLACK_VALUE:
             indicator_layout.draw(screen)
 
+        if think_handle is not None:
+            thinking_indicator.update(time.perf_counter() - think_start)
+            thinking_indicator.draw(screen)
+
         if game.is_over:
             match game.get_winner():
                 case values.BLACK_VALUE:
@@ -81,5 +165,9 @@ if __name__ == "__main__":
                     endgame_message_draw.draw(screen)
 
         pygame.display.flip()
+        clock.tick(FRAME_RATE)
 
+    if think_handle is not None:
+        think_handle.cancel()
+    ponderer.stop()
     pygame.quit()
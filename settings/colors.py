@@ -3,6 +3,7 @@ CELL_COLOR: tuple[int, int, int] = (141, 187, 100)
 BLACK_PIECE_COLOR: tuple[int, int, int] = (47, 54, 64)
 WHITE_PIECE_COLOR: tuple[int, int, int] = (245, 246, 250)
 INDICATOR_COLOR: tuple[int, int, int] = (159, 100, 187)
+THINKING_INDICATOR_COLOR: tuple[int, int, int] = WHITE_PIECE_COLOR
 ENDGAME_MESSAGE_BACKGROUND_COLOR: tuple[int, int, int] = (147, 130, 127)
 ENDGAME_MESSAGE_BLACK_VICTORY_COLOR: tuple[int, int, int] = BLACK_PIECE_COLOR
 ENDGAME_MESSAGE_WHITE_VICTORY_COLOR: tuple[int, int, int] = WHITE_PIECE_COLOR
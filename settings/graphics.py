@@ -6,3 +6,6 @@ CELL_GAP: int = 5
 PIECE_SIZE: int = 60
 INDICATOR_SIZE: int = 25
 ENDGAME_MESSAGE_SIZE: int = 50
+THINKING_INDICATOR_SIZE: int = 60
+THINKING_INDICATOR_SPEED: float = 6.0
+FRAME_RATE: int = 60
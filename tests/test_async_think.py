@@ -0,0 +1,103 @@
+import time
+from concurrent.futures import CancelledError
+
+import numpy as np
+import pytest
+
+from othellia.async_think import start_think
+from othellia.bitboard import BitboardGame
+from othellia.mcts import MonteCarloTreeSearch
+from othellia.minimax import set_stop_flag, think
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.transcripts import FRONMARK_VS_BERG
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 20])
+
+    return game
+
+
+@pytest.fixture(autouse=True)
+def reset_stop_flag():
+    yield
+
+    set_stop_flag(None)
+
+
+def assert_cancelled(handle):
+    start = time.perf_counter()
+
+    assert handle.cancel()
+    assert time.perf_counter() - start < 0.05
+    assert handle.poll()
+
+    with pytest.raises(CancelledError):
+        handle.result()
+
+
+def test_result(game):
+    expected_move = tuple(think(game, 3, StaticEvaluation().coin_parity))
+    handle = start_think(game, 3, StaticEvaluation().coin_parity)
+
+    # The game is copied, the caller may change it
+    game.play_piece(tuple(game.indicators[0]))
+
+    assert tuple(handle.result()) == expected_move
+    assert handle.poll()
+
+    # Over, cannot be cancelled
+    assert not handle.cancel()
+    assert tuple(handle.result()) == expected_move
+
+
+def test_poll(game):
+    handle = start_think(game, 60, StaticEvaluation().coin_parity, time_budget=0.2)
+
+    assert not handle.poll()
+    with pytest.raises(TimeoutError):
+        handle.result(timeout=0.01)
+
+    assert game.is_move_legal(handle.result())
+
+
+def test_cancel(game):
+    handle = start_think(
+        game, 60, StaticEvaluation().coin_parity, TranspositionTable(1), 60
+    )
+    time.sleep(0.1)
+
+    assert_cancelled(handle)
+
+    # Searches run normally once cancelled
+    assert game.is_move_legal(think(game, 2, StaticEvaluation().coin_parity))
+
+
+def test_cancel_endgame():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 36])
+
+    handle = start_think(
+        game, 60, StaticEvaluation().coin_parity, time_budget=60, endgame_empties=28
+    )
+    time.sleep(0.1)
+
+    assert_cancelled(handle)
+
+
+def test_cancel_mcts(game):
+    search = MonteCarloTreeSearch(rng=np.random.default_rng(0))
+    handle = start_think(game, engine=search.search, time_budget=60)
+    time.sleep(0.1)
+
+    assert_cancelled(handle)
+
+
+def test_error(game):
+    handle = start_think(game, 3, None)
+
+    with pytest.raises(TypeError):
+        handle.result()
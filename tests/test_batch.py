@@ -0,0 +1,229 @@
+from itertools import zip_longest
+from textwrap import wrap
+
+import numpy as np
+import pytest
+
+from othellia.batch import (
+    PASS_SQUARE,
+    BatchGame,
+    batch_flipped_pieces,
+    batch_legal_moves,
+    bitboards_to_squares,
+    popcount,
+    squares_to_bitboards,
+)
+from othellia.bitboard import (
+    BitboardGame,
+    array_to_bitboard,
+    flipped_pieces,
+    legal_moves,
+)
+from othellia.game import Game
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import cell_index_to_square, notation_to_cell_index
+from utils.transcripts import TRANSCRIPTS
+
+
+@pytest.fixture
+def batch():
+    return BatchGame(3)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng()
+
+
+def test_initialization(batch):
+    game = Game()
+
+    assert len(batch) == 3
+    assert batch.board.shape == (3, 8, 8)
+    assert all(np.array_equal(board, game.board) for board in batch.board)
+    assert np.array_equal(batch.player_value, [BLACK_VALUE] * 3)
+    assert not batch.is_over.any()
+    assert np.array_equal(batch.get_legal_moves_count(), [4, 4, 4])
+
+
+def test_popcount(rng):
+    bitboards = rng.integers(0, 2 ** 64, 100, dtype=np.uint64)
+
+    assert np.array_equal(
+        popcount(bitboards), [bin(int(bitboard)).count("1") for bitboard in bitboards]
+    )
+
+
+def test_bitboards_to_squares(rng):
+    bitboards = rng.integers(0, 2 ** 64, 100, dtype=np.uint64)
+    squares = bitboards_to_squares(bitboards)
+
+    assert squares.shape == (100, 64)
+    assert np.array_equal(
+        squares[:, 10], (bitboards >> np.uint64(10)) & np.uint64(1)
+    )
+    assert np.array_equal(squares_to_bitboards(squares), bitboards)
+
+
+def test_same_as_bitboard_functions(rng):
+    boards = rng.choice([BLACK_VALUE, 0, WHITE_VALUE], (100, 8, 8))
+    black = [array_to_bitboard(board, BLACK_VALUE) for board in boards]
+    white = [array_to_bitboard(board, WHITE_VALUE) for board in boards]
+
+    moves = batch_legal_moves(
+        np.array(black, dtype=np.uint64), np.array(white, dtype=np.uint64)
+    )
+
+    assert moves.tolist() == [
+        legal_moves(player, opponent) for player, opponent in zip(black, white)
+    ]
+
+    # Lowest legal move of each board, if any
+    squares = [(bitboard & -bitboard).bit_length() - 1 for bitboard in moves.tolist()]
+    flipped = batch_flipped_pieces(
+        np.array(black, dtype=np.uint64),
+        np.array(white, dtype=np.uint64),
+        np.array(
+            [(1 << square) if square >= 0 else 0 for square in squares],
+            dtype=np.uint64,
+        ),
+    )
+
+    assert flipped.tolist() == [
+        flipped_pieces(player, opponent, square) if square >= 0 else 0
+        for player, opponent, square in zip(black, white, squares)
+    ]
+
+
+def test_play_moves(batch):
+    squares = np.array(
+        [cell_index_to_square(cell) for cell in [(4, 5), (5, 4), (3, 2)]]
+    )
+    flipped = batch.play_moves(squares)
+
+    assert popcount(flipped).tolist() == [1, 1, 1]
+    assert np.array_equal(batch.player_value, [WHITE_VALUE] * 3)
+    assert np.array_equal(batch.get_black_piece_count(), [4, 4, 4])
+    assert np.array_equal(batch.get_white_piece_count(), [1, 1, 1])
+
+    game = Game()
+    game.play_piece((5, 4))
+
+    assert np.array_equal(batch.board[1], game.board)
+
+
+def test_game_over(batch):
+    board = np.array(
+        [
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 1, 1, 1, 1, -1, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    batch.set_position(
+        np.stack([board, Game().board]), np.array([BLACK_VALUE, BLACK_VALUE])
+    )
+
+    # Black captures the last white piece in the first game
+    batch.play_moves(
+        np.array([cell_index_to_square((7, 4)), cell_index_to_square((3, 2))])
+    )
+
+    assert np.array_equal(batch.is_over, [True, False])
+    assert np.array_equal(batch.get_winner(), [BLACK_VALUE, BLACK_VALUE])
+
+    # Games that are over are left untouched
+    board = batch.board[0]
+    batch.play_moves(np.array([0, cell_index_to_square((2, 2))]))
+
+    assert np.array_equal(batch.board[0], board)
+    assert np.array_equal(batch.player_value, [BLACK_VALUE, BLACK_VALUE])
+
+
+def test_pass(rng):
+    # Black has no legal moves, unlike white
+    board = np.zeros((8, 8), dtype=int)
+    board[0, :3] = [WHITE_VALUE, BLACK_VALUE, BLACK_VALUE]
+
+    # Neither player has legal moves
+    over_board = np.zeros((8, 8), dtype=int)
+    over_board[0, 0] = BLACK_VALUE
+
+    batch = BatchGame(3)
+    batch.set_position(
+        np.stack([board, over_board, Game().board]), np.array([BLACK_VALUE] * 3)
+    )
+    assert np.array_equal(batch.is_over, [False, True, False])
+
+    squares = batch.get_random_moves(rng)
+    assert squares[:2].tolist() == [PASS_SQUARE, -1]
+
+    batch.play_moves(squares)
+
+    assert np.array_equal(batch.board[0], board)
+    assert np.array_equal(batch.player_value, [WHITE_VALUE, BLACK_VALUE, WHITE_VALUE])
+
+    game = BitboardGame()
+    game.set_position(board, WHITE_VALUE)
+    assert batch.moves[0] == game.moves
+
+
+def test_random_games(rng):
+    batch = BatchGame(20)
+    games = [BitboardGame() for _ in range(20)]
+
+    while not batch.is_over.all():
+        squares = batch.get_random_moves(rng)
+
+        for game, square in zip(games, squares.tolist()):
+            if not game.is_over:
+                assert game.moves >> square & 1
+                game.make_move((square // 8, square % 8))
+
+        batch.play_moves(squares)
+
+        assert np.array_equal(batch.is_over, [game.is_over for game in games])
+        assert np.array_equal(
+            batch.player_value, [game.player_value for game in games]
+        )
+        assert batch.moves.tolist() == [game.moves for game in games]
+
+    assert np.array_equal(batch.get_winner(), [game.get_winner() for game in games])
+
+
+def test_same_as_reference_game():
+    batch = BatchGame(len(TRANSCRIPTS))
+    references = []
+
+    for transcript in TRANSCRIPTS:
+        reference = Game()
+        reference.load_transcript(transcript)
+        references.append(reference)
+
+    # Play every transcript at once, games ending earlier are over
+    for notations in zip_longest(*[wrap(transcript, 2) for transcript in TRANSCRIPTS]):
+        squares = np.array(
+            [
+                -1
+                if notation is None
+                else cell_index_to_square(notation_to_cell_index(notation))
+                for notation in notations
+            ]
+        )
+        batch.play_moves(squares)
+
+    for board, player_value, is_over, reference in zip(
+        batch.board, batch.player_value, batch.is_over, references
+    ):
+        assert np.array_equal(board, reference.board)
+        assert player_value == reference.player_value
+        assert is_over == reference.is_over
+
+    assert np.array_equal(
+        batch.get_winner(), [reference.get_winner() for reference in references]
+    )
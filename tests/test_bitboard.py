@@ -0,0 +1,416 @@
+from textwrap import wrap
+
+import numpy as np
+import pytest
+
+from othellia.bitboard import (
+    BitboardGame,
+    array_to_bitboard,
+    bitboard_to_cell_indices,
+    flipped_pieces,
+    get_position,
+    legal_moves,
+    neighbors,
+    position_to_game,
+)
+from othellia.game import Game
+from othellia.zobrist import compute_hash
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import cell_index_to_square, notation_to_cell_index
+from utils.transcripts import BERTRANDIAS_VS_KASHIWABARA, TRANSCRIPTS
+
+
+@pytest.fixture
+def game():
+    return BitboardGame()
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng()
+
+
+def test_initialization(game):
+    assert np.array_equal(
+        game.board,
+        np.array(
+            [
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, -1, 1, 0, 0, 0],
+                [0, 0, 0, 1, -1, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+            ]
+        ),
+    )
+
+    assert np.array_equal(
+        game.indicators,
+        np.array([(2, 3), (3, 2), (4, 5), (5, 4)]),
+    )
+
+    assert game.player_value == BLACK_VALUE
+    assert not game.is_over
+
+
+def test_array_to_bitboard():
+    board = np.zeros((8, 8), dtype=int)
+    board[0, 7] = BLACK_VALUE
+    board[7, 0] = BLACK_VALUE
+    board[2, 1] = WHITE_VALUE
+
+    assert array_to_bitboard(board, BLACK_VALUE) == (1 << 56) | (1 << 7)
+    assert array_to_bitboard(board, WHITE_VALUE) == 1 << 10
+
+
+def test_bitboard_to_cell_indices():
+    assert np.array_equal(bitboard_to_cell_indices(0), [])
+    assert np.array_equal(
+        bitboard_to_cell_indices((1 << 63) | (1 << 8) | 1),
+        np.array([(0, 0), (1, 0), (7, 7)]),
+    )
+
+
+def test_legal_moves():
+    black = (1 << cell_index_to_square((4, 3))) | (
+        1 << cell_index_to_square((3, 4))
+    )
+    white = (1 << cell_index_to_square((3, 3))) | (
+        1 << cell_index_to_square((4, 4))
+    )
+
+    assert np.array_equal(
+        bitboard_to_cell_indices(legal_moves(black, white)),
+        np.array([(2, 3), (3, 2), (4, 5), (5, 4)]),
+    )
+    assert np.array_equal(
+        bitboard_to_cell_indices(legal_moves(white, black)),
+        np.array([(2, 4), (3, 5), (4, 2), (5, 3)]),
+    )
+
+    # Pieces on the edges must not wrap around the board
+    board = np.zeros((8, 8), dtype=int)
+    board[7, 0] = WHITE_VALUE
+    board[0, 1] = BLACK_VALUE
+
+    assert (
+        legal_moves(
+            array_to_bitboard(board, WHITE_VALUE),
+            array_to_bitboard(board, BLACK_VALUE),
+        )
+        == 0
+    )
+
+
+def test_flipped_pieces():
+    board = np.array(
+        [
+            [-1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, 1, 1, 1, 1, 1, 1, -1],
+            [-1, 1, 1, 1, 1, 1, 1, -1],
+            [-1, 1, 1, 1, 1, 1, 1, -1],
+            [-1, 1, 1, 1, 1, 1, 1, -1],
+            [-1, 1, 0, 1, 1, 1, 1, -1],
+            [-1, 1, 1, 1, 1, 1, 1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1],
+        ]
+    )
+    white = array_to_bitboard(board, WHITE_VALUE)
+    black = array_to_bitboard(board, BLACK_VALUE)
+
+    assert np.array_equal(
+        bitboard_to_cell_indices(
+            flipped_pieces(white, black, cell_index_to_square((2, 5)))
+        ),
+        np.array(
+            [
+                (1, 4),
+                (1, 5),
+                (1, 6),
+                (2, 1),
+                (2, 2),
+                (2, 3),
+                (2, 4),
+                (2, 6),
+                (3, 4),
+                (3, 5),
+                (3, 6),
+                (4, 3),
+                (4, 5),
+                (5, 2),
+                (5, 5),
+                (6, 1),
+                (6, 5),
+            ]
+        ),
+    )
+    assert flipped_pieces(black, white, cell_index_to_square((2, 5))) == 0
+
+
+def test_neighbors():
+    assert np.array_equal(
+        bitboard_to_cell_indices(neighbors(1)),
+        np.array([(0, 1), (1, 0), (1, 1)]),
+    )
+    assert np.array_equal(
+        bitboard_to_cell_indices(neighbors(1 << cell_index_to_square((3, 7)))),
+        np.array([(2, 6), (2, 7), (3, 6), (4, 6), (4, 7)]),
+    )
+
+
+def test_is_cell_empty(game):
+    assert game.is_cell_empty((0, 0))
+    assert not game.is_cell_empty((3, 4))
+    assert not game.is_cell_empty((3, 3))
+
+
+def test_play_piece(game):
+    game.play_piece((4, 5))
+
+    assert np.array_equal(
+        game.board,
+        np.array(
+            [
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, -1, 1, 0, 0, 0],
+                [0, 0, 0, 1, 1, 0, 0, 0],
+                [0, 0, 0, 0, 1, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+            ]
+        ),
+    )
+    assert game.player_value == WHITE_VALUE
+
+    game.play_piece((5, 3))
+
+    assert np.array_equal(
+        game.board,
+        np.array(
+            [
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, -1, -1, -1, 0, 0],
+                [0, 0, 0, 1, 1, 0, 0, 0],
+                [0, 0, 0, 0, 1, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+            ]
+        ),
+    )
+    assert game.player_value == BLACK_VALUE
+
+
+def test_make_move(game):
+    record = game.make_move((4, 5))
+
+    assert game.get_black_piece_count() == 4
+    assert game.player_value == WHITE_VALUE
+
+    assert record.cell_index == (4, 5)
+    assert record.flipped == 1 << cell_index_to_square((4, 4))
+    assert record.player_value == BLACK_VALUE
+    assert not record.is_over
+
+
+def test_unmake_move(game):
+    initial = BitboardGame()
+
+    records = [game.make_move(move) for move in [(4, 5), (5, 3), (4, 2)]]
+
+    for record in reversed(records):
+        game.unmake_move(record)
+
+    assert game.black == initial.black
+    assert game.white == initial.white
+    assert game.moves == initial.moves
+    assert game.player_value == initial.player_value
+    assert not game.is_over
+    assert game.zobrist_hash == initial.zobrist_hash
+
+    board = np.array(
+        [
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 1, 1, 1, 1, -1, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    game.set_position(board, BLACK_VALUE)
+
+    # Black captures the last white piece, ending the game
+    record = game.make_move((7, 4))
+
+    assert game.is_over
+
+    game.unmake_move(record)
+
+    assert np.array_equal(game.board, board)
+    assert game.player_value == BLACK_VALUE
+    assert not game.is_over
+
+
+def test_zobrist_hash(game):
+    initial_hash = game.zobrist_hash
+
+    for notation in wrap(BERTRANDIAS_VS_KASHIWABARA, 2):
+        game.play_piece(notation_to_cell_index(notation))
+
+        assert game.zobrist_hash == compute_hash(game.board, game.player_value)
+
+    game.reset_game()
+
+    assert game.zobrist_hash == initial_hash
+
+    # Different move orders reaching the same position share the same hash
+    game.load_transcript("c4c3d3c5")
+    transposition = BitboardGame()
+    transposition.load_transcript("d3c3c4c5")
+
+    assert np.array_equal(game.board, transposition.board)
+    assert game.zobrist_hash == transposition.zobrist_hash
+
+
+def test_is_move_legal(game):
+    assert game.is_move_legal((3, 2))
+    assert not game.is_move_legal((0, 0))
+    assert not game.is_move_legal((8, 8))
+
+
+def test_next_player_turn(game):
+    game.next_player_turn()
+
+    assert game.player_value == WHITE_VALUE and not game.is_over
+
+    board = np.array(
+        [
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 1, 1, 1, 1, 1, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    game.set_position(board, BLACK_VALUE)
+    game.next_player_turn()
+
+    assert game.player_value == BLACK_VALUE and game.is_over
+
+
+def test_get_legal_moves(game):
+    board = game.board.copy()
+
+    assert np.array_equal(
+        game.get_legal_moves(WHITE_VALUE),
+        np.array([(2, 4), (3, 5), (4, 2), (5, 3)]),
+    )
+    assert game.get_legal_moves_count(BLACK_VALUE) == 4
+
+    # The game is left untouched
+    assert np.array_equal(game.board, board)
+    assert game.player_value == BLACK_VALUE
+
+
+def test_mobility_cache(game):
+    game.get_legal_moves(WHITE_VALUE)
+
+    assert game.mobility_cache == {
+        WHITE_VALUE: legal_moves(game.white, game.black)
+    }
+
+    record = game.make_move((4, 5))
+
+    assert game.mobility_cache == {}
+    assert np.array_equal(
+        game.get_legal_moves(BLACK_VALUE),
+        np.array([(2, 2), (2, 3), (3, 2)]),
+    )
+
+    game.unmake_move(record)
+
+    assert game.mobility_cache == {
+        WHITE_VALUE: legal_moves(game.white, game.black)
+    }
+
+
+@pytest.mark.parametrize("transcript", TRANSCRIPTS)
+def test_same_as_reference_game(transcript):
+    reference = Game()
+    game = BitboardGame()
+
+    for notation in wrap(transcript, 2):
+        move = notation_to_cell_index(notation)
+        reference.play_piece(move)
+        game.play_piece(move)
+
+        assert np.array_equal(game.board, reference.board)
+        assert np.array_equal(game.indicators, reference.indicators)
+        assert game.player_value == reference.player_value
+        assert game.is_over == reference.is_over
+        assert game.zobrist_hash == reference.zobrist_hash
+        assert np.array_equal(
+            game.get_black_legal_moves(), reference.get_black_legal_moves()
+        )
+        assert np.array_equal(
+            game.get_white_legal_moves(), reference.get_white_legal_moves()
+        )
+        assert (
+            game.get_black_empty_neighbors_count()
+            == reference.get_black_empty_neighbors_count()
+        )
+        assert (
+            game.get_white_empty_neighbors_count()
+            == reference.get_white_empty_neighbors_count()
+        )
+
+    assert game.get_winner() == reference.get_winner()
+
+
+def test_set_position(game, rng):
+    board = rng.choice([BLACK_VALUE, 0, WHITE_VALUE], (8, 8))
+    reference = Game()
+
+    game.set_position(board, WHITE_VALUE)
+    reference.set_position(board.copy(), WHITE_VALUE)
+
+    assert np.array_equal(game.board, board)
+    assert np.array_equal(game.indicators, reference.indicators)
+    assert game.get_black_piece_count() == reference.get_black_piece_count()
+    assert game.get_white_piece_count() == reference.get_white_piece_count()
+    assert np.array_equal(
+        game.get_all_black_cells(), reference.get_all_black_cells()
+    )
+    assert np.array_equal(
+        game.get_all_non_empty_cells(), reference.get_all_non_empty_cells()
+    )
+
+
+def test_position(game):
+    reference = Game()
+
+    for current_game in (game, reference):
+        current_game.load_transcript("f5d6c3d3c4f4c5b3e2")
+
+    position = get_position(game)
+
+    assert position == get_position(reference)
+    assert position.player_value == WHITE_VALUE
+
+    copy = position_to_game(position)
+
+    assert np.array_equal(copy.board, game.board)
+    assert np.array_equal(copy.indicators, game.indicators)
+    assert copy.zobrist_hash == game.zobrist_hash
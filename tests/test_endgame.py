@@ -0,0 +1,139 @@
+import time
+
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.endgame import (
+    QUADRANT_MASKS,
+    EndgameSolver,
+    SolverTimeout,
+    get_final_score,
+    get_squares,
+)
+from othellia.minimax import negamax, think
+from othellia.static_evaluation import StaticEvaluation
+from utils.transcripts import FRONMARK_VS_BERG, TRANSCRIPTS
+
+
+@pytest.fixture
+def game():
+    return BitboardGame()
+
+
+@pytest.fixture
+def solver():
+    return EndgameSolver()
+
+
+def disc_difference(game):
+    return game.get_black_piece_count() - game.get_white_piece_count()
+
+
+def play_until(game, empty_count, rng):
+    """Play random moves until a number of empty cells is left."""
+    while (
+        not game.is_over
+        and 64 - game.get_black_piece_count() - game.get_white_piece_count()
+        > empty_count
+    ):
+        moves = game.indicators
+        game.play_piece(tuple(moves[rng.integers(len(moves))]))
+
+
+def test_quadrant_masks():
+    assert sum(QUADRANT_MASKS) == 2 ** 64 - 1
+    assert all(mask.bit_count() == 16 for mask in QUADRANT_MASKS)
+
+
+def test_get_squares():
+    assert get_squares(0) == []
+    assert get_squares(0b1010 | 1 << 63) == [1, 3, 63]
+
+
+def test_get_final_score():
+    assert get_final_score(0b111, 0b1000) == 2
+
+
+def test_solve_last_1(solver):
+    # Black plays the last cell of the first column, flipping its middle
+    player = 1 << 0
+    opponent = sum(1 << row for row in range(1, 7))
+
+    assert solver.solve_last_1(player, opponent, 7) == 8
+    assert solver.solve_last_1(opponent, player, 7) == -8
+
+    # Nobody can play the cell
+    assert solver.solve_last_1(1 << 10, 1 << 20, 7) == 0
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_same_score_as_negamax(game, solver, seed):
+    rng = np.random.default_rng(seed)
+    play_until(game, 3 + seed % 6, rng)
+
+    if game.is_over:
+        return
+
+    empty_count = 64 - game.get_black_piece_count() - game.get_white_piece_count()
+    player_value = game.player_value
+    score = negamax(game, empty_count, -np.inf, np.inf, disc_difference)
+
+    move, solved_score = solver.solve_move(game)
+    assert solved_score == score
+
+    # The move reaches the score
+    game.play_piece(move)
+    assert player_value * game.player_value * negamax(
+        game, empty_count, -np.inf, np.inf, disc_difference
+    ) == score
+
+    if not game.is_over:
+        _, result = EndgameSolver().solve_move(game, exact=False)
+        assert player_value * game.player_value * result == np.sign(score)
+
+
+def test_win_loss_draw(solver):
+    exact_solver = EndgameSolver()
+
+    for transcript in TRANSCRIPTS[:3]:
+        game = BitboardGame()
+        game.load_transcript(transcript[: 2 * 50])
+
+        _, score = exact_solver.solve_move(game)
+        _, result = solver.solve_move(game, exact=False)
+
+        assert result == np.sign(score)
+
+    # Searching the result only is faster
+    assert solver.node_count < exact_solver.node_count
+
+
+def test_deadline(game):
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 44])
+
+    with pytest.raises(SolverTimeout):
+        EndgameSolver(time.perf_counter()).solve_move(game)
+
+
+def test_think(game):
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 50])
+    move, _ = EndgameSolver().solve_move(game)
+
+    assert np.array_equal(
+        think(game, 1, StaticEvaluation.evaluate, endgame_empties=10), move
+    )
+
+    # Too many empty cells for the budget, the evaluation is used instead
+    game.reset_game()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 30])
+
+    assert game.is_move_legal(
+        think(
+            game,
+            60,
+            StaticEvaluation.evaluate,
+            time_budget=0.2,
+            endgame_empties=60,
+        )
+    )
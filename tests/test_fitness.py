@@ -21,8 +21,8 @@ def test_play_match(static_evaluation):
     assert result == BLACK_VALUE
     assert (
         transcript
-        == "c4c3e6b4b3a3b2b1a4a5a1b5c1d2c2a2a6b6c5c6d1e3c7a7d6d7c8b7d3d8e8e2f4e7"
-        + "f8f7f5f3f6g3e1f2g5g4f1g1g2g6a8b8g7g8h5h3h6h4h2h1h8h7"
+        == "c4c3d3c5b6b5a6a5a4a7a8b3c6c7d6e2c2b2e3a3e1c1a2b4c8b7d1b8d2d7e8d8f5f1"
+        + "e6e7f3f2f8f4f7b1f6g4g3g2a1g5g1g7h1g8h3h2h6g6h5h4h8h7"
     )
 
 
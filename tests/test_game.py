@@ -1,7 +1,16 @@
+from textwrap import wrap
+
 import numpy as np
 import pytest
 
-from othellia.game import Game, mouse_pos_to_cell_index
+from othellia.game import (
+    RAYS,
+    Game,
+    flat_index_to_cell_index,
+    mouse_pos_to_cell_index,
+    sandwich_length,
+)
+from othellia.zobrist import compute_hash
 from settings.board import BOARD_CELL_LENGTH
 from settings.directions import (
     DOWN,
@@ -15,7 +24,9 @@ from settings.directions import (
 )
 from settings.graphics import HEIGHT, WIDTH
 from settings.values import BLACK_VALUE, EMPTY_VALUE, WHITE_VALUE
+from utils.game import notation_to_cell_index
 from utils.test import dict_to_str
+from utils.transcripts import BERTRANDIAS_VS_KASHIWABARA
 
 
 @pytest.fixture
@@ -73,10 +84,10 @@ def test_initialization(game):
 
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "2,3": np.array([[3, 3]]),
-            "3,2": np.array([[3, 3]]),
-            "4,5": np.array([[4, 4]]),
-            "5,4": np.array([[4, 4]]),
+            19: np.array([27]),
+            26: np.array([27]),
+            37: np.array([36]),
+            44: np.array([36]),
         }
     )
 
@@ -131,10 +142,10 @@ def test_reset_game(game):
 
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "2,3": np.array([[3, 3]]),
-            "3,2": np.array([[3, 3]]),
-            "4,5": np.array([[4, 4]]),
-            "5,4": np.array([[4, 4]]),
+            19: np.array([27]),
+            26: np.array([27]),
+            37: np.array([36]),
+            44: np.array([36]),
         }
     )
 
@@ -204,12 +215,103 @@ def test_play_piece(game):
     )
 
 
+def test_make_move(game):
+    record = game.make_move((4, 5))
+
+    assert np.array_equal(
+        game.board,
+        np.array(
+            [
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, -1, 1, 0, 0, 0],
+                [0, 0, 0, 1, 1, 0, 0, 0],
+                [0, 0, 0, 0, 1, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+                [0, 0, 0, 0, 0, 0, 0, 0],
+            ]
+        ),
+    )
+    assert game.player_value == WHITE_VALUE
+
+    assert record.cell_index == (4, 5)
+    assert np.array_equal(record.flipped, np.array([36]))
+    assert record.player_value == BLACK_VALUE
+    assert not record.is_over
+
+
+def test_unmake_move(game):
+    initial = Game()
+
+    records = [game.make_move(move) for move in [(4, 5), (5, 3), (4, 2)]]
+
+    for record in reversed(records):
+        game.unmake_move(record)
+
+    assert np.array_equal(game.board, initial.board)
+    assert np.array_equal(game.surrounding_cells, initial.surrounding_cells)
+    assert dict_to_str(game.sandwiches) == dict_to_str(initial.sandwiches)
+    assert np.array_equal(game.indicators, initial.indicators)
+    assert game.player_value == initial.player_value
+    assert not game.is_over
+    assert game.zobrist_hash == initial.zobrist_hash
+
+    board = np.array(
+        [
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 1, 1, 1, 1, -1, 0],
+            [0, 0, 0, 1, 1, 1, 0, 0],
+            [0, 0, 0, 0, 1, 0, 0, 0],
+            [0, 0, 0, 0, 0, 0, 0, 0],
+        ]
+    )
+    game.set_position(board.copy(), BLACK_VALUE)
+
+    # Black captures the last white piece, ending the game
+    record = game.make_move((7, 4))
+
+    assert game.is_over
+
+    game.unmake_move(record)
+
+    assert np.array_equal(game.board, board)
+    assert game.player_value == BLACK_VALUE
+    assert not game.is_over
+
+
+def test_zobrist_hash(game):
+    initial_hash = game.zobrist_hash
+
+    for notation in wrap(BERTRANDIAS_VS_KASHIWABARA, 2):
+        game.play_piece(notation_to_cell_index(notation))
+
+        assert game.zobrist_hash == compute_hash(game.board, game.player_value)
+
+    game.reset_game()
+
+    assert game.zobrist_hash == initial_hash
+
+    # Different move orders reaching the same position share the same hash
+    game.load_transcript("c4c3d3c5")
+    transposition = Game()
+    transposition.load_transcript("d3c3c4c5")
+
+    assert np.array_equal(game.board, transposition.board)
+    assert game.zobrist_hash == transposition.zobrist_hash
+
+
 def test_is_move_legal(game, rng):
     legal_move = (3, 2)
     illegal_move = (0, 0)
 
     assert game.is_move_legal(legal_move)
     assert not game.is_move_legal(illegal_move)
+    assert not game.is_move_legal((2, 11))
+    assert not game.is_move_legal((8, 8))
 
     game.board.fill(BLACK_VALUE)
     game.update_ssi()
@@ -297,6 +399,38 @@ def test_cell_values_toward(game):
     )
 
 
+def test_rays():
+    assert len(RAYS) == 64
+    assert all(len(square_rays) == 8 for square_rays in RAYS)
+
+    # Cell (2, 2), ordered as DIRECTIONS
+    assert RAYS[18] == (
+        (10, 2),
+        (26, 34, 42, 50, 58),
+        (17, 16),
+        (19, 20, 21, 22, 23),
+        (9, 0),
+        (11, 4),
+        (25, 32),
+        (27, 36, 45, 54, 63),
+    )
+
+    assert RAYS[0][0] == ()
+    assert RAYS[63][7] == ()
+
+
+def test_sandwich_length(game):
+    flat_board = np.array([-1, -1, 1, 0, 1, -1, 0, -1])
+
+    assert sandwich_length(flat_board, (0, 1, 2), BLACK_VALUE) == 2
+    assert sandwich_length(flat_board, (0, 1, 2), WHITE_VALUE) == 0
+    assert sandwich_length(flat_board, (0, 1, 3), BLACK_VALUE) == 0
+    assert sandwich_length(flat_board, (0, 1), BLACK_VALUE) == 0
+    assert sandwich_length(flat_board, (2, 5), BLACK_VALUE) == 0
+    assert sandwich_length(flat_board, (4, 2), WHITE_VALUE) == 0
+    assert sandwich_length(flat_board, (4, 0), WHITE_VALUE) == 1
+
+
 def test_search_cell_sandwich_towards(game):
     cell_index = (2, 2)
     direction = (1, 1)
@@ -343,6 +477,23 @@ def test_search_cell_sandwich_towards(game):
     )
 
 
+def test_flat_index_to_cell_index():
+    assert flat_index_to_cell_index(0) == (0, 0)
+    assert flat_index_to_cell_index(7) == (7, 0)
+    assert flat_index_to_cell_index(8) == (0, 1)
+    assert flat_index_to_cell_index(63) == (7, 7)
+
+
+def test_search_cell_flips(game):
+    assert np.array_equal(game.search_cell_flips((5, 3)), [])
+
+    game.player_value = WHITE_VALUE
+    flips = game.search_cell_flips((5, 3))
+
+    assert flips.dtype == np.int8
+    assert np.array_equal(flips, np.array([28]))
+
+
 def test_search_cell_sandwiches(game):
     cell_index = (5, 3)
 
@@ -668,13 +819,82 @@ def test_update_surrounding_cells(game):
     )
 
 
+def test_update_frontier(game):
+    game.board[5, 4] = BLACK_VALUE
+    game.update_frontier((4, 5))
+
+    assert np.array_equal(
+        game.surrounding_cells,
+        np.array(
+            [
+                (2, 2),
+                (2, 3),
+                (2, 4),
+                (2, 5),
+                (3, 2),
+                (3, 5),
+                (3, 6),
+                (4, 2),
+                (4, 6),
+                (5, 2),
+                (5, 3),
+                (5, 4),
+                (5, 5),
+                (5, 6),
+            ]
+        ),
+    )
+
+
+def test_update_neighbor_counts(game):
+    counts = game.neighbor_counts[WHITE_VALUE].copy()
+    game.update_neighbor_counts((0, 0), WHITE_VALUE, 1)
+
+    assert np.array_equal(
+        (game.neighbor_counts[WHITE_VALUE] - counts)[:3, :3],
+        np.array([[1, 1, 0], [1, 1, 0], [0, 0, 0]]),
+    )
+    assert np.sum(game.neighbor_counts[WHITE_VALUE] - counts) == 4
+
+    game.update_neighbor_counts((0, 0), WHITE_VALUE, -1)
+
+    assert np.array_equal(game.neighbor_counts[WHITE_VALUE], counts)
+
+
+def test_incremental_frontier(game, monkeypatch):
+    rescanned = Game()
+
+    # Playing only looks at the neighbours of the played cell
+    def get_frontier_cells():
+        raise AssertionError("the board was rescanned")
+
+    monkeypatch.setattr(game, "get_frontier_cells", get_frontier_cells)
+
+    for move in [(4, 5), (5, 3), (4, 2), (3, 2), (2, 4), (5, 5)]:
+        game.play_piece(move)
+
+        rescanned.set_position(game.board.copy(), game.player_value)
+
+        assert np.array_equal(
+            game.surrounding_cells, rescanned.surrounding_cells
+        )
+        assert (
+            game.get_black_empty_neighbors_count()
+            == rescanned.get_black_empty_neighbors_count()
+        )
+        assert (
+            game.get_white_empty_neighbors_count()
+            == rescanned.get_white_empty_neighbors_count()
+        )
+
+
 def test_update_sandwiches(game):
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "2,3": np.array([[3, 3]]),
-            "3,2": np.array([[3, 3]]),
-            "4,5": np.array([[4, 4]]),
-            "5,4": np.array([[4, 4]]),
+            19: np.array([27]),
+            26: np.array([27]),
+            37: np.array([36]),
+            44: np.array([36]),
         }
     )
 
@@ -683,10 +903,10 @@ def test_update_sandwiches(game):
 
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "2,4": np.array([[3, 4]]),
-            "3,5": np.array([[3, 4]]),
-            "4,2": np.array([[4, 3]]),
-            "5,3": np.array([[4, 3]]),
+            20: np.array([35]),
+            29: np.array([35]),
+            34: np.array([28]),
+            43: np.array([28]),
         }
     )
 
@@ -720,17 +940,17 @@ def test_update_sandwiches(game):
 
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "2,1": np.array([[3, 2], [4, 3]]),
-            "2,5": np.array([[3, 5], [4, 5]]),
-            "3,1": np.array([[3, 2]]),
-            "3,6": np.array([[3, 5], [4, 5]]),
-            "3,7": np.array([[4, 6]]),
-            "4,1": np.array([[3, 2]]),
-            "4,2": np.array([[3, 2]]),
-            "5,1": np.array([[5, 2], [5, 3]]),
-            "5,6": np.array([[4, 5]]),
-            "6,1": np.array([[5, 2], [4, 3]]),
-            "6,3": np.array([[5, 3], [4, 3]]),
+            17: np.array([19, 28]),
+            21: np.array([43, 44]),
+            25: np.array([19]),
+            30: np.array([43, 44]),
+            31: np.array([52]),
+            33: np.array([19]),
+            34: np.array([19]),
+            41: np.array([21, 29]),
+            46: np.array([44]),
+            49: np.array([21, 28]),
+            51: np.array([29, 28]),
         }
     )
 
@@ -739,17 +959,17 @@ def test_update_sandwiches(game):
 
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "1,1": np.array([[2, 2], [3, 3]]),
-            "1,2": np.array([[2, 2], [2, 3], [3, 4]]),
-            "1,3": np.array([[2, 3], [3, 3]]),
-            "1,4": np.array([[2, 3]]),
-            "2,4": np.array([[3, 4]]),
-            "2,5": np.array([[3, 4]]),
-            "5,6": np.array([[5, 5], [5, 4]]),
-            "6,3": np.array([[5, 4]]),
-            "6,4": np.array([[5, 4], [5, 5]]),
-            "6,5": np.array([[5, 5], [5, 4]]),
-            "6,6": np.array([[5, 5]]),
+            9: np.array([18, 27]),
+            10: np.array([18, 26, 35]),
+            11: np.array([26, 27]),
+            12: np.array([26]),
+            20: np.array([35]),
+            21: np.array([35]),
+            46: np.array([45, 37]),
+            51: np.array([37]),
+            52: np.array([37, 45]),
+            53: np.array([45, 37]),
+            54: np.array([45]),
         }
     )
 
@@ -897,6 +1117,30 @@ def test_flip_sandwiches(game):
     )
 
 
+def test_lazy_sandwiches(game):
+    game.play_piece((4, 5))
+
+    # Pass detection does not generate the sandwiches
+    assert game.si_player_value is None
+    assert game.is_player_able_to_play()
+    assert game.si_player_value is None
+
+    assert np.array_equal(
+        game.indicators,
+        np.array([(3, 5), (5, 3), (5, 5)]),
+    )
+    assert game.si_player_value == WHITE_VALUE
+
+    # Changing the player outdates the sandwiches
+    game.player_value = BLACK_VALUE
+
+    assert np.array_equal(
+        game.indicators,
+        np.array([(2, 2), (2, 3), (3, 2)]),
+    )
+    assert game.si_player_value == BLACK_VALUE
+
+
 def test_is_player_able_to_play(game):
     assert game.is_player_able_to_play()
 
@@ -1134,12 +1378,12 @@ def test_set_position(game):
     )
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "3,5": np.array([[4, 5]]),
-            "5,1": np.array([[4, 2]]),
-            "5,2": np.array([[4, 3]]),
-            "5,3": np.array([[4, 3]]),
-            "5,4": np.array([[4, 4]]),
-            "5,6": np.array([[4, 5]]),
+            29: np.array([44]),
+            41: np.array([20]),
+            42: np.array([28]),
+            43: np.array([28]),
+            44: np.array([36]),
+            46: np.array([44]),
         }
     )
     assert np.array_equal(
@@ -1194,13 +1438,13 @@ def test_set_position(game):
     )
     assert dict_to_str(game.sandwiches) == dict_to_str(
         {
-            "1,2": np.array([[2, 3], [3, 4]]),
-            "1,3": np.array([[2, 3], [3, 3]]),
-            "2,2": np.array([[3, 3]]),
-            "2,4": np.array([[3, 4], [3, 3]]),
-            "2,5": np.array([[3, 4]]),
-            "6,5": np.array([[5, 5]]),
-            "6,6": np.array([[5, 5]]),
+            10: np.array([26, 35]),
+            11: np.array([26, 27]),
+            18: np.array([27]),
+            20: np.array([35, 27]),
+            21: np.array([35]),
+            53: np.array([45]),
+            54: np.array([45]),
         }
     )
     assert np.array_equal(
@@ -1367,10 +1611,47 @@ def test_get_white_legal_moves_count(game):
     assert game.get_white_legal_moves_count() == 7
 
 
+def test_get_legal_moves(game):
+    board = game.board.copy()
+
+    assert np.array_equal(
+        game.get_legal_moves(WHITE_VALUE),
+        np.array([(2, 4), (3, 5), (4, 2), (5, 3)]),
+    )
+    assert game.get_legal_moves_count(BLACK_VALUE) == 4
+
+    # The game is left untouched
+    assert np.array_equal(game.board, board)
+    assert game.player_value == BLACK_VALUE
+    assert game.si_player_value is None
+
+
+def test_mobility_cache(game):
+    black_moves = game.get_legal_moves(BLACK_VALUE)
+    white_moves = game.get_legal_moves(WHITE_VALUE)
+
+    assert game.get_legal_moves(BLACK_VALUE) is black_moves
+    assert game.get_legal_moves(WHITE_VALUE) is white_moves
+
+    record = game.make_move((4, 5))
+
+    assert game.mobility_cache == {}
+    assert np.array_equal(
+        game.get_legal_moves(BLACK_VALUE),
+        np.array([(2, 2), (2, 3), (3, 2)]),
+    )
+
+    game.unmake_move(record)
+
+    assert game.get_legal_moves(BLACK_VALUE) is black_moves
+    assert game.get_legal_moves(WHITE_VALUE) is white_moves
+
+
 def test_get_black_empty_neighbors_count(game, rng):
     assert game.get_black_empty_neighbors_count() == 10
 
     game.board.fill(*rng.choice([BLACK_VALUE, WHITE_VALUE], 1))
+    game.update_surrounding_cells()
 
     assert game.get_black_empty_neighbors_count() == 0
 
@@ -1386,6 +1667,7 @@ def test_get_black_empty_neighbors_count(game, rng):
             [0, 0, 0, 0, 0, 0, 0, 0],
         ]
     )
+    game.update_surrounding_cells()
 
     assert game.get_black_empty_neighbors_count() == 14
 
@@ -1401,6 +1683,7 @@ def test_get_black_empty_neighbors_count(game, rng):
             [0, 0, 0, 0, 0, 0, 0, 0],
         ]
     )
+    game.update_surrounding_cells()
 
     assert game.get_black_empty_neighbors_count() == 0
 
@@ -1409,6 +1692,7 @@ def test_get_white_empty_neighbors_count(game, rng):
     assert game.get_white_empty_neighbors_count() == 10
 
     game.board.fill(*rng.choice([BLACK_VALUE, WHITE_VALUE], 1))
+    game.update_surrounding_cells()
 
     assert game.get_white_empty_neighbors_count() == 0
 
@@ -1424,6 +1708,7 @@ def test_get_white_empty_neighbors_count(game, rng):
             [0, 0, 0, 0, 0, 0, 0, 0],
         ]
     )
+    game.update_surrounding_cells()
 
     assert game.get_white_empty_neighbors_count() == 11
 
@@ -1439,5 +1724,6 @@ def test_get_white_empty_neighbors_count(game, rng):
             [0, 0, 0, 0, 0, 0, 0, 0],
         ]
     )
+    game.update_surrounding_cells()
 
     assert game.get_white_empty_neighbors_count() == 0
@@ -0,0 +1,176 @@
+from functools import partial
+
+import numpy as np
+import pytest
+
+from genetic.fitness import play_match
+from othellia.bitboard import BitboardGame
+from othellia.endgame import EndgameSolver
+from othellia.mcts import (
+    MCTS_NODE_COUNT,
+    NO_CHILD,
+    NODE_SIZE,
+    PASS_MOVE,
+    MonteCarloTree,
+    MonteCarloTreeSearch,
+    get_moves,
+    get_tree_size,
+    play,
+    playout,
+    think,
+)
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.transcripts import TRANSCRIPTS
+
+
+@pytest.fixture
+def game():
+    return BitboardGame()
+
+
+@pytest.fixture
+def tree():
+    return MonteCarloTree(8)
+
+
+@pytest.fixture
+def search():
+    return MonteCarloTreeSearch(MonteCarloTree(10_000), np.random.default_rng(0))
+
+
+def test_tree(tree):
+    assert tree.nbytes == 8 * NODE_SIZE
+    assert tree.node_count == 1
+    assert tree.first_children[0] == NO_CHILD
+
+    assert tree.expand(0, [3, 5, PASS_MOVE])
+    assert tree.node_count == 4
+    assert tree.first_children[0] == 1
+    assert tree.child_counts[0] == 3
+    assert list(tree.moves[1:4]) == [3, 5, PASS_MOVE]
+    assert list(tree.parents[1:4]) == [0, 0, 0]
+
+    # Children must fit in the tree
+    assert not tree.expand(1, [10, 11, 12, 13, 14])
+    assert tree.first_children[1] == NO_CHILD
+
+    tree.clear()
+    assert tree.node_count == 1
+
+
+def test_select_backpropagate(tree):
+    tree.expand(0, [3, 5])
+
+    # Unvisited children first
+    assert tree.select(0, 1.0) == 1
+    tree.backpropagate(1, 0.0)
+    assert tree.select(0, 1.0) == 2
+    tree.backpropagate(2, 1.0)
+
+    # The root is counted for the other player
+    assert tree.visits[0] == 2
+    assert tree.wins[0] == 1.0
+
+    # Without exploration, the best child
+    assert tree.select(0, 0.0) == 2
+
+
+def test_play_get_moves(game):
+    black, white = game.black, game.white
+
+    assert play(black, white, PASS_MOVE) == (white, black)
+    assert len(get_moves(black, white)) == 4
+
+    # Nobody can play
+    assert get_moves(2 ** 64 - 1, 0) == []
+    assert get_moves(0, 1) == []
+
+    # The player can only pass
+    assert get_moves(1 << 2, 1 << 0 | 1 << 1) == [PASS_MOVE]
+
+
+def test_playout(game):
+    rng = np.random.default_rng(0)
+
+    for _ in range(10):
+        score = playout(game.black, game.white, rng.random(60).tolist())
+        assert -64 <= score <= 64
+
+    # Over
+    assert playout(2 ** 64 - 1, 0, []) == 64
+
+
+def test_search(game, search):
+    move = search.search(game, playout_count=200)
+
+    assert game.is_move_legal(move)
+    assert search.playout_count == 200
+    assert search.tree.visits[0] == 200
+
+    # Every playout goes through a child of the root, expanded by the first one
+    first_child = search.tree.first_children[0]
+    child_count = search.tree.child_counts[0]
+    assert search.tree.visits[first_child:first_child + child_count].sum() == 200
+
+
+@pytest.mark.parametrize("move_count", [50, 54, 56])
+def test_search_endgame(search, move_count):
+    # Playouts find the moves winning the game, but not by the most discs
+    for transcript in TRANSCRIPTS[:3]:
+        game = BitboardGame()
+        game.load_transcript(transcript[: 2 * move_count])
+        player_value = game.player_value
+
+        _, best_score = EndgameSolver().solve_move(game)
+
+        game.play_piece(search.search(game, playout_count=2000))
+        if game.is_over:
+            score = player_value * (
+                game.get_black_piece_count() - game.get_white_piece_count()
+            )
+        else:
+            _, score = EndgameSolver().solve_move(game)
+            score *= player_value * game.player_value
+
+        assert np.sign(score) == np.sign(best_score)
+
+
+def test_full_tree(game):
+    search = MonteCarloTreeSearch(MonteCarloTree(50), np.random.default_rng(0))
+
+    assert game.is_move_legal(search.search(game, playout_count=100))
+    assert search.tree.node_count <= 50
+    assert search.tree.visits[0] == 100
+
+
+def test_think(game):
+    assert game.is_move_legal(think(game, playout_count=50))
+    assert game.is_move_legal(think(game, time_budget=0.1))
+
+    # A move is found whatever the budget
+    assert game.is_move_legal(think(game, time_budget=0))
+
+
+def test_get_tree_size(game):
+    assert get_tree_size(None, 1.0) == MCTS_NODE_COUNT
+    assert get_tree_size(10 ** 9, None) == MCTS_NODE_COUNT
+    assert get_tree_size(None, None) < MCTS_NODE_COUNT
+
+    # The playouts never fill the tree
+    for playout_count in (0, 1, 50):
+        tree = MonteCarloTree(get_tree_size(playout_count, None))
+        MonteCarloTreeSearch(tree).search(game, playout_count)
+
+        assert tree.node_count < tree.size
+
+
+def test_play_match():
+    engine = partial(think, playout_count=20)
+    chromosome = np.ones(6)
+
+    winner, transcript = play_match(
+        chromosome, chromosome, 1, engines={BLACK_VALUE: engine, WHITE_VALUE: engine}
+    )
+
+    assert winner in (BLACK_VALUE, WHITE_VALUE, 0)
+    assert len(transcript) >= 2 * 50
@@ -1,10 +1,22 @@
+import time
+
 import numpy as np
 import pytest
 
 from othellia.game import Game
-from othellia.minimax import minimax, think
+from othellia.minimax import (
+    LazySMP,
+    SearchTimeout,
+    create_executor,
+    negamax,
+    search_aspiration,
+    search_root,
+    think,
+)
+from othellia.move_ordering import MoveOrdering
 from othellia.static_evaluation import StaticEvaluation
-from settings.values import BLACK_VALUE
+from othellia.transposition import TranspositionTable
+from settings.values import BLACK_VALUE, WHITE_VALUE
 
 
 @pytest.fixture
@@ -17,25 +29,37 @@ def static_evaluation():
     return StaticEvaluation()
 
 
-def test_minimax_depth_zero(game, static_evaluation):
-    assert (
-        minimax(game, 0, -np.inf, np.inf, static_evaluation.coin_parity, True)
-        == 0
-    )
-    assert (
-        minimax(game, 0, -np.inf, np.inf, static_evaluation.coin_parity, False)
-        == 0
-    )
+def reference_minimax(game, depth, static_evaluation_func):
+    """Plain minimax without pruning, black maximizing and white minimizing."""
+    if depth == 0 or game.is_over:
+        return static_evaluation_func(game)
+
+    scores = []
+
+    for move in game.indicators.tolist():
+        record = game.make_move(move)
+        scores.append(reference_minimax(game, depth - 1, static_evaluation_func))
+        game.unmake_move(record)
+
+    return max(scores) if game.player_value == BLACK_VALUE else min(scores)
 
 
-def test_minimax(game, static_evaluation):
+def test_negamax_depth_zero(game, static_evaluation):
+    assert negamax(game, 0, -np.inf, np.inf, static_evaluation.coin_parity) == 0
+
+    game.play_piece((2, 3))
+
+    # Scores are from the point of view of the player to play
+    assert negamax(
+        game, 0, -np.inf, np.inf, static_evaluation.coin_parity
+    ) == pytest.approx(-60)
+
+
+def test_negamax(game, static_evaluation):
     depth = 3
 
-    assert minimax(
-        game, depth, -np.inf, np.inf, static_evaluation.coin_parity, True
-    ) == pytest.approx(42.85, rel=1e-3)
-    assert minimax(
-        game, depth, -np.inf, np.inf, static_evaluation.coin_parity, False
+    assert negamax(
+        game, depth, -np.inf, np.inf, static_evaluation.coin_parity
     ) == pytest.approx(42.85, rel=1e-3)
 
     game.set_position(
@@ -55,12 +79,72 @@ def test_minimax(game, static_evaluation):
         BLACK_VALUE,
     )
 
-    assert minimax(
-        game, depth, -np.inf, np.inf, static_evaluation.coin_parity, True
+    assert negamax(
+        game, depth, -np.inf, np.inf, static_evaluation.coin_parity
     ) == pytest.approx(38.46, rel=1e-3)
-    assert minimax(
-        game, depth, -np.inf, np.inf, static_evaluation.coin_parity, False
-    ) == pytest.approx(7.69, rel=1e-3)
+
+    game.next_player_turn()
+
+    assert negamax(
+        game, depth, -np.inf, np.inf, static_evaluation.coin_parity
+    ) == pytest.approx(53.85, rel=1e-3)
+
+
+def test_negamax_pass(game, static_evaluation):
+    # White playing h6 makes black pass
+    game.load_transcript(
+        "c4c5b6d3e3f5g5d6c2f2g1f4e6f6c7b5g7c6g3f7g6f3g2h8a4h4g4h5g8b4c3b2b3a2b1e8"
+        "h7f8h3"
+    )
+    assert game.player_value == WHITE_VALUE
+
+    record = game.make_move((7, 5))
+    assert game.player_value == WHITE_VALUE
+    game.unmake_move(record)
+
+    for depth in range(1, 5):
+        for static_evaluation_func in (
+            static_evaluation.coin_parity,
+            static_evaluation.evaluate,
+        ):
+            assert WHITE_VALUE * negamax(
+                game, depth, -np.inf, np.inf, static_evaluation_func
+            ) == pytest.approx(
+                reference_minimax(game, depth, static_evaluation_func)
+            )
+
+
+def test_negamax_transposition_table(game, static_evaluation):
+    transposition_table = TranspositionTable(1)
+    hits = []
+
+    for _ in range(2):
+        assert negamax(
+            game,
+            3,
+            -np.inf,
+            np.inf,
+            static_evaluation.coin_parity,
+            transposition_table,
+        ) == pytest.approx(42.85, rel=1e-3)
+
+        hits.append(transposition_table.hits)
+
+    # The second search is answered by the table
+    assert hits[1] == hits[0] + 1
+
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+    transposition_table.clear()
+
+    assert negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        static_evaluation.evaluate,
+        transposition_table,
+    ) == negamax(game, 4, -np.inf, np.inf, static_evaluation.evaluate)
+    assert transposition_table.hits > 0
 
 
 def test_think(game, static_evaluation):
@@ -96,5 +180,227 @@ def test_think(game, static_evaluation):
     )
     game.next_player_turn()
     assert np.array_equal(
-        think(game, depth, static_evaluation.coin_parity), (1, 4)
+        think(game, depth, static_evaluation.coin_parity), (1, 3)
     )
+
+
+def test_think_transposition_table(game, static_evaluation):
+    transposition_tables = {
+        BLACK_VALUE: TranspositionTable(1),
+        WHITE_VALUE: TranspositionTable(1),
+    }
+
+    # Same moves with a table kept between calls
+    for _ in range(10):
+        move = think(game, 2, static_evaluation.evaluate)
+
+        assert np.array_equal(
+            think(
+                game,
+                2,
+                static_evaluation.evaluate,
+                transposition_tables[game.player_value],
+            ),
+            move,
+        )
+
+        game.play_piece(move)
+
+
+def test_negamax_deadline(game, static_evaluation):
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+    board = game.board.copy()
+
+    with pytest.raises(SearchTimeout):
+        negamax(
+            game,
+            3,
+            -np.inf,
+            np.inf,
+            static_evaluation.evaluate,
+            deadline=time.perf_counter(),
+        )
+
+    # The moves played before the timeout are undone
+    assert np.array_equal(game.board, board)
+    assert game.player_value == BLACK_VALUE
+
+
+def test_search_root(game, static_evaluation):
+    move, score = search_root(
+        game, game.indicators, 3, static_evaluation.coin_parity
+    )
+
+    assert np.array_equal(move, (2, 3))
+    assert score == negamax(game, 4, -np.inf, np.inf, static_evaluation.coin_parity)
+
+    # Ties are broken by the order of the moves
+    move, _ = search_root(
+        game, game.indicators[::-1], 3, static_evaluation.coin_parity
+    )
+
+    assert np.array_equal(move, (5, 4))
+
+    # Scores outside of the window are bounds
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+    _, score = search_root(game, game.indicators, 2, static_evaluation.evaluate)
+
+    _, upper_bound = search_root(
+        game,
+        game.indicators,
+        2,
+        static_evaluation.evaluate,
+        alpha=score + 1,
+        beta=score + 2,
+    )
+    _, lower_bound = search_root(
+        game,
+        game.indicators,
+        2,
+        static_evaluation.evaluate,
+        alpha=score - 2,
+        beta=score - 1,
+    )
+
+    assert score <= upper_bound <= score + 1
+    assert score - 1 <= lower_bound <= score
+
+
+def test_principal_variation(game, static_evaluation):
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+
+    for depth in range(1, 5):
+        score = negamax(game, depth, -np.inf, np.inf, static_evaluation.evaluate)
+
+        assert negamax(
+            game,
+            depth,
+            -np.inf,
+            np.inf,
+            static_evaluation.evaluate,
+            principal_variation=True,
+        ) == pytest.approx(score)
+        assert negamax(
+            game,
+            depth,
+            -np.inf,
+            np.inf,
+            static_evaluation.evaluate,
+            TranspositionTable(1),
+            move_ordering=MoveOrdering(),
+            principal_variation=True,
+        ) == pytest.approx(score)
+
+
+def test_search_aspiration(game, static_evaluation):
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+    move, score = search_root(game, game.indicators, 2, static_evaluation.evaluate)
+
+    # Guesses far from the score are widened until they contain it
+    for guess in (score, score - 100, score + 100):
+        aspiration_move, aspiration_score = search_aspiration(
+            game, game.indicators, 2, static_evaluation.evaluate, guess
+        )
+
+        assert np.array_equal(aspiration_move, move)
+        assert aspiration_score == pytest.approx(score)
+
+
+def test_think_time_budget(game, static_evaluation):
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+
+    # The shallowest search completes whatever the budget
+    assert np.array_equal(
+        think(game, 60, static_evaluation.evaluate, time_budget=0),
+        think(game, 0, static_evaluation.evaluate),
+    )
+
+    start = time.perf_counter()
+    move = think(game, 60, static_evaluation.evaluate, time_budget=0.5)
+
+    assert time.perf_counter() - start < 1.5
+    assert game.is_move_legal(move)
+
+    # Searches stop at the end of the game
+    game.set_position(
+        np.array(
+            [
+                [1, 1, 1, 1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 1, 1, 1, 1],
+                [1, 1, 1, -1, -1, 1, 1, 1],
+                [1, 1, 1, -1, -1, 1, 1, 1],
+                [1, 1, 1, 1, 1, 1, 1, 1],
+                [1, 1, 1, 1, 1, 1, 1, 0],
+                [1, 1, 1, 1, 1, 1, 0, 0],
+            ]
+        ),
+        WHITE_VALUE,
+    )
+    start = time.perf_counter()
+
+    assert np.array_equal(
+        think(game, 60, static_evaluation.coin_parity, time_budget=100),
+        think(game, 2, static_evaluation.coin_parity),
+    )
+    assert time.perf_counter() - start < 1
+
+
+def test_parallel_search(game, static_evaluation):
+    with create_executor(2, transposition_table_mb=1) as executor:
+        for transcript in ("", "f5d6c3d3c4f4c5b3e2", "f5d6c3d3c4f4c5b3e2e3"):
+            game.reset_game()
+            game.load_transcript(transcript)
+
+            for depth in (1, 3):
+                move, score = search_root(
+                    game, game.indicators, depth, static_evaluation.evaluate
+                )
+                parallel_move, parallel_score = search_root(
+                    game,
+                    game.indicators,
+                    depth,
+                    static_evaluation.evaluate,
+                    executor=executor,
+                )
+
+                assert np.array_equal(parallel_move, move)
+                assert parallel_score == pytest.approx(score)
+
+        # Workers use the evaluation weights of the main process
+        evaluation_weights = static_evaluation.evaluation_weights
+        static_evaluation.set_evaluation_weights((1, 0, 0, 0, 0, 0))
+        try:
+            assert np.array_equal(
+                think(game, 2, static_evaluation.evaluate, executor=executor),
+                think(game, 2, static_evaluation.evaluate),
+            )
+        finally:
+            static_evaluation.set_evaluation_weights(evaluation_weights)
+
+        move = think(
+            game, 60, static_evaluation.evaluate, time_budget=0.5, executor=executor
+        )
+
+        assert game.is_move_legal(move)
+
+
+def test_lazy_smp(game, static_evaluation):
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+
+    with LazySMP(2, transposition_table_mb=1) as lazy_smp:
+        # Helpers never store deeper results than the main search needs, the move
+        # is the same as with a single process
+        assert np.array_equal(
+            lazy_smp.think(game, 3, static_evaluation.evaluate),
+            think(game, 3, static_evaluation.evaluate, TranspositionTable(1)),
+        )
+        assert len(lazy_smp.completed_depths) == 2
+
+        # Helpers stop with the main search
+        start = time.perf_counter()
+        move = lazy_smp.think(game, 60, static_evaluation.evaluate, time_budget=0.5)
+
+        assert time.perf_counter() - start < 1.5
+        assert game.is_move_legal(move)
+        assert not lazy_smp.stop_flag.value
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.minimax import negamax
+from othellia.move_ordering import MoveOrdering
+from othellia.static_evaluation import StaticEvaluation
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import cell_index_to_square
+
+
+@pytest.fixture
+def move_ordering():
+    return MoveOrdering()
+
+
+def test_square_weights(move_ordering):
+    assert move_ordering.square_weights[cell_index_to_square((0, 0))] == 4
+    assert move_ordering.square_weights[cell_index_to_square((1, 1))] == -4
+    assert move_ordering.square_weights[cell_index_to_square((2, 0))] == 2
+
+
+def test_order(move_ordering):
+    moves = np.array([(1, 1), (2, 3), (0, 7), (3, 2), (6, 0)])
+
+    # Corners first, X and C squares last
+    assert move_ordering.order(moves, 3, BLACK_VALUE) == [
+        (0, 7),
+        (2, 3),
+        (3, 2),
+        (6, 0),
+        (1, 1),
+    ]
+
+    # Transposition table move first
+    assert move_ordering.order(
+        moves, 3, BLACK_VALUE, cell_index_to_square((1, 1))
+    )[0] == (1, 1)
+
+
+def test_record_cutoff(move_ordering):
+    moves = np.array([(0, 7), (2, 3), (3, 2)])
+
+    move_ordering.record_cutoff((3, 2), 3, BLACK_VALUE)
+
+    # Killer moves come before the corners at the same depth only
+    assert move_ordering.order(moves, 3, BLACK_VALUE) == [(3, 2), (0, 7), (2, 3)]
+    assert move_ordering.order(moves, 2, BLACK_VALUE) == [(0, 7), (3, 2), (2, 3)]
+
+    # The history breaks ties, for the player who played the move only
+    assert move_ordering.order(moves, 2, WHITE_VALUE) == [(0, 7), (2, 3), (3, 2)]
+
+    move_ordering.record_cutoff((2, 3), 3, BLACK_VALUE)
+    move_ordering.record_cutoff((0, 7), 3, BLACK_VALUE)
+
+    assert move_ordering.killers[3] == [
+        cell_index_to_square((0, 7)),
+        cell_index_to_square((2, 3)),
+    ]
+
+    move_ordering.clear()
+
+    assert move_ordering.killers == {}
+
+
+def test_same_score():
+    game = BitboardGame()
+    game.load_transcript("f5d6c3d3c4f4c5b3e2e3")
+
+    for depth in range(1, 5):
+        assert negamax(
+            game,
+            depth,
+            -np.inf,
+            np.inf,
+            StaticEvaluation.evaluate,
+            move_ordering=MoveOrdering(),
+        ) == negamax(game, depth, -np.inf, np.inf, StaticEvaluation.evaluate)
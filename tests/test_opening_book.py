@@ -0,0 +1,127 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame, position_to_game
+from othellia.book_builder import build_book, get_book_positions
+from othellia.minimax import think
+from othellia.opening_book import BOOK_DTYPE, OpeningBook
+from othellia.search_statistics import SearchStatistics
+from othellia.static_evaluation import StaticEvaluation
+from utils.symmetry import SYMMETRY_COUNT, transform_board, transform_cell_index
+from utils.transcripts import FRONMARK_VS_BERG
+
+
+def get_moves(book):
+    # Scores are stored in single precision
+    return {key: (entry.move, entry.depth) for key, entry in book.entries.items()}
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 7])
+
+    return game
+
+
+@pytest.fixture
+def book():
+    return OpeningBook()
+
+
+def test_get_book_positions():
+    # Positions up to symmetry after 0, 1, 2, 3 and 4 moves
+    assert len(get_book_positions(0)) == 1
+    assert len(get_book_positions(1)) == 1 + 1
+    assert len(get_book_positions(4)) == 1 + 1 + 3 + 14 + 60
+
+
+def test_add_lookup(game, book):
+    move = tuple(int(value) for value in game.indicators[1])
+
+    assert book.lookup(game) is None
+
+    book.add(game, move, 4, 1.5)
+    assert book.lookup(game) == move
+    assert book.get_entry(game).depth == 4
+
+    # Symmetric positions share the entry
+    for symmetry in range(SYMMETRY_COUNT):
+        symmetric_game = BitboardGame()
+        symmetric_game.set_position(
+            transform_board(game.board, symmetry), game.player_value
+        )
+
+        assert book.lookup(symmetric_game) == transform_cell_index(move, symmetry)
+        assert symmetric_game.is_move_legal(book.lookup(symmetric_game))
+
+    assert len(book) == 1
+
+
+def test_save_load(game, book, tmp_path):
+    book.add(game, tuple(game.indicators[0]), 4, 1.5)
+    book.add(BitboardGame(), (2, 3), 5, -0.5)
+
+    path = str(tmp_path / "book.npy")
+    book.save(path)
+
+    # Records only, apart from the header
+    assert np.load(path).dtype == BOOK_DTYPE
+    assert BOOK_DTYPE.itemsize == 14
+
+    assert OpeningBook.load(path).entries == book.entries
+
+
+def test_build_book(book, tmp_path):
+    path = str(tmp_path / "book.npy")
+    func = StaticEvaluation().coin_parity
+
+    build_book(book, 1, 1, func, path=path)
+    assert len(book) == 2
+    assert get_moves(OpeningBook.load(path)) == get_moves(book)
+
+    # Book positions are the legal moves of the first positions
+    for position in get_book_positions(1):
+        game = position_to_game(position)
+        assert game.is_move_legal(book.lookup(game))
+
+    # Extending the book only searches the new positions, resuming from the file
+    resumed_book = OpeningBook.load(path)
+    entries = dict(resumed_book.entries)
+    build_book(resumed_book, 2, 1, func, path=path)
+
+    assert len(resumed_book) == 5
+    assert all(resumed_book.entries[key] == entry for key, entry in entries.items())
+
+    # Deeper searches replace the shallower ones
+    build_book(resumed_book, 2, 2, func)
+    assert all(entry.depth == 2 for entry in resumed_book.entries.values())
+
+
+def test_build_book_parallel(book):
+    func = StaticEvaluation().coin_parity
+    serial_book = OpeningBook()
+    build_book(serial_book, 2, 2, func)
+
+    with ProcessPoolExecutor(2) as executor:
+        build_book(book, 2, 2, func, executor)
+
+    assert book.entries == serial_book.entries
+
+
+def test_think(game, book):
+    # A legal move, not necessarily the best one
+    move = tuple(int(value) for value in game.indicators[-1])
+    book.add(game, move, 1, 0.0)
+
+    statistics = SearchStatistics()
+    func = StaticEvaluation().coin_parity
+
+    assert think(game, 3, func, opening_book=book, statistics=statistics) == move
+    assert statistics.node_count == 0
+
+    # Positions out of the book are searched
+    game.play_piece(move)
+    assert game.is_move_legal(think(game, 1, func, opening_book=book))
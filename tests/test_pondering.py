@@ -0,0 +1,99 @@
+import time
+
+import pytest
+
+from othellia.bitboard import BitboardGame, get_position
+from othellia.minimax import set_stop_flag, think
+from othellia.pondering import Ponderer
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.transcripts import FRONMARK_VS_BERG, KANAE_VS_HOSHIKAWA
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 20])
+
+    return game
+
+
+@pytest.fixture
+def ponderer():
+    ponderer = Ponderer(3, StaticEvaluation.evaluate, TranspositionTable(1), 0.2)
+    yield ponderer
+
+    ponderer.stop()
+    set_stop_flag(None)
+
+
+def test_get_likely_replies(game, ponderer):
+    replies = ponderer.get_likely_replies(game)
+
+    assert len(replies) == min(ponderer.reply_count, len(game.indicators))
+    assert all(game.is_move_legal(reply) for reply in replies)
+
+
+def test_ponder_hit(game, ponderer):
+    replies = ponderer.get_likely_replies(game)
+
+    ponderer.start(game)
+    ponderer.thread.join()
+
+    game.play_piece(replies[0])
+    move = ponderer.think(game)
+
+    assert ponderer.hits == 1
+    assert ponderer.misses == 0
+    assert game.is_move_legal(move)
+
+
+def test_ponder_miss(game, ponderer):
+    ponderer.reply_count = 1
+    replies = ponderer.get_likely_replies(game)
+    other_reply = next(
+        tuple(move) for move in game.indicators if tuple(move) != replies[0]
+    )
+
+    ponderer.start(game)
+    game.play_piece(other_reply)
+    move = ponderer.think(game)
+
+    assert ponderer.hits == 0
+    assert ponderer.misses == 1
+    assert game.is_move_legal(move)
+
+
+def test_ponder_game_over(ponderer, monkeypatch):
+    game = BitboardGame()
+    game.load_transcript(KANAE_VS_HOSHIKAWA[: 2 * 48])
+
+    # The first reply ends the game, the next ones do not
+    replies = [(6, 4), (7, 4), (7, 5)]
+    monkeypatch.setattr(ponderer, "get_likely_replies", lambda _: replies)
+
+    ponderer.ponder(get_position(game))
+
+    for reply in replies[1:]:
+        game_after_reply = BitboardGame()
+        game_after_reply.set_position(game.board, game.player_value)
+        game_after_reply.play_piece(reply)
+
+        assert get_position(game_after_reply) in ponderer.results
+
+
+def test_stop(game, ponderer):
+    ponderer.time_budget = 60
+    ponderer.depth = 60
+    ponderer.start(game)
+    time.sleep(0.1)
+
+    start = time.perf_counter()
+    ponderer.stop()
+
+    assert time.perf_counter() - start < 1
+    assert ponderer.thread is None
+    assert ponderer.results == {}
+
+    # Searches run normally once stopped
+    assert game.is_move_legal(think(game, 2, StaticEvaluation.evaluate))
@@ -0,0 +1,166 @@
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.minimax import negamax, search_probcut, think
+from othellia.probcut import (
+    PROBCUT_DEPTHS,
+    MultiProbCut,
+    ProbCutParameters,
+    get_phase,
+)
+from othellia.static_evaluation import StaticEvaluation
+from utils.transcripts import FRONMARK_VS_BERG
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 20])
+
+    return game
+
+
+@pytest.fixture
+def multi_probcut():
+    return MultiProbCut(
+        {
+            (phase, depth): ProbCutParameters(shallow_depth, 1.0, 0.0, 1.0)
+            for phase in range(4)
+            for depth, shallow_depth in PROBCUT_DEPTHS.items()
+        }
+    )
+
+
+class CountingEvaluation:
+    """Coin parity evaluation counting its calls."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, game):
+        self.count += 1
+        return StaticEvaluation().coin_parity(game)
+
+
+def test_get_phase():
+    assert get_phase(60) == 0
+    assert get_phase(45) == 1
+    assert get_phase(30) == 2
+    assert get_phase(0) == 3
+
+    # Games may end before the board is full, or start with more empty cells
+    assert get_phase(64) == 0
+
+
+def test_fit():
+    rng = np.random.default_rng(0)
+    shallow = rng.normal(0, 20, 200)
+
+    scores = np.zeros((200, max(PROBCUT_DEPTHS) + 1))
+    for depth, shallow_depth in PROBCUT_DEPTHS.items():
+        scores[:, shallow_depth] = shallow
+        scores[:, depth] = 2 * shallow + 3 + rng.normal(0, 1, 200)
+
+    multi_probcut = MultiProbCut()
+    multi_probcut.fit(scores, [40] * 100 + [10] * 100)
+
+    # Phases without positions have no regression
+    assert multi_probcut.get_parameters(3, 60) is None
+    assert multi_probcut.get_parameters(2, 40) is None
+
+    parameters = multi_probcut.get_parameters(4, 10)
+    assert parameters.shallow_depth == PROBCUT_DEPTHS[4]
+    assert parameters.slope == pytest.approx(2, abs=0.05)
+    assert parameters.intercept == pytest.approx(3, abs=0.3)
+    assert parameters.sigma == pytest.approx(1, abs=0.2)
+
+
+def test_save_load(multi_probcut, tmp_path):
+    path = str(tmp_path / "multi_probcut.csv")
+    multi_probcut.parameters[(2, 5)] = ProbCutParameters(1, 1.25, -0.5, 3.75)
+    multi_probcut.save(path)
+
+    loaded = MultiProbCut.load(path, threshold=2.0)
+
+    assert loaded.parameters == multi_probcut.parameters
+    assert loaded.threshold == 2.0
+
+
+def test_saved_parameters():
+    multi_probcut = MultiProbCut.load()
+
+    for (phase, depth), parameters in multi_probcut.parameters.items():
+        assert parameters.shallow_depth == PROBCUT_DEPTHS[depth]
+        assert parameters.sigma >= 0
+
+
+def test_search_probcut(game):
+    args = (StaticEvaluation.evaluate,)
+
+    # Predicted far above the window
+    parameters = ProbCutParameters(1, 1.0, 1000.0, 1.0)
+    assert search_probcut(game, parameters, 1.5, -10, 10, *args) == 10
+
+    # Predicted far below the window
+    parameters = ProbCutParameters(1, 1.0, -1000.0, 1.0)
+    assert search_probcut(game, parameters, 1.5, -10, 10, *args) == -10
+
+    # Too uncertain
+    parameters = ProbCutParameters(1, 1.0, 0.0, 1000.0)
+    assert search_probcut(game, parameters, 1.5, -10, 10, *args) is None
+
+    # Uncorrelated depths
+    parameters = ProbCutParameters(1, 0.0, 1000.0, 1.0)
+    assert search_probcut(game, parameters, 1.5, -10, 10, *args) is None
+
+    # Nothing to prune against
+    parameters = ProbCutParameters(1, 1.0, 1000.0, 1.0)
+    assert search_probcut(game, parameters, 1.5, -np.inf, np.inf, *args) is None
+
+
+def test_negamax(game, multi_probcut):
+    plain_evaluation = CountingEvaluation()
+    score = negamax(
+        game, 4, -np.inf, np.inf, plain_evaluation, principal_variation=True
+    )
+
+    # Without parameters, the search is unchanged
+    assert negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        CountingEvaluation(),
+        principal_variation=True,
+        multi_probcut=MultiProbCut(),
+    ) == score
+
+    probcut_evaluation = CountingEvaluation()
+    probcut_score = negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        probcut_evaluation,
+        principal_variation=True,
+        multi_probcut=multi_probcut,
+    )
+
+    assert probcut_evaluation.count < plain_evaluation.count
+    assert probcut_score == pytest.approx(score, abs=10)
+
+
+def test_think(game, multi_probcut):
+    assert game.is_move_legal(
+        think(game, 4, StaticEvaluation.evaluate, multi_probcut=multi_probcut)
+    )
+    assert game.is_move_legal(
+        think(
+            game,
+            6,
+            StaticEvaluation.evaluate,
+            time_budget=0.5,
+            multi_probcut=MultiProbCut.load(),
+        )
+    )
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.minimax import negamax, think
+from othellia.move_ordering import MoveOrdering
+from othellia.reductions import LMR_REDUCTIONS, LateMoveReductions
+from othellia.static_evaluation import StaticEvaluation
+from utils.transcripts import FRONMARK_VS_BERG
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 20])
+
+    return game
+
+
+class CountingEvaluation:
+    """Coin parity evaluation counting its calls."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, game):
+        self.count += 1
+        return StaticEvaluation().coin_parity(game)
+
+
+def test_get_reduction():
+    late_move_reductions = LateMoveReductions({3: (0, 1), 5: (0, 0, 2)})
+
+    # The first moves and shallow nodes are not reduced
+    assert late_move_reductions.get_reduction(6, 0) == 0
+    assert late_move_reductions.get_reduction(2, 10) == 0
+
+    assert late_move_reductions.get_reduction(3, 1) == 1
+    assert late_move_reductions.get_reduction(3, 10) == 1
+
+    # Depths missing from the table are not reduced
+    assert late_move_reductions.get_reduction(4, 10) == 0
+
+    # The last row applies to deeper nodes
+    assert late_move_reductions.get_reduction(5, 1) == 0
+    assert late_move_reductions.get_reduction(8, 2) == 2
+
+    # The leaves are always searched
+    assert LateMoveReductions({2: (0, 5)}).get_reduction(2, 1) == 1
+
+
+def test_default_reductions():
+    late_move_reductions = LateMoveReductions()
+
+    assert late_move_reductions.reductions == LMR_REDUCTIONS
+    assert LateMoveReductions({}).get_reduction(10, 10) == 0
+
+
+def test_negamax(game):
+    plain_evaluation = CountingEvaluation()
+    score = negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        plain_evaluation,
+        move_ordering=MoveOrdering(),
+        principal_variation=True,
+    )
+
+    # Without reductions, the search is unchanged
+    assert negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        CountingEvaluation(),
+        move_ordering=MoveOrdering(),
+        principal_variation=True,
+        late_move_reductions=LateMoveReductions({}),
+    ) == score
+
+    reduced_evaluation = CountingEvaluation()
+    reduced_score = negamax(
+        game,
+        4,
+        -np.inf,
+        np.inf,
+        reduced_evaluation,
+        move_ordering=MoveOrdering(),
+        principal_variation=True,
+        late_move_reductions=LateMoveReductions({3: (0, 0, 2)}),
+    )
+
+    # The score is approximate, but still a coin parity
+    assert reduced_evaluation.count < plain_evaluation.count
+    assert -100 <= reduced_score <= 100
+
+
+def test_think(game):
+    assert game.is_move_legal(
+        think(
+            game,
+            4,
+            StaticEvaluation.evaluate,
+            late_move_reductions=LateMoveReductions(),
+        )
+    )
@@ -0,0 +1,113 @@
+import io
+import json
+
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.minimax import think
+from othellia.search_statistics import SearchStatistics
+from othellia.static_evaluation import StaticEvaluation
+from othellia.transposition import TranspositionTable
+from utils.transcripts import FRONMARK_VS_BERG
+
+
+@pytest.fixture
+def game():
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 20])
+
+    return game
+
+
+@pytest.fixture
+def statistics():
+    return SearchStatistics()
+
+
+def test_think(game, statistics):
+    func = StaticEvaluation().coin_parity
+    move = think(game, 3, func, TranspositionTable(1), statistics=statistics)
+
+    # Counting leaves the search unchanged
+    assert tuple(move) == tuple(think(game, 3, func, TranspositionTable(1)))
+
+    assert statistics.node_count > 0
+    assert 0 < statistics.evaluation_count <= statistics.node_count
+    assert 0 < sum(statistics.cutoff_counts) < statistics.node_count
+    assert statistics.cutoff_counts[0] == max(statistics.cutoff_counts)
+
+    # Every node probes the table
+    assert statistics.transposition_probes == statistics.node_count
+    assert 0 <= statistics.transposition_hits <= statistics.transposition_probes
+
+    assert 0 < statistics.evaluation_time < statistics.elapsed_time
+    assert 0 < statistics.move_generation_time < statistics.elapsed_time
+    assert statistics.nodes_per_second > 0
+    assert statistics.iteration_node_counts == {3: statistics.node_count}
+
+    # The children of the root are searched 3 plies deep
+    node_counts = statistics.depth_node_counts
+    assert list(node_counts) == [3, 2, 1, 0]
+    assert sum(node_counts.values()) == statistics.node_count
+
+    # A single iteration, the factors are between plies
+    factors = statistics.effective_branching_factors
+    assert list(factors) == [2, 3, 4]
+    assert factors[4] == node_counts[0] / node_counts[1]
+
+
+def test_iterative_deepening(game, statistics):
+    func = StaticEvaluation().coin_parity
+    think(game, 4, func, time_budget=60, statistics=statistics)
+
+    node_counts = statistics.iteration_node_counts
+    assert list(node_counts) == [0, 1, 2, 3, 4]
+    assert sum(node_counts.values()) == statistics.node_count
+
+    factors = statistics.effective_branching_factors
+    assert list(factors) == [1, 2, 3, 4]
+    assert factors[4] == node_counts[4] / node_counts[3]
+
+
+def test_endgame(statistics):
+    game = BitboardGame()
+    game.load_transcript(FRONMARK_VS_BERG[: 2 * 50])
+
+    think(
+        game,
+        3,
+        StaticEvaluation().coin_parity,
+        endgame_empties=14,
+        statistics=statistics,
+    )
+
+    # The solver does not evaluate positions
+    assert statistics.node_count > 0
+    assert statistics.evaluation_count == 0
+
+
+def test_reset(game, statistics):
+    func = StaticEvaluation().coin_parity
+
+    think(game, 3, func, statistics=statistics)
+    node_count = statistics.node_count
+
+    think(game, 3, func, statistics=statistics)
+    assert statistics.node_count == node_count
+    assert statistics.transposition_probes == 0
+
+
+def test_json(game):
+    json_file = io.StringIO()
+    statistics = SearchStatistics(json_file)
+
+    think(game, 2, StaticEvaluation().coin_parity, statistics=statistics)
+    think(game, 3, StaticEvaluation().coin_parity, statistics=statistics)
+
+    lines = json_file.getvalue().splitlines()
+    assert len(lines) == 2
+    assert json.loads(lines[1]) == json.loads(statistics.to_json())
+
+    data = json.loads(lines[0])
+    assert data["iteration_nodes"] == {"2": data["nodes"]}
+    assert data["cutoffs"][-1] > 0
@@ -0,0 +1,167 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from othellia.transposition import (
+    ENTRY_SIZE,
+    EXACT,
+    LOWER_BOUND,
+    NO_MOVE,
+    SHARED_ENTRY_SIZE,
+    UPPER_BOUND,
+    SharedTranspositionTable,
+    TranspositionTable,
+    TTEntry,
+)
+
+
+@pytest.fixture(params=[TranspositionTable, SharedTranspositionTable])
+def transposition_table(request):
+    transposition_table = request.param(1)
+
+    yield transposition_table
+
+    if isinstance(transposition_table, SharedTranspositionTable):
+        transposition_table.close()
+        transposition_table.unlink()
+
+
+@pytest.fixture
+def shared_transposition_table():
+    transposition_table = SharedTranspositionTable(1)
+
+    yield transposition_table
+
+    transposition_table.close()
+    transposition_table.unlink()
+
+
+def store_in_shared_table(name, zobrist_hash):
+    """Store an entry in a shared table from another process."""
+    transposition_table = SharedTranspositionTable(1, name)
+    transposition_table.store(zobrist_hash, 4, -2.5, UPPER_BOUND, 63)
+    transposition_table.close()
+
+
+def test_size(shared_transposition_table):
+    transposition_table = TranspositionTable(1)
+
+    assert transposition_table.size * ENTRY_SIZE <= 2 ** 20
+    assert transposition_table.size * ENTRY_SIZE > 2 ** 19
+    assert TranspositionTable(0).size == 2
+
+    assert shared_transposition_table.size * SHARED_ENTRY_SIZE <= 2 ** 20
+    assert shared_transposition_table.size * SHARED_ENTRY_SIZE > 2 ** 19
+
+
+def test_probe(transposition_table):
+    assert transposition_table.probe(42) is None
+
+    transposition_table.store(42, 3, 12.5, LOWER_BOUND, 27)
+
+    assert transposition_table.probe(42) == TTEntry(3, 12.5, LOWER_BOUND, 27)
+    assert transposition_table.probe(2 ** 64 - 1) is None
+
+    assert transposition_table.hits == 1
+    assert transposition_table.misses == 2
+    assert transposition_table.collisions == 0
+
+
+def test_collisions(transposition_table):
+    # Same bucket, different positions
+    key = 7
+    other_key = key + (transposition_table.bucket_mask + 1)
+
+    transposition_table.store(key, 1, 0, EXACT)
+
+    assert transposition_table.probe(other_key) is None
+    assert transposition_table.collisions == 1
+
+
+def test_replacement(transposition_table):
+    bucket_size = transposition_table.bucket_mask + 1
+    deep_key, shallow_key, latest_key = 5, 5 + bucket_size, 5 + 2 * bucket_size
+
+    transposition_table.store(deep_key, 6, 1, EXACT)
+    transposition_table.store(shallow_key, 2, 2, UPPER_BOUND)
+
+    # The deepest search is kept, the always-replace slot takes the latest one
+    transposition_table.store(latest_key, 1, 3, EXACT)
+
+    assert transposition_table.probe(deep_key) == TTEntry(6, 1, EXACT, NO_MOVE)
+    assert transposition_table.probe(shallow_key) is None
+    assert transposition_table.probe(latest_key) == TTEntry(1, 3, EXACT, NO_MOVE)
+
+    # A search at least as deep replaces the deepest one
+    transposition_table.store(shallow_key, 6, 2, UPPER_BOUND)
+
+    assert transposition_table.probe(deep_key) is None
+    assert transposition_table.probe(shallow_key) == TTEntry(
+        6, 2, UPPER_BOUND, NO_MOVE
+    )
+
+
+def test_clear(transposition_table):
+    transposition_table.store(42, 3, 12.5, EXACT)
+    transposition_table.probe(42)
+
+    transposition_table.clear()
+
+    assert transposition_table.hits == 0
+    assert transposition_table.probe(42) is None
+
+
+def test_shared_table(shared_transposition_table):
+    zobrist_hash = 2 ** 64 - 12345
+
+    with ProcessPoolExecutor(1) as executor:
+        executor.submit(
+            store_in_shared_table, shared_transposition_table.name, zobrist_hash
+        ).result()
+
+    assert shared_transposition_table.probe(zobrist_hash) == TTEntry(
+        4, -2.5, UPPER_BOUND, 63
+    )
+
+    # An entry half overwritten by another position fails the check
+    other_hash = zobrist_hash ^ 2 ** 40
+    shared_transposition_table.store(other_hash, 4, 7.0, EXACT)
+    slot = shared_transposition_table.get_slot_index(zobrist_hash)
+    shared_transposition_table.entries[slot, 0] ^= other_hash ^ zobrist_hash
+    shared_transposition_table.scores[slot] = -2.5
+
+    assert shared_transposition_table.probe(zobrist_hash) is None
+
+
+class RacingScores:
+    """Score array another process writes to right after each write."""
+
+    def __init__(self, scores, racing_score):
+        self.scores = scores
+        self.racing_score = racing_score
+
+    def __getitem__(self, slot):
+        return self.scores[slot]
+
+    def __setitem__(self, slot, score):
+        self.scores[slot] = score
+        self.scores[slot] = self.racing_score
+
+
+def test_shared_table_score_overwritten(shared_transposition_table):
+    zobrist_hash = 2 ** 64 - 12345
+    slot = shared_transposition_table.get_slot_index(zobrist_hash)
+
+    # Score of another position written over the entry after the store
+    shared_transposition_table.store(zobrist_hash, 4, -2.5, UPPER_BOUND, 63)
+    shared_transposition_table.scores[slot] = 7.0
+
+    assert shared_transposition_table.probe(zobrist_hash) is None
+
+    # Score of another position written during the store
+    scores = shared_transposition_table.scores
+    shared_transposition_table.scores = RacingScores(scores, 7.0)
+    shared_transposition_table.store(zobrist_hash, 4, -2.5, UPPER_BOUND, 63)
+    shared_transposition_table.scores = scores
+
+    assert shared_transposition_table.probe(zobrist_hash) is None
@@ -1,4 +1,9 @@
-from utils.game import cell_index_to_notation, notation_to_cell_index
+from utils.game import (
+    cell_index_to_notation,
+    cell_index_to_square,
+    notation_to_cell_index,
+    square_to_cell_index,
+)
 
 
 def test_notation_to_cell_index():
@@ -17,3 +22,19 @@ def test_cell_index_to_notation():
     assert cell_index_to_notation((7, 7)) == "h8"
     assert cell_index_to_notation((3, 3)) == "d4"
     assert cell_index_to_notation((6, 1)) == "g2"
+
+
+def test_cell_index_to_square():
+    assert cell_index_to_square((0, 0)) == 0
+    assert cell_index_to_square((0, 7)) == 7
+    assert cell_index_to_square((7, 0)) == 56
+    assert cell_index_to_square((7, 7)) == 63
+    assert cell_index_to_square((3, 4)) == 28
+
+
+def test_square_to_cell_index():
+    assert square_to_cell_index(0) == (0, 0)
+    assert square_to_cell_index(7) == (0, 7)
+    assert square_to_cell_index(56) == (7, 0)
+    assert square_to_cell_index(63) == (7, 7)
+    assert square_to_cell_index(28) == (3, 4)
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from othellia.bitboard import BitboardGame
+from othellia.game import Game
+from othellia.zobrist import compute_hash
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.symmetry import (
+    SYMMETRY_COUNT,
+    canonical_hash,
+    canonicalize,
+    get_board_symmetries,
+    inverse_transform_cell_index,
+    remove_symmetric_moves,
+    transform_board,
+    transform_cell_index,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng()
+
+
+def test_transform_board(rng):
+    board = rng.choice([BLACK_VALUE, 0, WHITE_VALUE], (8, 8))
+    transformed = [transform_board(board, symmetry).tobytes() for symmetry in range(8)]
+
+    # A random board has 8 different images
+    assert len(set(transformed)) == SYMMETRY_COUNT
+    assert np.array_equal(transform_board(board, 0), board)
+
+
+def test_transform_cell_index():
+    for symmetry in range(SYMMETRY_COUNT):
+        for col in range(8):
+            for row in range(8):
+                board = np.zeros((8, 8), dtype=int)
+                board[row, col] = BLACK_VALUE
+
+                new_col, new_row = transform_cell_index((col, row), symmetry)
+
+                assert transform_board(board, symmetry)[new_row, new_col] == BLACK_VALUE
+                assert inverse_transform_cell_index(
+                    (new_col, new_row), symmetry
+                ) == (col, row)
+
+    # Corners stay corners
+    assert transform_cell_index((0, 0), 1) in [(0, 7), (7, 0)]
+
+
+def test_canonicalize(rng):
+    board = rng.choice([BLACK_VALUE, 0, WHITE_VALUE], (8, 8))
+    canonical_board, symmetry = canonicalize(board)
+
+    assert np.array_equal(transform_board(board, symmetry), canonical_board)
+
+    for other_symmetry in range(SYMMETRY_COUNT):
+        other_board = transform_board(board, other_symmetry)
+
+        assert np.array_equal(canonicalize(other_board)[0], canonical_board)
+        assert canonical_hash(other_board, WHITE_VALUE) == canonical_hash(
+            board, WHITE_VALUE
+        )
+
+    assert canonical_hash(board, WHITE_VALUE) == compute_hash(
+        canonical_board, WHITE_VALUE
+    )
+    assert canonical_hash(board, WHITE_VALUE) != canonical_hash(board, BLACK_VALUE)
+
+
+def test_first_moves_are_symmetric():
+    hashes = set()
+
+    for move in Game().indicators.tolist():
+        game = BitboardGame()
+        game.play_piece(tuple(move))
+
+        hashes.add(canonical_hash(game.board, game.player_value))
+
+    assert len(hashes) == 1
+
+
+def test_get_board_symmetries(rng):
+    # Initial position: half turn and both diagonal reflections
+    assert len(get_board_symmetries(Game().board)) == 3
+
+    board = rng.choice([BLACK_VALUE, WHITE_VALUE], (8, 8))
+    board[0, 0] = BLACK_VALUE
+    board[0, 7] = WHITE_VALUE
+
+    assert get_board_symmetries(board) == []
+
+
+def test_remove_symmetric_moves():
+    game = Game()
+
+    assert np.array_equal(
+        remove_symmetric_moves(game.board, game.indicators), np.array([(2, 3)])
+    )
+
+    game.play_piece((2, 3))
+
+    assert np.array_equal(
+        remove_symmetric_moves(game.board, game.indicators), game.indicators
+    )
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+
+from othellia.bitboard import array_to_bitboard
+from othellia.zobrist import (
+    FLIP_BYTE_KEYS,
+    FLIP_KEYS,
+    PIECE_KEYS,
+    SIDE_KEY,
+    compute_bitboard_hash,
+    compute_hash,
+    hash_bitboard,
+)
+from settings.values import BLACK_VALUE, WHITE_VALUE
+from utils.game import cell_index_to_square
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng()
+
+
+def test_keys():
+    keys = PIECE_KEYS[BLACK_VALUE] + PIECE_KEYS[WHITE_VALUE] + (SIDE_KEY,)
+
+    assert len(set(keys)) == 129
+    assert all(0 <= key < 2 ** 64 for key in keys)
+
+
+def test_hash_bitboard(rng):
+    squares = rng.choice(64, 10, replace=False).tolist()
+    bitboard = sum(1 << square for square in squares)
+
+    expected = 0
+    for square in squares:
+        expected ^= FLIP_KEYS[square]
+
+    assert hash_bitboard(0, FLIP_BYTE_KEYS) == 0
+    assert hash_bitboard(bitboard, FLIP_BYTE_KEYS) == expected
+
+
+def test_compute_hash(rng):
+    board = np.zeros((8, 8), dtype=int)
+    board[2, 5] = BLACK_VALUE
+
+    assert compute_hash(board, BLACK_VALUE) == PIECE_KEYS[BLACK_VALUE][
+        cell_index_to_square((5, 2))
+    ]
+    assert compute_hash(board, WHITE_VALUE) == compute_hash(
+        board, BLACK_VALUE
+    ) ^ SIDE_KEY
+
+    board = rng.choice([BLACK_VALUE, 0, WHITE_VALUE], (8, 8))
+
+    assert compute_hash(board, WHITE_VALUE) == compute_bitboard_hash(
+        array_to_bitboard(board, BLACK_VALUE),
+        array_to_bitboard(board, WHITE_VALUE),
+        WHITE_VALUE,
+    )
@@ -24,3 +24,34 @@ def cell_index_to_notation(cell_index: tuple[int, int]) -> str:
     row, col = cell_index
 
     return f"{chr(97 + row)}{col + 1}"
+
+
+def cell_index_to_square(cell_index: tuple[int, int]) -> int:
+    """Convert a cell column and row index into a square index.
+
+    Squares are numbered column by column, so that sorting squares gives the same
+    order as sorting cell indices.
+
+    Args:
+        cell_index (tuple[int, int]): column and row of the cell.
+
+    Returns:
+        int: square index, between 0 and 63.
+    """
+    col, row = cell_index
+
+    return int(col) * 8 + int(row)
+
+
+def square_to_cell_index(square: int) -> tuple[int, int]:
+    """Convert a square index into the corresponding column and row index.
+
+    Args:
+        square (int): square index, between 0 and 63.
+
+    Returns:
+        tuple[int, int]: column and row of the cell.
+    """
+    col, row = divmod(square, 8)
+
+    return col, row
@@ -0,0 +1,197 @@
+from typing import Any
+
+import numpy as np
+from numpy import ndarray, dtype
+
+from othellia.zobrist import compute_hash
+from settings.board import BOARD_CELL_LENGTH
+
+# Symmetries of the board (D4 group): 0 to 3 are rotations by a quarter turn, 4 to
+# 7 are the same rotations applied to the transposed board
+SYMMETRY_COUNT: int = 8
+
+
+def transform_board(
+        board: ndarray[Any, dtype[Any]], symmetry: int
+) -> ndarray[Any, dtype[Any]]:
+    """Apply a symmetry to a board position.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+        symmetry (int): index of the symmetry, between 0 and 7.
+
+    Returns:
+        ndarray[Any, dtype[Any]]: transformed board position.
+    """
+    board = np.asarray(board)
+
+    if symmetry >= 4:
+        board = board.T
+
+    return np.rot90(board, symmetry % 4)
+
+
+def compute_cell_transforms() -> tuple[
+    tuple[tuple[tuple[int, int], ...], ...], tuple[tuple[tuple[int, int], ...], ...]
+]:
+    """Find where each cell goes with each symmetry, and back.
+
+    Returns:
+        tuple[tuple[tuple[tuple[int, int], ...], ...], tuple[tuple[tuple[int, int],
+        ...], ...]]: transformed and inverse transformed column and row of each
+        cell, indexed by symmetry, then flat board index of the cell.
+    """
+    flat_indices = np.arange(BOARD_CELL_LENGTH ** 2).reshape(
+        BOARD_CELL_LENGTH, BOARD_CELL_LENGTH
+    )
+    transforms = []
+    inverse_transforms = []
+
+    for symmetry in range(SYMMETRY_COUNT):
+        transformed = transform_board(flat_indices, symmetry)
+
+        transform: list[tuple[int, int]] = [(0, 0)] * BOARD_CELL_LENGTH ** 2
+        inverse_transform: list[tuple[int, int]] = [(0, 0)] * BOARD_CELL_LENGTH ** 2
+
+        for row in range(BOARD_CELL_LENGTH):
+            for col in range(BOARD_CELL_LENGTH):
+                # The cell now at (col, row) came from this flat index
+                source_row, source_col = divmod(
+                    int(transformed[row, col]), BOARD_CELL_LENGTH
+                )
+
+                transform[int(transformed[row, col])] = (col, row)
+                inverse_transform[row * BOARD_CELL_LENGTH + col] = (
+                    source_col,
+                    source_row,
+                )
+
+        transforms.append(tuple(transform))
+        inverse_transforms.append(tuple(inverse_transform))
+
+    return tuple(transforms), tuple(inverse_transforms)
+
+
+CELL_TRANSFORMS, INVERSE_CELL_TRANSFORMS = compute_cell_transforms()
+
+
+def transform_cell_index(cell_index: tuple[int, int], symmetry: int) -> tuple[int, int]:
+    """Move a cell with a symmetry, as done by `transform_board()`.
+
+    Args:
+        cell_index (tuple[int, int]): column and row of the cell.
+        symmetry (int): index of the symmetry, between 0 and 7.
+
+    Returns:
+        tuple[int, int]: column and row of the transformed cell.
+    """
+    col, row = cell_index
+
+    return CELL_TRANSFORMS[symmetry][int(row) * BOARD_CELL_LENGTH + int(col)]
+
+
+def inverse_transform_cell_index(
+        cell_index: tuple[int, int], symmetry: int
+) -> tuple[int, int]:
+    """Move a cell of a transformed board back to the original board, e.g. to play a
+    move found on a canonical board.
+
+    Args:
+        cell_index (tuple[int, int]): column and row of the cell on the transformed
+        board.
+        symmetry (int): index of the symmetry used to transform the board.
+
+    Returns:
+        tuple[int, int]: column and row of the cell on the original board.
+    """
+    col, row = cell_index
+
+    return INVERSE_CELL_TRANSFORMS[symmetry][int(row) * BOARD_CELL_LENGTH + int(col)]
+
+
+def canonicalize(
+        board: ndarray[Any, dtype[Any]],
+) -> tuple[ndarray[Any, dtype[Any]], int]:
+    """Return the canonical form of a board position, the same for all the positions
+    of its symmetry class.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+
+    Returns:
+        tuple[ndarray[Any, dtype[Any]], int]: canonical board position and index of
+        the symmetry transforming the board into it.
+    """
+    symmetry = min(
+        range(SYMMETRY_COUNT),
+        key=lambda s: transform_board(board, s).tobytes(),
+    )
+
+    return transform_board(board, symmetry), symmetry
+
+
+def canonical_hash(board: ndarray[Any, dtype[Any]], player_value: int) -> int:
+    """Return the Zobrist hash of the canonical form of a board position, the same
+    for all the positions of its symmetry class.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+        player_value (int): value of the player to play.
+
+    Returns:
+        int: 64-bit symmetry invariant hash of the position.
+    """
+    canonical_board, _ = canonicalize(board)
+
+    return compute_hash(canonical_board, player_value)
+
+
+def get_board_symmetries(board: ndarray[Any, dtype[Any]]) -> list[int]:
+    """Return the symmetries leaving a board position unchanged, apart from the
+    identity.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+
+    Returns:
+        list[int]: indices of the symmetries.
+    """
+    return [
+        symmetry
+        for symmetry in range(1, SYMMETRY_COUNT)
+        if np.array_equal(transform_board(board, symmetry), board)
+    ]
+
+
+def remove_symmetric_moves(
+        board: ndarray[Any, dtype[Any]], moves: ndarray[Any, dtype[Any]]
+) -> ndarray[Any, dtype[Any]]:
+    """Keep a single move among the moves leading to symmetric positions.
+
+    The first move of each symmetry class is kept, so that searching the remaining
+    moves gives the same best move.
+
+    Args:
+        board (ndarray[Any, dtype[Any]]): a board position.
+        moves (ndarray[Any, dtype[Any]]): column and row of the legal moves.
+
+    Returns:
+        ndarray[Any, dtype[Any]]: column and row of the kept moves.
+    """
+    symmetries = get_board_symmetries(board)
+
+    if len(symmetries) == 0:
+        return moves
+
+    kept: list[tuple[int, int]] = []
+
+    for col, row in moves.tolist():
+        if any(
+            transform_cell_index((col, row), symmetry) in kept
+            for symmetry in symmetries
+        ):
+            continue
+
+        kept.append((col, row))
+
+    return np.array(kept)